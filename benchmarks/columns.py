@@ -0,0 +1,53 @@
+"""Compare walking the intervals of a large list of events with their columns.
+
+Run from the repository root with `python -m benchmarks.columns`. Computes the energy of the
+power limits of all events, once by walking the intervals in Python and once with the columns.
+The columns are NumPy arrays when NumPy is installed, and `array.array` otherwise.
+"""
+
+from benchmarks.json_codec import EVENTS, INTERVALS, create_events, measure
+from toadr3 import JsonCodec
+from toadr3._internal import ListAdapter
+from toadr3.models import Event, IntervalColumns, columns, events_to_columns
+
+PAYLOAD_TYPE = "CONSUMPTION_POWER_LIMIT"
+
+
+def walk_energy(events: list[Event]) -> float:
+    """Sum the power limits multiplied by their durations by walking the intervals."""
+    energy = 0.0
+    for event in events:
+        period = event.interval_period
+        for interval in event.intervals:
+            duration = (interval.interval_period or period).duration.total_seconds()  # type: ignore[union-attr]
+            for payload in interval.payloads:
+                if payload.type == PAYLOAD_TYPE:
+                    energy += payload.values[0] * duration  # type: ignore[operator]
+    return energy
+
+
+def columns_energy(data: IntervalColumns) -> float:
+    """Sum the power limits multiplied by their durations using the columns."""
+    values = data.values[PAYLOAD_TYPE]
+    if columns.np is not None:
+        return float(values @ data.durations)
+    return sum(value * duration for value, duration in zip(values, data.durations, strict=True))
+
+
+def main() -> None:
+    """Run the benchmark."""
+    events = ListAdapter(Event).validate_json(JsonCodec().dumps(create_events()))
+    data = events_to_columns(events)
+    backend = "numpy" if columns.np is not None else "array"
+    print(f"{EVENTS} events with {INTERVALS} intervals, columns using {backend}\n")
+
+    if walk_energy(events) != columns_energy(data):
+        raise RuntimeError("the columns give a different energy")
+
+    measure("walk the intervals", lambda: walk_energy(events))
+    measure("convert to columns", lambda: events_to_columns(events))
+    measure("compute with the columns", lambda: columns_energy(data))
+
+
+if __name__ == "__main__":
+    main()
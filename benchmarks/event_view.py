@@ -0,0 +1,55 @@
+"""Compare the memory of events kept as pydantic models and as `EventView`.
+
+Run from the repository root with `python -m benchmarks.event_view`. Reports the bytes per event
+allocated by the events, including their intervals, at different numbers of intervals per event.
+"""
+
+import gc
+import tracemalloc
+from collections.abc import Callable
+
+from benchmarks.json_codec import create_events
+from toadr3 import JsonCodec
+from toadr3._internal import ListAdapter
+from toadr3.models import Event, EventView
+
+EVENTS = 1000
+INTERVAL_COUNTS = (1, 24, 96, 288)
+
+
+def bytes_per_event(create: Callable[[], list[object]]) -> float:
+    """Get the bytes per event still allocated after creating a list of events."""
+    gc.collect()
+    tracemalloc.start()
+    events = create()
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size / len(events)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    adapter = ListAdapter(Event)
+    print(f"{EVENTS} events\n")
+    print(f"{'intervals':>9} {'Event':>12} {'EventView':>12} {'ratio':>6}")
+
+    for intervals in INTERVAL_COUNTS:
+        body = JsonCodec().dumps(create_events(EVENTS, intervals))
+
+        def models(body: bytes = body) -> list[object]:
+            return list(adapter.validate_json(body))
+
+        def views(body: bytes = body) -> list[object]:
+            return [EventView(event) for event in adapter.validate_json(body)]
+
+        model_size = bytes_per_event(models)
+        view_size = bytes_per_event(views)
+        print(
+            f"{intervals:>9} {model_size:>10.0f} B {view_size:>10.0f} B "
+            f"{model_size / view_size:>5.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
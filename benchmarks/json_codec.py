@@ -0,0 +1,80 @@
+"""Compare the JSON codecs on a large list of events.
+
+Run from the repository root with `python -m benchmarks.json_codec`. Codecs whose library
+is not installed are skipped.
+"""
+
+import timeit
+from typing import Any
+
+from toadr3 import JsonCodec, MsgspecCodec, OrjsonCodec
+from toadr3._internal import ListAdapter
+from toadr3.models import Event
+
+EVENTS = 500
+INTERVALS = 96
+
+
+def create_events(events: int = EVENTS, intervals: int = INTERVALS) -> list[dict[str, Any]]:
+    """Create events with one interval per 15 minutes, a day of intervals by default."""
+    return [
+        {
+            "id": str(i),
+            "createdDateTime": "2024-08-15T08:52:55.578Z",
+            "modificationDateTime": "2024-08-15T08:53:41.127Z",
+            "objectType": "EVENT",
+            "programID": "69",
+            "eventName": "powerLimit",
+            "targets": [{"type": "RESOURCE_NAME", "values": [str(1000 + i)]}],
+            "payloadDescriptors": [
+                {
+                    "payloadType": "CONSUMPTION_POWER_LIMIT",
+                    "units": "KW",
+                    "objectType": "EVENT_PAYLOAD_DESCRIPTOR",
+                }
+            ],
+            "intervalPeriod": {"start": "2024-08-15T00:00:00.000Z", "duration": "PT15M"},
+            "intervals": [
+                {"id": j, "payloads": [{"type": "CONSUMPTION_POWER_LIMIT", "values": [j * 10.5]}]}
+                for j in range(intervals)
+            ],
+        }
+        for i in range(events)
+    ]
+
+
+def measure(name: str, func: Any, number: int = 5) -> None:  # noqa: ANN401
+    """Print the best time of `number` runs in milliseconds."""
+    best = min(timeit.repeat(func, number=1, repeat=number))
+    print(f"{name:<45} {best * 1000:8.1f} ms")
+
+
+def main() -> None:
+    """Run the benchmark."""
+    codecs: list[JsonCodec] = [JsonCodec()]
+    for codec_type in (OrjsonCodec, MsgspecCodec):
+        try:
+            codecs.append(codec_type())
+        except RuntimeError:
+            print(f"{codec_type.name} is not installed, skipping")
+
+    data = create_events()
+    body = JsonCodec().dumps(data)
+    events = ListAdapter(Event).validate_json(body)
+    print(f"{EVENTS} events with {INTERVALS} intervals, {len(body) / 1e6:.1f} MB\n")
+
+    for codec in codecs:
+        measure(f"decode ({codec.name})", lambda codec=codec: codec.loads(body))
+    for codec in codecs:
+        measure(f"encode ({codec.name})", lambda codec=codec: codec.dumps(data))
+
+    adapter = ListAdapter(Event)
+    measure("decode and validate (pydantic validate_json)", lambda: adapter.validate_json(body))
+    measure(
+        "encode models (pydantic model_dump_json)",
+        lambda: [event.model_dump_json(exclude_none=True) for event in events],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+"""Compare the eager and lazy validation of a large list of events.
+
+Run from the repository root with `python -m benchmarks.lazy_events`. The lazy events are
+measured when no intervals are read, when the intervals of one in ten events are read, as when
+most events are filtered out by their top-level fields, and when all intervals are read.
+"""
+
+from benchmarks.json_codec import EVENTS, INTERVALS, create_events, measure
+from toadr3 import JsonCodec
+from toadr3._internal import ListAdapter
+from toadr3.models import Event, LazyEvent
+
+
+def main() -> None:
+    """Run the benchmark."""
+    body = JsonCodec().dumps(create_events())
+    eager = ListAdapter(Event)
+    lazy = ListAdapter(LazyEvent)
+    print(f"{EVENTS} events with {INTERVALS} intervals, {len(body) / 1e6:.1f} MB\n")
+
+    measure("eager", lambda: eager.validate_json(body))
+    measure("lazy, no intervals read", lambda: lazy.validate_json(body))
+    measure(
+        "lazy, 10% of intervals read",
+        lambda: [event.intervals for event in lazy.validate_json(body)[::10]],
+    )
+    measure(
+        "lazy, all intervals read",
+        lambda: [event.intervals for event in lazy.validate_json(body)],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Compare the peak memory of `get_events` and `stream_events` on a large list of events.
+
+Run from the repository root with `python -m benchmarks.streaming`.
+"""
+
+import asyncio
+import time
+import tracemalloc
+from collections.abc import Awaitable, Callable
+
+from aiohttp import web
+
+from benchmarks.json_codec import EVENTS, INTERVALS, create_events
+from toadr3 import JsonCodec, ToadrClient
+
+
+async def measure(name: str, func: Callable[[], Awaitable[int]]) -> None:
+    """Print the time and the peak memory allocated while running `func`."""
+    tracemalloc.start()
+    started = time.perf_counter()
+    count = await func()
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{name:<15} {count} events {elapsed * 1000:8.1f} ms, peak {peak / 1e6:6.1f} MB")
+
+
+async def main() -> None:
+    """Run the benchmark."""
+    body = JsonCodec().dumps(create_events())
+    print(f"{EVENTS} events with {INTERVALS} intervals, {len(body) / 1e6:.1f} MB\n")
+
+    async def events(_request: web.Request) -> web.Response:
+        return web.Response(body=body, content_type="application/json")
+
+    app = web.Application()
+    app.router.add_get("/vtn_url/events", events)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = runner.addresses[0][1]
+
+    async with ToadrClient(f"http://127.0.0.1:{port}/vtn_url", None) as client:
+
+        async def get_events() -> int:
+            return len(await client.get_events())
+
+        async def stream_events() -> int:
+            count = 0
+            async for _ in client.stream_events():
+                count += 1
+            return count
+
+        await measure("get_events", get_events)
+        await measure("stream_events", stream_events)
+
+    await runner.cleanup()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
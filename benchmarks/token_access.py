@@ -0,0 +1,86 @@
+"""Measure `ToadrClient.token` with a valid cached token and 10k concurrent callers.
+
+Run from the repository root with `python -m benchmarks.token_access`. The lock-free fast path
+is compared with the previous implementation, which acquired a lock on every call and held it
+while a new token was fetched.
+"""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+
+from toadr3 import AccessToken, OAuthScopeConfig, ToadrClient
+
+TASKS = 10_000
+CALLS = 20
+ROUNDS = 5
+REFRESH_LATENCY = 0.05
+
+TokenCall = Callable[[], Awaitable[AccessToken | None]]
+
+
+async def measure_calls(name: str, call: TokenCall) -> None:
+    """Print the time per call of `TASKS` concurrent tasks making `CALLS` calls each."""
+
+    async def task() -> None:
+        for _ in range(CALLS):
+            _ = await call()
+
+    best = float("inf")
+    for _ in range(ROUNDS):
+        started = time.perf_counter()
+        _ = await asyncio.gather(*(task() for _ in range(TASKS)))
+        best = min(best, time.perf_counter() - started)
+    print(f"{name:<30} {best * 1e9 / (TASKS * CALLS):8.0f} ns per call")
+
+
+async def measure_refresh(
+    name: str, call: TokenCall, refresh: Callable[[], Awaitable[object]]
+) -> None:
+    """Print the time for `TASKS` concurrent calls made while a token refresh is in flight."""
+    refresh_task = asyncio.ensure_future(refresh())
+    await asyncio.sleep(0)
+
+    started = time.perf_counter()
+    _ = await asyncio.gather(*(call() for _ in range(TASKS)))
+    elapsed = time.perf_counter() - started
+    await refresh_task
+    print(f"{name:<30} {elapsed * 1000:8.1f} ms for {TASKS} calls")
+
+
+async def main() -> None:
+    """Run the benchmark."""
+    config = OAuthScopeConfig("https://idp.example.com/token", "client_credentials", "scope")
+    async with ToadrClient("https://vtn.example.com", config) as client:
+        token = AccessToken("token", 3600)
+        client._token = token  # noqa: SLF001
+        lock = asyncio.Lock()
+
+        async def locked_token() -> AccessToken | None:
+            async with lock:
+                if client._token is None or client._token.is_expired():  # noqa: SLF001
+                    raise RuntimeError("the token should be valid")
+                return client._token  # noqa: SLF001
+
+        async def lock_free_token() -> AccessToken | None:
+            return await client.token
+
+        async def locked_refresh() -> None:
+            async with lock:
+                await asyncio.sleep(REFRESH_LATENCY)
+
+        async def fetch_token() -> AccessToken:
+            await asyncio.sleep(REFRESH_LATENCY)
+            return token
+
+        async def lock_free_refresh() -> AccessToken:
+            return await client._token_flight.do("token", fetch_token)  # noqa: SLF001
+
+        await measure_calls("lock per call", locked_token)
+        await measure_calls("lock-free", lock_free_token)
+        await measure_refresh("lock per call, refreshing", locked_token, locked_refresh)
+        await measure_refresh("lock-free, refreshing", lock_free_token, lock_free_refresh)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,54 @@
+"""Compare the full and trusted validation of a large list of events and of one large event.
+
+Run from the repository root with `python -m benchmarks.trusted_validation`. The events are
+validated once with the interval period on the event, and once with an interval period on every
+interval, which is how some VTNs send them.
+"""
+
+from typing import Any
+
+from benchmarks.json_codec import EVENTS, INTERVALS, create_events, measure
+from toadr3 import JsonCodec
+from toadr3._internal import ListAdapter
+from toadr3.models import Event
+
+LARGE_EVENT_INTERVALS = 10_000
+
+
+def with_interval_periods(events: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Move the interval period of every event to each of its intervals."""
+    for event in events:
+        period = event.pop("intervalPeriod")
+        for interval in event["intervals"]:
+            interval["intervalPeriod"] = period
+    return events
+
+
+def main() -> None:
+    """Run the benchmark."""
+    adapter = ListAdapter(Event)
+
+    for title, events, intervals in (
+        (f"{EVENTS} events with {INTERVALS} intervals", EVENTS, INTERVALS),
+        (f"1 event with {LARGE_EVENT_INTERVALS} intervals", 1, LARGE_EVENT_INTERVALS),
+    ):
+        print(f"\n{title}\n")
+        for name, data in (
+            ("event period", create_events(events, intervals)),
+            ("interval periods", with_interval_periods(create_events(events, intervals))),
+        ):
+            body = JsonCodec().dumps(data)
+            full = adapter.validate_json(body)
+            trusted = adapter.validate_json(body, validation="trusted")
+            if full != trusted:
+                raise RuntimeError("trusted validation built different events")
+
+            measure(f"full ({name})", lambda body=body: adapter.validate_json(body))
+            measure(
+                f"trusted ({name})",
+                lambda body=body: adapter.validate_json(body, validation="trusted"),
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,9 @@
+import base64
+import datetime
+import json
+import time
+from typing import Any
+
 import pytest
 from aiohttp import web
 from aiohttp.pytest_plugin import AiohttpClient
@@ -28,6 +34,75 @@ def test_expired_access_token() -> None:
     assert token.is_expired() is True
 
 
+def test_access_token_skew() -> None:
+    assert AccessToken("123", 100, skew=120).is_expired() is True
+    assert AccessToken("123", 100, skew=0).is_expired() is False
+    assert AccessToken("123", 0, skew=0).is_expired() is True
+    assert 39 < AccessToken("123", 100, skew=60).refresh_in <= 40
+
+
+def test_access_token_wall_clock_jump(monkeypatch: pytest.MonkeyPatch) -> None:
+    token = AccessToken("123", 3600)
+    expires_at = token.expires_at
+
+    # the expiry does not depend on the system time
+    monkeypatch.setattr(time, "time", lambda: 2_000_000_000.0)
+    assert token.is_expired() is False
+    assert 3590 <= token.expires_in <= 3600
+    assert token.expires_at == expires_at
+
+
+def create_jwt(claims: dict[str, Any]) -> str:
+    def encode(data: dict[str, Any]) -> str:
+        return base64.urlsafe_b64encode(json.dumps(data).encode()).decode().rstrip("=")
+
+    return f"{encode({'alg': 'RS256', 'typ': 'JWT'})}.{encode(claims)}.signature"
+
+
+def test_jwt_access_token() -> None:
+    now = int(time.time())
+
+    # the lifetime is taken from the claims, measured with the clock of the issuer
+    token = AccessToken(create_jwt({"iat": now - 1000, "exp": now + 600}))
+    assert 1590 <= token.expires_in <= 1600
+    assert token.expires_at - datetime.datetime.now(tz=datetime.timezone.utc) > datetime.timedelta(
+        seconds=1590
+    )
+
+    # the shorter of expires_in and the claims is used
+    assert 290 <= AccessToken(create_jwt({"iat": now, "exp": now + 3600}), 300).expires_in <= 300
+    assert 290 <= AccessToken(create_jwt({"iat": now, "exp": now + 300}), 3600).expires_in <= 300
+
+    # without iat, the remaining time until exp is used
+    assert 290 <= AccessToken(create_jwt({"exp": now + 300})).expires_in <= 300
+
+
+@pytest.mark.parametrize(
+    "token",
+    [
+        "123",
+        "a.b.c",
+        create_jwt({"iat": 0}),
+        create_jwt({"exp": "tomorrow"}),
+        create_jwt({"exp": True}),
+        f"a.{base64.urlsafe_b64encode(b'[1]').decode()}.c",
+    ],
+)
+def test_access_token_without_expiry(token: str) -> None:
+    with pytest.raises(ValueError, match="expires_in is required for tokens without an exp claim"):
+        _ = AccessToken(token)
+
+    assert AccessToken(token, 3600).expires_in > 3590
+
+
+def test_invalid_expiry_skew() -> None:
+    with pytest.raises(ValueError, match="expiry_skew cannot be negative"):
+        _ = OAuthScopeConfig("url", "client_credentials", "scope", expiry_skew=-1)
+
+    config = OAuthAudienceConfig("url", "client_credentials", "audience", expiry_skew=10)
+    assert config.expiry_skew == 10
+
+
 async def test_acquire_access_token_none_claims() -> None:
     with pytest.raises(ValueError, match="claims are required"):
         _ = await acquire_access_token_from_config(
@@ -224,6 +299,20 @@ async def test_acquire_access_token(aiohttp_client: AiohttpClient) -> None:
     assert access_token.expires_in > 0
     assert access_token.is_expired() is False
 
+    # with a skew larger than the lifetime, the token is expired right away
+    access_token = await acquire_access_token_from_config(
+        client,  # type: ignore[arg-type]
+        config=OAuthScopeConfig(
+            "/token",
+            "client_credentials",
+            "scope",
+            "client_id",
+            "client_secret",
+            expiry_skew=3600,
+        ),
+    )
+    assert access_token.is_expired() is True
+
 
 async def check_acquire_access_token_error(
     aiohttp_client: AiohttpClient,
@@ -0,0 +1,232 @@
+import asyncio
+import time
+
+import pytest
+from _common_test_utils import create_problem_response
+from aiohttp import ClientConnectionError, web
+from aiohttp.pytest_plugin import AiohttpClient
+from testdata import create_events
+
+from toadr3 import (
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitState,
+    RetryPolicy,
+    ToadrClient,
+    ToadrError,
+)
+
+
+@pytest.fixture
+async def failing_client(aiohttp_client: AiohttpClient) -> tuple[ToadrClient, list[int]]:
+    """Client towards a VTN that responds with the status in the returned list.
+
+    The list also counts the requests that reached the VTN.
+    """
+    statuses = [500]
+
+    async def events(_request: web.Request) -> web.Response:
+        statuses.append(statuses[-1])
+        if statuses[-1] == 200:
+            return web.json_response(data=create_events())
+        return create_problem_response("Failure", statuses[-1], "Failing VTN")
+
+    app = web.Application()
+    app.router.add_get("/vtn_url/events", events)
+    session = await aiohttp_client(app)
+    breaker = CircuitBreaker(window_size=4, minimum_calls=4, open_duration=0.05, half_open_calls=2)
+    client = ToadrClient("vtn_url", None, session, circuit_breaker=breaker)  # type: ignore[arg-type]
+    return client, statuses
+
+
+async def test_circuit_opens_and_recovers(failing_client: tuple[ToadrClient, list[int]]) -> None:
+    client, statuses = failing_client
+
+    for _ in range(4):
+        with pytest.raises(ToadrError, match="Failing VTN"):
+            _ = await client.get_events()
+    assert client.circuit_state == CircuitState.OPEN
+    assert len(statuses) == 5
+
+    with pytest.raises(ToadrError, match="Circuit breaker is open") as e:
+        _ = await client.get_events()
+    assert e.value.status_code == 503
+    assert e.value.headers["Retry-After"] == "1"
+    assert len(statuses) == 5
+
+    await asyncio.sleep(0.05)
+    assert client.circuit_state == CircuitState.HALF_OPEN  # type: ignore[comparison-overlap]
+
+    statuses.append(200)
+    _ = await client.get_events()
+    assert client.circuit_state == CircuitState.HALF_OPEN
+    _ = await client.get_events()
+    assert client.circuit_state == CircuitState.CLOSED
+
+
+async def test_circuit_reopens(failing_client: tuple[ToadrClient, list[int]]) -> None:
+    client, _ = failing_client
+
+    for _ in range(4):
+        with pytest.raises(ToadrError):
+            _ = await client.get_events()
+
+    await asyncio.sleep(0.05)
+    with pytest.raises(ToadrError, match="Failing VTN"):
+        _ = await client.get_events()
+    assert client.circuit_state == CircuitState.OPEN
+
+
+async def test_circuit_ignores_client_errors(
+    failing_client: tuple[ToadrClient, list[int]],
+) -> None:
+    client, statuses = failing_client
+    statuses.append(400)
+
+    for _ in range(6):
+        with pytest.raises(ToadrError):
+            _ = await client.get_events()
+    assert client.circuit_state == CircuitState.CLOSED
+
+
+async def test_circuit_non_json_failure(aiohttp_client: AiohttpClient) -> None:
+    async def events(_request: web.Request) -> web.Response:
+        return web.Response(status=503, text="<html>Bad Gateway</html>", content_type="text/html")
+
+    app = web.Application()
+    app.router.add_get("/vtn_url/events", events)
+    session = await aiohttp_client(app)
+    breaker = CircuitBreaker(window_size=1, minimum_calls=1)
+    client = ToadrClient("vtn_url", None, session, circuit_breaker=breaker)  # type: ignore[arg-type]
+
+    with pytest.raises(ToadrError) as e:
+        _ = await client.get_events()
+    assert e.value.status_code == 503
+    assert breaker.state == CircuitState.OPEN
+
+
+async def test_circuit_records_timeouts(aiohttp_client: AiohttpClient) -> None:
+    async def events(_request: web.Request) -> web.Response:
+        await asyncio.sleep(0.2)
+        return web.json_response(data=create_events())
+
+    app = web.Application()
+    app.router.add_get("/vtn_url/events", events)
+    session = await aiohttp_client(app)
+    breaker = CircuitBreaker(window_size=2, minimum_calls=2)
+    client = ToadrClient("vtn_url", None, session, circuit_breaker=breaker)  # type: ignore[arg-type]
+
+    # calls cut off by their timeout are failed and slow calls of a hanging VTN
+    for _ in range(2):
+        with pytest.raises(TimeoutError):
+            _ = await client.get_events(timeout=0.02)
+    assert breaker.state == CircuitState.OPEN
+
+
+async def test_circuit_with_retries(failing_client: tuple[ToadrClient, list[int]]) -> None:
+    client, statuses = failing_client
+    client._retry_policy = RetryPolicy(max_attempts=10, base_delay=0, max_delay=0)  # noqa: SLF001
+
+    # retries stop once the circuit opens instead of waiting for it to half-open
+    started = time.monotonic()
+    with pytest.raises(CircuitOpenError, match="Circuit breaker is open") as e:
+        _ = await client.get_events()
+    assert time.monotonic() - started < 0.5
+    assert e.value.status_code == 503
+    assert len(statuses) == 5
+    assert not RetryPolicy().is_retryable_error(e.value)
+
+
+def test_circuit_state_changes() -> None:
+    changes: list[tuple[CircuitState, CircuitState]] = []
+    breaker = CircuitBreaker(
+        failure_rate_threshold=0.5,
+        window_size=4,
+        minimum_calls=2,
+        open_duration=60,
+        on_state_change=lambda old, new: changes.append((old, new)),
+    )
+
+    breaker.acquire()
+    breaker.release(0.1)
+    breaker.acquire()
+    breaker.release(0.1, ToadrError("Failed", 404))
+    assert breaker.failure_rate == 0
+    breaker.acquire()
+    breaker.release(0.1, ClientConnectionError())
+    assert breaker.failure_rate == pytest.approx(1 / 3)
+    assert breaker.state == CircuitState.CLOSED
+
+    breaker.acquire()
+    breaker.release(0.1, TimeoutError())
+    assert breaker.state == CircuitState.OPEN  # type: ignore[comparison-overlap]
+    assert changes == [(CircuitState.CLOSED, CircuitState.OPEN)]
+
+    with pytest.raises(ToadrError) as e:
+        breaker.acquire()
+    assert e.value.headers["Retry-After"] == "60"
+
+    breaker.reset()
+    assert breaker.state == CircuitState.CLOSED
+    assert breaker.failure_rate == 0
+    assert changes[-1] == (CircuitState.OPEN, CircuitState.CLOSED)
+
+
+def test_circuit_slow_calls() -> None:
+    breaker = CircuitBreaker(
+        slow_call_rate_threshold=0.5, slow_call_duration=1, window_size=2, minimum_calls=2
+    )
+
+    breaker.acquire()
+    breaker.release(0.5)
+    breaker.acquire()
+    breaker.release(1.5)
+    assert breaker.slow_call_rate == 0.5
+    assert breaker.state == CircuitState.OPEN
+
+
+def test_circuit_cancelled_calls() -> None:
+    breaker = CircuitBreaker(slow_call_duration=1, window_size=4, minimum_calls=4)
+
+    # a call cancelled early is not recorded, one cancelled after the slow call duration is
+    breaker.acquire()
+    breaker.release(0.5, asyncio.CancelledError())
+    breaker.acquire()
+    breaker.release(1.5, asyncio.CancelledError())
+    breaker.acquire()
+    breaker.release(0.5, TimeoutError())
+    assert breaker.slow_call_rate == 1
+    assert breaker.failure_rate == 0.5
+
+
+async def test_circuit_half_open_limits_trials() -> None:
+    breaker = CircuitBreaker(window_size=1, minimum_calls=1, open_duration=0.01, half_open_calls=1)
+    breaker.acquire()
+    breaker.release(0, ToadrError("Failed", 500))
+    await asyncio.sleep(0.01)
+
+    breaker.acquire()
+    with pytest.raises(ToadrError, match="half_open"):
+        breaker.acquire()
+
+    # a cancelled trial lets another call try
+    breaker.release(0, asyncio.CancelledError())
+    breaker.acquire()
+    breaker.release(0)
+    assert breaker.state == CircuitState.CLOSED
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "msg"),
+    [
+        ({"failure_rate_threshold": 0}, "Rate thresholds must be between 0 and 1"),
+        ({"slow_call_rate_threshold": 1.5}, "Rate thresholds must be between 0 and 1"),
+        ({"window_size": 0}, "window_size must be a positive integer"),
+        ({"minimum_calls": 30}, "minimum_calls must be a positive integer"),
+        ({"half_open_calls": 0}, "half_open_calls must be a positive integer"),
+        ({"open_duration": 0}, "Durations must be positive"),
+    ],
+)
+def test_invalid_circuit_breaker(kwargs: dict[str, float], msg: str) -> None:
+    with pytest.raises(ValueError, match=msg):
+        _ = CircuitBreaker(**kwargs)  # type: ignore[arg-type]
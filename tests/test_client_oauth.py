@@ -1,4 +1,5 @@
-import datetime
+import asyncio
+import time
 
 import pytest
 
@@ -28,7 +29,7 @@ async def test_token_expiry(client: toadr3.ToadrClient) -> None:
 
     # move expiry timestamp
     assert client._token is not None  # noqa: SLF001
-    client._token._expires_at = datetime.datetime.now(tz=datetime.timezone.utc)  # noqa: SLF001
+    client._token._refresh_at_ns = time.monotonic_ns()  # noqa: SLF001
     assert token.is_expired()
 
     new_token = await client.token
@@ -74,3 +75,26 @@ async def test_token_client_secret_error(client: toadr3.ToadrClient) -> None:
         await client.token
 
     assert exc.value.status_code == 401
+
+
+async def test_token_single_fetch(client: toadr3.ToadrClient) -> None:
+    fetch_token = client._fetch_token  # noqa: SLF001
+    fetches = 0
+
+    async def counting_fetch_token() -> toadr3.AccessToken | None:
+        nonlocal fetches
+        fetches += 1
+        await asyncio.sleep(0.01)
+        return await fetch_token()
+
+    client._fetch_token = counting_fetch_token  # type: ignore[method-assign] # noqa: SLF001
+
+    tokens = await asyncio.gather(*(client.token for _ in range(100)))
+    assert fetches == 1
+    assert all(token is tokens[0] for token in tokens)
+
+    # a valid token is returned without fetching or suspending the caller
+    coroutine = client.token
+    with pytest.raises(StopIteration) as e:
+        coroutine.send(None)
+    assert e.value.value is tokens[0]
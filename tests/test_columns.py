@@ -0,0 +1,121 @@
+import array
+import datetime
+import math
+from typing import Any
+
+import pytest
+from testdata import create_event, create_events, create_report
+
+from toadr3.models import Event, IntervalColumns, Report, columns, events_to_columns
+
+START = datetime.datetime(2024, 8, 15, 10, tzinfo=datetime.timezone.utc).timestamp()
+
+
+@pytest.fixture(params=["numpy", "array"])
+def backend(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    """Create the columns with NumPy, or with `array.array` as if NumPy was not installed."""
+    if request.param == "numpy":
+        _ = pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(columns, "np", None)
+    return str(request.param)
+
+
+def as_list(column: Any) -> list[Any]:  # noqa: ANN401
+    return [None if isinstance(value, float) and math.isnan(value) else value for value in column]
+
+
+def payload(payload_type: str, *values: Any) -> dict[str, Any]:  # noqa: ANN401
+    return {"type": payload_type, "values": list(values)}
+
+
+def test_event_columns(backend: str) -> None:
+    event = Event.model_validate(
+        create_event()
+        | {
+            "intervals": [
+                {"id": 3, "payloads": [payload("PRICE", 0.5), payload("LIMIT", 10)]},
+                {"id": 4, "payloads": [payload("PRICE", 0.25)]},
+                {
+                    "id": 5,
+                    "intervalPeriod": {"start": "2024-08-16T00:00:00Z", "duration": "PT1H"},
+                    "payloads": [payload("LIMIT", 20), payload("LIMIT", 30)],
+                },
+                {"id": 6, "payloads": [payload("PRICE", "high"), payload("LIMIT", True)]},
+            ]
+        }
+    )
+    result = event.to_columns()
+
+    assert len(result) == 4
+    assert list(result.ids) == [3, 4, 5, 6]
+    assert list(result.starts) == [
+        START,
+        START + 900,
+        datetime.datetime(2024, 8, 16, tzinfo=datetime.timezone.utc).timestamp(),
+        START + 3 * 900,
+    ]
+    assert list(result.durations) == [900, 900, 3600, 900]
+    assert list(result.groups) == [0, 0, 0, 0]
+    assert list(result.values) == ["PRICE", "LIMIT"]
+    assert as_list(result.values["PRICE"]) == [0.5, 0.25, None, None]
+    assert as_list(result.values["LIMIT"]) == [10, None, 20, 1]
+
+    if backend == "numpy":
+        assert result.ids.dtype == "int64"
+        assert result.starts.dtype == "float64"
+        assert result.values["PRICE"].flags.c_contiguous
+    else:
+        assert isinstance(result.ids, array.array)
+        assert result.ids.typecode == "q"
+        assert result.starts.typecode == "d"
+
+
+def test_unresolved_periods(backend: str) -> None:  # noqa: ARG001
+    data = create_event()
+    del data["intervalPeriod"]
+    assert as_list(Event.model_validate(data).to_columns().starts) == [None]
+    assert as_list(Event.model_validate(data).to_columns().durations) == [None]
+
+    data = create_event() | {"intervalPeriod": {"start": "0000-00-00", "duration": "PT1H"}}
+    result = Event.model_validate(data).to_columns()
+    assert as_list(result.starts) == [None]
+    assert list(result.durations) == [3600]
+
+    data = create_event() | {"intervalPeriod": {"start": "2024-08-15T10:00:00"}}
+    result = Event.model_validate(data).to_columns()
+    assert list(result.starts) == [START]
+    assert list(result.durations) == [0]
+
+
+def test_events_to_columns(backend: str) -> None:  # noqa: ARG001
+    events = [Event.model_validate(event) for event in create_events()]
+    result = events_to_columns(events)
+
+    assert isinstance(result, IntervalColumns)
+    assert len(result) == len(events)
+    assert list(result.groups) == list(range(len(events)))
+    assert list(result.values["CONSUMPTION_POWER_LIMIT"]) == [1000] * len(events)
+    assert repr(result) == "IntervalColumns(5 intervals, payload types ['CONSUMPTION_POWER_LIMIT'])"
+
+    empty = events_to_columns([])
+    assert len(empty) == 0
+    assert empty.values == {}
+
+
+def test_report_columns(backend: str) -> None:  # noqa: ARG001
+    data = create_report(id="99", programID="1", eventID="86", clientName="YAC")
+    resource = data["resources"][0]
+    data["resources"].append(resource | {"resourceName": "other"})
+    report = Report.model_validate(data)
+    result = report.to_columns()
+
+    period = report.resources[0].interval_period
+    assert period is not None
+    assert not isinstance(period.start, str)
+    assert len(result) == 2 * len(resource["intervals"])
+    assert list(result.groups) == [0] * len(resource["intervals"]) + [1] * len(
+        resource["intervals"]
+    )
+    assert result.starts[0] == period.start.timestamp()
+    assert result.durations[0] == period.duration.total_seconds()
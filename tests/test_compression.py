@@ -0,0 +1,136 @@
+import json
+import zlib
+
+import pytest
+from _common_test_utils import create_problem_response
+from aiohttp import ClientSession, web
+from aiohttp.pytest_plugin import AiohttpClient
+from testdata import create_program, default_report_model
+
+from toadr3 import RequestCompression, ToadrClient, post_report, put_program_by_id
+from toadr3.models import Program
+
+
+@pytest.fixture
+async def recording_session(
+    aiohttp_client: AiohttpClient,
+) -> tuple[ClientSession, list[web.Request], list[bytes]]:
+    """Session towards a VTN that records requests and their decompressed bodies.
+
+    The VTN answers with 415 Unsupported Media Type to compressed bodies with the
+    "X-Reject-Compression" header, with a plain text body if its value is "text".
+    """
+    requests: list[web.Request] = []
+    bodies: list[bytes] = []
+
+    async def echo(request: web.Request) -> web.Response:
+        requests.append(request)
+        # aiohttp decompresses the body according to its Content-Encoding
+        body = await request.read()
+        if "Content-Encoding" in request.headers and "X-Reject-Compression" in request.headers:
+            if request.headers["X-Reject-Compression"] == "text":
+                return web.Response(status=415, text="No compression")
+            return create_problem_response("Unsupported", 415, "No compression")
+        bodies.append(body)
+
+        data = json.loads(body) | {"id": "1"}
+        response = web.json_response(data=data)
+        response.enable_compression()
+        return response
+
+    app = web.Application()
+    app.router.add_post("/vtn_url/reports", echo)
+    app.router.add_put("/vtn_url/programs/{id}", echo)
+    session = await aiohttp_client(app)
+    return session, requests, bodies  # type: ignore[return-value]
+
+
+@pytest.mark.parametrize("encoding", ["gzip", "deflate"])
+async def test_compressed_post(
+    recording_session: tuple[ClientSession, list[web.Request], list[bytes]],
+    encoding: str,
+) -> None:
+    session, requests, bodies = recording_session
+    report = default_report_model()
+
+    result = await post_report(
+        session,
+        "vtn_url",
+        None,
+        report,
+        compression=RequestCompression(encoding, threshold=0),  # type: ignore[arg-type]
+    )
+
+    assert result.id == "1"
+    assert requests[0].headers["Content-Encoding"] == encoding
+    assert requests[0].headers["Content-Type"] == "application/json"
+    assert "gzip" in requests[0].headers["Accept-Encoding"]
+    assert requests[0].content_length is not None
+    assert requests[0].content_length < len(bodies[0])
+    assert json.loads(bodies[0]) == json.loads(
+        report.model_dump_json(by_alias=True, exclude_none=True)
+    )
+
+
+async def test_compression_threshold(
+    recording_session: tuple[ClientSession, list[web.Request], list[bytes]],
+) -> None:
+    session, requests, _ = recording_session
+    program = Program.model_validate(create_program("1", "DR", "Demand Response"))
+
+    _ = await put_program_by_id(
+        session, "vtn_url", None, "1", program, compression=RequestCompression(threshold=100_000)
+    )
+
+    assert "Content-Encoding" not in requests[0].headers
+
+
+@pytest.mark.parametrize("reject", ["problem", "text"])
+async def test_compression_rejected(
+    recording_session: tuple[ClientSession, list[web.Request], list[bytes]],
+    reject: str,
+) -> None:
+    session, requests, bodies = recording_session
+    compression = RequestCompression(threshold=0)
+    client = ToadrClient(
+        "vtn_url",
+        None,
+        session,
+        default_custom_headers={"X-Reject-Compression": reject},
+        compression=compression,
+    )
+
+    _ = await client.post_report(default_report_model())
+    assert len(requests) == 2
+    assert "Content-Encoding" not in requests[1].headers
+    assert not compression.enabled
+
+    _ = await client.post_report(default_report_model())
+    assert len(requests) == 3
+    assert len(bodies) == 2
+
+
+async def test_compress_large_body() -> None:
+    compression = RequestCompression(encoding="deflate")
+    body = json.dumps([{"intervalPeriod": i, "payloads": [1.0, 2.0]} for i in range(50_000)])
+
+    compressed = await compression.compress(body)
+
+    assert compressed is not None
+    assert len(body) > 1024 * 1024
+    assert len(compressed) < len(body) / 5
+    assert zlib.decompress(compressed) == body.encode()
+    assert await compression.compress("{}") is None
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "msg"),
+    [
+        ({"encoding": "br"}, "Unsupported encoding br"),
+        ({"threshold": -1}, "threshold must be a non-negative integer"),
+        ({"level": 10}, "level must be an integer between 1 and 9"),
+    ],
+)
+def test_invalid_compression(kwargs: dict[str, str | int], msg: str) -> None:
+    with pytest.raises(ValueError, match=msg):
+        _ = RequestCompression(**kwargs)  # type: ignore[arg-type]
@@ -0,0 +1,82 @@
+import asyncio
+
+import aiohttp
+import pytest
+from aiohttp import web
+from aiohttp.pytest_plugin import AiohttpServer
+from testdata import create_events
+
+from toadr3 import ConnectionConfig, ToadrClient
+
+
+@pytest.fixture
+async def vtn(aiohttp_server: AiohttpServer) -> tuple[str, list[tuple[str, int]]]:
+    """URL of a VTN that records the client address and port of every request."""
+    peers: list[tuple[str, int]] = []
+
+    async def events(request: web.Request) -> web.Response:
+        assert request.transport is not None
+        peers.append(request.transport.get_extra_info("peername"))
+        await asyncio.sleep(0.01)
+        return web.json_response(data=create_events())
+
+    app = web.Application()
+    app.router.add_get("/vtn_url/events", events)
+    app.router.add_route("HEAD", "/vtn_url", events)
+    server = await aiohttp_server(app)
+    return str(server.make_url("/vtn_url")), peers
+
+
+async def test_connection_config() -> None:
+    config = ConnectionConfig(limit=10, limit_per_host=4, keepalive_timeout=30, dns_cache_ttl=60)
+    client = ToadrClient("vtn_url", None, connection_config=config)
+
+    connector = client.client_session.connector
+    assert isinstance(connector, aiohttp.TCPConnector)
+    assert connector.limit == 10
+    assert connector.limit_per_host == 4
+    assert connector._keepalive_timeout == 30  # noqa: SLF001
+    assert connector._cached_hosts._ttl == 60  # noqa: SLF001
+    assert isinstance(connector._resolver, aiohttp.AsyncResolver)  # noqa: SLF001
+    await client.close()
+
+
+async def test_warm_up(vtn: tuple[str, list[tuple[str, int]]]) -> None:
+    url, peers = vtn
+    config = ConnectionConfig(warm_up_connections=3)
+
+    async with ToadrClient(url, None, connection_config=config) as client:
+        assert len(set(peers)) == 3
+        warm = set(peers)
+
+        _ = await asyncio.gather(*(client.get_events() for _ in range(3)))
+        assert set(peers[3:]) <= warm
+
+        assert await client.warm_up(2) == 2
+
+
+async def test_warm_up_failure() -> None:
+    async with ToadrClient("http://127.0.0.1:1/vtn_url", None) as client:
+        assert await client.warm_up() == 0
+        assert await client.warm_up(2) == 0
+
+
+async def test_connection_config_with_session() -> None:
+    async with aiohttp.ClientSession() as session:
+        with pytest.raises(ValueError, match="connection_config can only be used"):
+            _ = ToadrClient("vtn_url", None, session, connection_config=ConnectionConfig())
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "msg"),
+    [
+        ({"limit": -1}, "limit must be a non-negative integer"),
+        ({"limit_per_host": 1.5}, "limit_per_host must be a non-negative integer"),
+        ({"warm_up_connections": -2}, "warm_up_connections must be a non-negative integer"),
+        ({"keepalive_timeout": 0}, "keepalive_timeout must be positive"),
+        ({"dns_cache_ttl": 0}, "dns_cache_ttl must be positive or None"),
+    ],
+)
+def test_invalid_connection_config(kwargs: dict[str, float], msg: str) -> None:
+    with pytest.raises(ValueError, match=msg):
+        _ = ConnectionConfig(**kwargs)  # type: ignore[arg-type]
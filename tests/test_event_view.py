@@ -0,0 +1,190 @@
+import array
+import copy
+import pickle
+from typing import Any
+
+import pytest
+from testdata import create_event, create_events
+
+from toadr3.models import (
+    Event,
+    EventView,
+    Interval,
+    IntervalPeriod,
+    IntervalsView,
+    ModelView,
+    Point,
+    ValuesMap,
+)
+
+
+def assert_lossless(event: Event) -> EventView:
+    view = EventView(event)
+    result = view.to_event()
+
+    assert type(result) is Event
+    assert result == event
+    assert result.model_dump_json() == event.model_dump_json()
+    assert result.model_dump_json(exclude_unset=True) == event.model_dump_json(exclude_unset=True)
+    return view
+
+
+@pytest.mark.parametrize("data", create_events())
+def test_lossless(data: dict[str, Any]) -> None:
+    view = assert_lossless(Event.model_validate(data))
+    assert view.intervals.is_columnar
+
+
+def test_fields() -> None:
+    event = Event.model_validate(create_event())
+    view = EventView(event)
+
+    assert view.id == event.id
+    assert view.program_id == event.program_id
+    assert view.created_date_time == event.created_date_time
+    assert view.object_type == "EVENT"
+    assert view.model_fields_set == event.model_fields_set
+    assert view.interval_period is not None
+    assert view.interval_period.duration == event.interval_period.duration  # type: ignore[union-attr]
+    assert view.targets is not None
+    assert view.targets[0].type == "RESOURCE_NAME"
+    assert view.targets[0].values == (1211,)
+    assert view.targets[0].model_type is ValuesMap
+    assert view.report_descriptors is not None
+    assert view.report_descriptors[0].payload_type == "POWER_LIMIT_ACKNOWLEDGEMENT"
+
+    with pytest.raises(AttributeError, match="ValuesMap view has no attribute 'unknown'"):
+        _ = view.targets[0].unknown
+
+
+def test_columnar_intervals() -> None:
+    event = Event.model_validate(
+        create_event()
+        | {
+            "intervals": [
+                {"id": i, "payloads": [{"type": "PRICE", "values": [i / 2]}]} for i in range(96)
+            ]
+        }
+    )
+    intervals = assert_lossless(event).intervals
+
+    assert len(intervals) == 96
+    assert intervals.payload_types == ("PRICE",)
+    assert isinstance(intervals.ids, array.array)
+    assert intervals.ids.typecode == "q"
+    prices = intervals.column("PRICE")
+    assert isinstance(prices, array.array)
+    assert prices.typecode == "d"
+    assert list(prices) == [i / 2 for i in range(96)]
+    assert repr(intervals) == "IntervalsView(96 intervals as columns ['PRICE'])"
+
+    assert intervals[3].id == 3
+    assert intervals[-1].id == 95
+    assert intervals[3].payloads[0].values == (1.5,)
+    assert [interval.id for interval in intervals[1:3]] == [1, 2]
+
+    with pytest.raises(KeyError):
+        _ = intervals.column("UNKNOWN")
+
+
+@pytest.mark.parametrize(
+    ("values", "typecode"),
+    [
+        ([1, 2], "q"),
+        ([1.0, 2.0], "d"),
+        ([1, 2.5], None),
+        ([True, False], None),
+        (["low", "high"], None),
+        ([2**64, 1], None),
+    ],
+)
+def test_column_types(values: list[Any], typecode: str | None) -> None:
+    data = create_event()
+    data["intervals"] = [
+        {"id": i, "payloads": [{"type": "VALUE", "values": [value]}]}
+        for i, value in enumerate(values)
+    ]
+    column = assert_lossless(Event.model_validate(data)).intervals.column("VALUE")
+
+    if typecode is None:
+        assert isinstance(column, tuple)
+    else:
+        assert isinstance(column, array.array)
+        assert column.typecode == typecode
+    assert list(column) == values
+
+
+def test_interval_periods() -> None:
+    data = create_event()
+    period = {"start": "2024-08-15T10:00:00Z", "duration": "PT1H"}
+    data["intervals"] = [
+        {"id": i, "intervalPeriod": period, "payloads": [{"type": "PRICE", "values": [1]}]}
+        for i in range(3)
+    ]
+    intervals = assert_lossless(Event.model_validate(data)).intervals
+
+    assert intervals.is_columnar
+    assert intervals[0].interval_period.model_type is IntervalPeriod
+
+
+def test_irregular_intervals() -> None:
+    data = create_event()
+    data["intervals"] = [
+        {"id": 0, "payloads": [{"type": "A", "values": [1, 2]}]},
+        {"id": 1, "payloads": [{"type": "B", "values": [{"x": 1, "y": 2}]}]},
+        {
+            "id": 2,
+            "intervalPeriod": {"start": "2024-08-15T10:00:00Z"},
+            "payloads": [{"type": "A", "values": [3]}, {"type": "B", "values": []}],
+        },
+    ]
+    intervals = assert_lossless(Event.model_validate(data)).intervals
+
+    assert not intervals.is_columnar
+    assert intervals.ids == (0, 1, 2)
+    assert intervals.payload_types == ()
+    assert intervals[1].payloads[0].values[0].model_type is Point
+    assert repr(intervals) == "IntervalsView(3 intervals as models)"
+    with pytest.raises(ValueError, match="the intervals are not stored as columns"):
+        _ = intervals.column("A")
+
+
+def test_no_intervals() -> None:
+    view = assert_lossless(Event.model_validate(create_event() | {"intervals": []}))
+    assert len(view.intervals) == 0
+    assert IntervalsView([]).to_intervals() == []
+
+
+def test_read_only() -> None:
+    view = EventView(Event.model_validate(create_event()))
+
+    with pytest.raises(AttributeError, match="EventView is read-only"):
+        view.id = "42"
+    with pytest.raises(AttributeError, match="EventView is read-only"):
+        del view.program_id
+    with pytest.raises(AttributeError, match="ModelView is read-only"):
+        view.interval_period.duration = None  # type: ignore[union-attr]
+    with pytest.raises(TypeError, match="unhashable"):
+        _ = hash(view)
+
+
+def test_copy_and_pickle() -> None:
+    view = EventView(Event.model_validate(create_event()))
+
+    assert copy.copy(view) == view
+    assert copy.deepcopy(view) == view
+    assert pickle.loads(pickle.dumps(view)) == view  # noqa: S301
+    assert view != EventView(Event.model_validate(create_event(id="38")))
+    assert view != view.to_event()
+
+
+def test_model_view() -> None:
+    values_map = ValuesMap(type="POINTS", values=[Point(x=1, y=2)])
+    view = ModelView(values_map)
+
+    assert view.model_fields_set == {"type", "values"}
+    assert view.to_model() == values_map
+    assert repr(view) == (
+        "ModelView[ValuesMap](type='POINTS', values=(ModelView[Point](x=1.0, y=2.0),))"
+    )
+    assert ModelView(Interval(id=0, payloads=[])).to_model() == Interval(id=0, payloads=[])
@@ -0,0 +1,149 @@
+import asyncio
+import json
+import pathlib
+import stat
+import threading
+import time
+
+import pytest
+
+from toadr3 import AccessToken, FileTokenCache, OAuthScopeConfig, ToadrClient
+
+
+def create_config(scope: str = "test_scope") -> OAuthScopeConfig:
+    return OAuthScopeConfig(
+        token_url="https://idp.example.com/token",
+        grant_type="client_credentials",
+        scope=scope,
+        client_id="test_client_id",
+        client_secret="test_client_secret",
+    )
+
+
+class TokenProvider:
+    """Token provider that issues a new token for every fetch after a short delay."""
+
+    def __init__(self) -> None:
+        self.issued: list[str] = []
+
+    async def fetch(self) -> AccessToken:
+        """Fetch a new token."""
+        await asyncio.sleep(0.01)
+        self.issued.append(f"token{len(self.issued) + 1}")
+        return AccessToken(self.issued[-1], 3600)
+
+
+async def test_shared_between_caches(tmp_path: pathlib.Path) -> None:
+    # every cache stands in for a separate process using the same directory
+    caches = [FileTokenCache(tmp_path) for _ in range(10)]
+    config = create_config()
+    provider = TokenProvider()
+
+    tokens = await asyncio.gather(*(cache.get(config, provider.fetch) for cache in caches))
+    assert {token.token for token in tokens} == {"token1"}
+    assert provider.issued == ["token1"]
+
+    # a token stored by another process is used even after this process was restarted
+    restarted = FileTokenCache(tmp_path)
+    token = await restarted.get(config, provider.fetch)
+    assert token.token == "token1"
+    assert 3590 <= token.expires_in <= 3600
+
+    # other configurations have their own file
+    other = await caches[0].get(create_config("other_scope"), provider.fetch)
+    assert other.token == "token2"
+    assert caches[0].path(config) != caches[0].path(create_config("other_scope"))
+
+
+async def test_stale_token(tmp_path: pathlib.Path) -> None:
+    first_cache, second_cache = FileTokenCache(tmp_path), FileTokenCache(tmp_path)
+    config = create_config()
+    provider = TokenProvider()
+
+    first = await first_cache.get(config, provider.fetch)
+    second = await first_cache.get(config, provider.fetch, stale=first)
+    assert second.token == "token2"
+
+    # another process holding the stale token reads the replacement from the file
+    stale = await second_cache.get(config, provider.fetch)
+    assert stale.token == "token2"
+    replacement = await second_cache.get(config, provider.fetch, stale=first)
+    assert replacement.token == "token2"
+    assert provider.issued == ["token1", "token2"]
+
+    # invalidating a token that was already replaced keeps the file
+    await first_cache.invalidate(config, first)
+    assert first_cache.path(config).exists()
+    await first_cache.invalidate(config, second)
+    assert not first_cache.path(config).exists()
+
+    third = await second_cache.get(config, provider.fetch, stale=stale)
+    assert third.token == "token3"
+
+
+async def test_expired_token_file(tmp_path: pathlib.Path) -> None:
+    cache = FileTokenCache(tmp_path)
+    config = create_config()
+    provider = TokenProvider()
+
+    cache.path(config).write_text(
+        json.dumps({"access_token": "expired", "expires_at": time.time() + 10})
+    )
+    token = await cache.get(config, provider.fetch)
+    assert token.token == "token1"
+
+    cache.clear()
+    cache.path(config).write_text("not json")
+    assert (await FileTokenCache(tmp_path).get(config, provider.fetch)).token == "token2"
+
+
+async def test_invalidate_off_event_loop(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    cache = FileTokenCache(tmp_path)
+    config = create_config()
+    token = await cache.get(config, TokenProvider().fetch)
+
+    threads: list[int] = []
+    unlink = pathlib.Path.unlink
+
+    def record_unlink(path: pathlib.Path, *, missing_ok: bool = False) -> None:
+        threads.append(threading.get_ident())
+        unlink(path, missing_ok=missing_ok)
+
+    monkeypatch.setattr(pathlib.Path, "unlink", record_unlink)
+    await cache.invalidate(config, token)
+
+    # the file is removed in a thread instead of blocking the event loop
+    assert not cache.path(config).exists()
+    assert threads
+    assert threading.get_ident() not in threads
+
+
+async def test_token_file(tmp_path: pathlib.Path) -> None:
+    directory = tmp_path / "tokens"
+    cache = FileTokenCache(directory)
+    assert cache.directory == directory
+    config = create_config()
+
+    token = await cache.get(config, lambda: asyncio.sleep(0, AccessToken("token", 3600)))
+
+    path = cache.path(config)
+    data = json.loads(path.read_text())
+    assert data["access_token"] == "token"
+    assert data["expires_at"] == pytest.approx(token.expires_at.timestamp())
+    assert stat.S_IMODE(directory.stat().st_mode) == 0o700
+    assert stat.S_IMODE(path.stat().st_mode) == 0o600
+    # no temporary files are left behind
+    assert sorted(p.suffix for p in directory.iterdir()) == [".json", ".lock"]
+
+
+async def test_client(tmp_path: pathlib.Path) -> None:
+    cache = FileTokenCache(tmp_path)
+    config = create_config()
+    _ = await cache.get(config, lambda: asyncio.sleep(0, AccessToken("stored", 3600)))
+
+    async with ToadrClient("vtn_url", config, token_cache=FileTokenCache(tmp_path)) as client:
+        token = await client.token
+        assert token is not None
+        assert token.token == "stored"
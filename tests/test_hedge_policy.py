@@ -0,0 +1,181 @@
+import asyncio
+import functools
+import time
+from typing import Any
+
+import pytest
+from _common_test_utils import create_problem_response
+from aiohttp import ClientSession, web
+from aiohttp.pytest_plugin import AiohttpServer
+from testdata import create_events, create_program
+
+from toadr3 import HedgePolicy, ToadrClient, ToadrError, get_program_by_id
+
+
+@pytest.fixture
+async def vtn(aiohttp_server: AiohttpServer) -> tuple[str, list[float]]:
+    """URL of a VTN where the first request is slow, and the delays of the requests.
+
+    The delays are popped from the list, requests without a delay respond immediately.
+    """
+    delays: list[float] = [1.0]
+
+    async def respond(data: Any) -> web.Response:  # noqa: ANN401
+        delay = delays.pop(0) if delays else 0
+        if delay < 0:
+            await asyncio.sleep(-delay)
+            return create_problem_response("Bad Gateway", 502, "Upstream failed")
+        await asyncio.sleep(delay)
+        return web.json_response(data=data)
+
+    async def events(_request: web.Request) -> web.Response:
+        return await respond(create_events())
+
+    async def program(request: web.Request) -> web.Response:
+        return await respond(create_program(request.match_info["program_id"], "a", "b"))
+
+    app = web.Application()
+    app.router.add_get("/vtn_url/events", events)
+    app.router.add_get("/vtn_url/programs/{program_id}", program)
+    server = await aiohttp_server(app)
+    return str(server.make_url("/vtn_url")), delays
+
+
+async def test_hedged_request(vtn: tuple[str, list[float]]) -> None:
+    url, _ = vtn
+    policy = HedgePolicy(delay=0.05, budget=1)
+
+    async with ToadrClient(url, None, hedge_policy=policy) as client:
+        assert client.hedge_policy is policy
+
+        started = time.monotonic()
+        events = await client.get_events()
+        assert time.monotonic() - started < 0.5
+        assert len(events) == len(create_events())
+        assert policy.hedge_rate == 1
+
+        # fast responses are not hedged
+        _ = await client.get_program("37")
+        assert policy.hedge_rate == 0.5
+
+
+async def test_hedged_request_budget(vtn: tuple[str, list[float]]) -> None:
+    url, delays = vtn
+    delays[:] = [0.2, 0.2, 0, 0.2]
+    policy = HedgePolicy(delay=0.01, min_samples=5, window_size=10, budget=0.5)
+
+    async with ToadrClient(url, None, hedge_policy=policy) as client:
+        # the budget is relative to the requests observed so far, so the first is not hedged
+        started = time.monotonic()
+        _ = await client.get_events()
+        assert time.monotonic() - started >= 0.2
+        assert policy.hedge_rate == 0
+
+        started = time.monotonic()
+        _ = await client.get_events()
+        assert time.monotonic() - started < 0.2
+        assert delays == [0.2]
+        assert policy.hedge_rate == 0.5
+
+        # a second hedged request would exceed the budget
+        started = time.monotonic()
+        _ = await client.get_events()
+        assert time.monotonic() - started >= 0.2
+        assert policy.hedge_rate == 1 / 3
+
+
+async def test_hedged_request_error(vtn: tuple[str, list[float]]) -> None:
+    url, delays = vtn
+    policy = HedgePolicy(delay=0.05, budget=1)
+    session = ClientSession()
+
+    # the slow request fails, so the result of the hedged request is used
+    delays[:] = [-0.1]
+    program = await get_program_by_id(session, url, None, "37", hedge_policy=policy)
+    assert program.id == "37"
+
+    # both requests fail, the first error is raised
+    delays[:] = [-0.1, -0.01]
+    with pytest.raises(ToadrError) as e:
+        _ = await get_program_by_id(session, url, None, "37", hedge_policy=policy)
+    assert e.value.status_code == 502
+
+    # errors before the hedge delay are raised immediately
+    delays[:] = [-0.01]
+    with pytest.raises(ToadrError):
+        _ = await get_program_by_id(session, url, None, "37", hedge_policy=policy)
+    assert policy.hedge_rate == 2 / 3
+    await session.close()
+
+
+async def test_hedge_cancelled(vtn: tuple[str, list[float]]) -> None:
+    url, delays = vtn
+    delays[:] = [0.3, 0.3]
+    policy = HedgePolicy(delay=0.01, budget=1)
+
+    async with ToadrClient(url, None, hedge_policy=policy) as client:
+        with pytest.raises(TimeoutError):
+            _ = await client.get_events(timeout=0.1)
+
+
+async def test_observed_delay() -> None:
+    policy = HedgePolicy(percentile=0.9, min_samples=5, window_size=10, budget=1)
+    url = "https://vtn.example.com/events"
+
+    async def request(delay: float) -> float:
+        await asyncio.sleep(delay)
+        return delay
+
+    for i in range(4):
+        assert policy.hedge_delay(url) is None
+        assert await policy.run(url, functools.partial(request, i / 1000)) == i / 1000
+    _ = await policy.run(url, lambda: request(0.01))
+
+    delay = policy.hedge_delay(url)
+    assert delay is not None
+    assert 0.01 <= delay < 0.02
+    assert policy.hedge_delay("https://vtn.example.com/programs/37") is None
+    assert policy.hedge_rate == 0
+
+    # the hedged request uses the same function and the fastest result wins
+    delays = [0.2, 0.0]
+    assert await policy.run(url, lambda: request(delays.pop(0))) == 0.0
+    assert policy.hedge_rate == 1 / 6
+
+    policy.reset()
+    assert policy.hedge_delay(url) is None
+    assert policy.hedge_rate == 0
+
+
+async def test_observed_delay_of_cancelled_requests() -> None:
+    policy = HedgePolicy(percentile=0.9, min_samples=2, window_size=10, budget=1)
+    url = "https://vtn.example.com/events"
+
+    async def request(delay: float) -> float:
+        await asyncio.sleep(delay)
+        return delay
+
+    for _ in range(2):
+        _ = await policy.run(url, lambda: request(0.1))
+
+    # the slow primary is cancelled after about 0.15 seconds, which is kept as its latency
+    delays = [1.0, 0.05]
+    assert await policy.run(url, lambda: request(delays.pop(0))) == 0.05
+    delay = policy.hedge_delay(url)
+    assert delay is not None
+    assert delay >= 0.14
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "msg"),
+    [
+        ({"delay": -1}, "delay must be a non-negative number or None"),
+        ({"percentile": 1}, "percentile must be between 0 and 1"),
+        ({"window_size": 0}, "window_size must be a positive integer"),
+        ({"min_samples": 101}, "min_samples must be a positive integer not larger"),
+        ({"budget": 1.5}, "budget must be between 0 and 1"),
+    ],
+)
+def test_invalid_hedge_policy(kwargs: dict[str, float], msg: str) -> None:
+    with pytest.raises(ValueError, match=msg):
+        _ = HedgePolicy(**kwargs)  # type: ignore[arg-type]
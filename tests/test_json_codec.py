@@ -0,0 +1,74 @@
+from typing import Any
+
+import pytest
+from aiohttp import ClientSession
+
+from toadr3 import (
+    AccessToken,
+    JsonCodec,
+    MsgspecCodec,
+    OrjsonCodec,
+    ToadrClient,
+    ToadrError,
+    default_json_codec,
+    delete_program_by_id,
+)
+
+
+class CountingCodec(JsonCodec):
+    """Standard library codec that counts the decoded documents."""
+
+    def __init__(self) -> None:
+        self.decoded = 0
+
+    def loads(self, data: str | bytes) -> Any:  # noqa: ANN401
+        """Decode a JSON document and count it."""
+        self.decoded += 1
+        return super().loads(data)
+
+
+@pytest.mark.parametrize("codec", [JsonCodec(), OrjsonCodec(), MsgspecCodec()])
+def test_codec_round_trip(codec: JsonCodec) -> None:
+    obj = {"id": "37", "values": [1, 2.5, None, True], "name": "æøå"}
+
+    encoded = codec.dumps(obj)
+
+    assert isinstance(encoded, bytes)
+    assert b" " not in encoded
+    assert codec.loads(encoded) == obj
+    assert codec.loads(encoded.decode()) == obj
+    with pytest.raises(ValueError):  # noqa: PT011
+        codec.loads(b"{not json")
+
+
+def test_default_codec() -> None:
+    assert isinstance(default_json_codec(), OrjsonCodec)
+    assert default_json_codec() is default_json_codec()
+    assert default_json_codec().name == "orjson"
+
+
+async def test_codec_used_for_responses(client: ToadrClient) -> None:
+    codec = CountingCodec()
+    client._json_codec = codec  # noqa: SLF001
+
+    _ = await client.token
+    assert codec.decoded == 1
+
+    program = await client.delete_program("0")
+    assert program is not None
+    assert codec.decoded == 2
+
+
+async def test_codec_used_for_errors(session: ClientSession, token: AccessToken) -> None:
+    codec = CountingCodec()
+
+    with pytest.raises(ToadrError):
+        _ = await delete_program_by_id(
+            session,
+            "vtn_url",
+            token,
+            "0",
+            custom_headers={"X-Custom-Header": "WrongValue"},
+            json_codec=codec,
+        )
+    assert codec.decoded == 1
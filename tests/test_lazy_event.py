@@ -0,0 +1,144 @@
+import copy
+import json
+import pickle
+
+import pytest
+from aiohttp import ClientSession
+from pydantic import ValidationError
+from testdata import create_event, create_events
+
+from toadr3 import OAuthScopeConfig, ToadrClient
+from toadr3._internal import ListAdapter, lazy_parser, model_parser
+from toadr3.models import Event, Interval, LazyEvent, Report, ValuesMap
+
+LAZY_FIELDS = {"intervals", "targets", "report_descriptors"}
+
+
+@pytest.mark.parametrize("validation", ["full", "trusted"])
+def test_same_events(validation: str) -> None:
+    body = json.dumps(create_events())
+    full = ListAdapter(Event).validate_json(body)
+    lazy = ListAdapter(LazyEvent).validate_json(body, validation=validation)  # type: ignore[arg-type]
+
+    assert all(type(event) is LazyEvent for event in lazy)
+    assert all(event.deferred_fields == LAZY_FIELDS for event in lazy)
+    assert [event.model_dump() for event in lazy] == [event.model_dump() for event in full]
+    assert [event.model_fields_set for event in lazy] == [event.model_fields_set for event in full]
+
+
+def test_validated_on_first_access() -> None:
+    event = lazy_parser(LazyEvent, "full")(json.dumps(create_event()))
+    assert event.program_id == "69"
+    assert event.interval_period is not None
+    assert event.deferred_fields == LAZY_FIELDS
+
+    intervals = event.intervals
+    assert isinstance(intervals[0], Interval)
+    assert isinstance(intervals[0].payloads[0], ValuesMap)
+    assert event.intervals is intervals
+    assert event.deferred_fields == {"targets", "report_descriptors"}
+
+    assert event.targets is not None
+    assert event.targets[0].values == [1211]
+    assert event.deferred_fields == {"report_descriptors"}
+
+
+def test_missing_fields_not_deferred() -> None:
+    data = create_event()
+    del data["targets"]
+    event = lazy_parser(LazyEvent, "full")(json.dumps(data))
+
+    assert event.deferred_fields == {"intervals", "report_descriptors"}
+    assert event.targets is None
+
+
+def test_invalid_field_raises_on_access() -> None:
+    data = create_event()
+    data["intervals"][0]["payloads"] = "not a list"
+    event = lazy_parser(LazyEvent, "full")(json.dumps(data))
+
+    for _ in range(2):
+        with pytest.raises(ValidationError, match="payloads"):
+            _ = event.intervals
+    assert "intervals" in event.deferred_fields
+
+    # top-level fields are still validated eagerly
+    with pytest.raises(ValidationError, match="String should match pattern"):
+        _ = lazy_parser(LazyEvent, "full")(json.dumps(create_event(id="not a valid id!")))
+
+
+def test_trusted_fields() -> None:
+    data = create_event()
+    data["targets"][0]["type"] = ""
+    event = lazy_parser(LazyEvent, "trusted")(json.dumps(data))
+    assert event.targets is not None
+    assert event.targets[0].type == ""
+
+    with pytest.raises(ValidationError, match="String should have at least 1 character"):
+        _ = lazy_parser(LazyEvent, "full")(json.dumps(data)).targets
+
+
+def test_materialized_by_other_uses() -> None:
+    data = create_event()
+    parse = lazy_parser(LazyEvent, "full")
+    expected = model_parser(Event, "full")(json.dumps(data))
+
+    assert parse(json.dumps(data)).model_dump() == expected.model_dump()
+    assert json.loads(parse(json.dumps(data)).model_dump_json()) == json.loads(
+        expected.model_dump_json()
+    )
+    assert dict(parse(json.dumps(data)))["intervals"] == expected.intervals
+    assert repr(parse(json.dumps(data))) == repr(expected).replace("Event(", "LazyEvent(", 1)
+    assert copy.copy(parse(json.dumps(data))).intervals == expected.intervals
+    assert copy.deepcopy(parse(json.dumps(data))).intervals == expected.intervals
+    assert pickle.loads(pickle.dumps(parse(json.dumps(data)))).intervals == expected.intervals  # noqa: S301
+    assert parse(json.dumps(data)) == parse(json.dumps(data))
+
+    event = parse(json.dumps(data))
+    assert event.materialize() is event
+    assert event.deferred_fields == set()
+
+
+def test_assigned_field_not_replaced() -> None:
+    event = lazy_parser(LazyEvent, "full")(json.dumps(create_event()))
+    event.intervals = []
+
+    assert event.deferred_fields == {"targets", "report_descriptors"}
+    assert event.materialize().intervals == []
+
+
+def test_create_report() -> None:
+    event = lazy_parser(LazyEvent, "full")(json.dumps(create_event()))
+    report = Report.create_report(event, "client", "POWER_LIMIT_ACKNOWLEDGEMENT", [1])
+    assert report.resources[0].resource_name == "1211"
+
+
+def test_defer_non_lazy_field() -> None:
+    event = LazyEvent.model_validate(create_event())
+    assert event.deferred_fields == set()
+
+    with pytest.raises(ValueError, match="event_name is not a lazy field"):
+        event.defer("event_name", lambda value: value)
+
+
+async def test_lazy_client(session: ClientSession) -> None:
+    config = OAuthScopeConfig(
+        token_url="/oauth_url/token_endpoint",
+        grant_type="client_credentials",
+        scope="test_scope",
+        client_id="test_client_id",
+        client_secret="test_client_secret",
+    )
+    full = ToadrClient("vtn_url", config, session=session)
+    lazy = ToadrClient("vtn_url", config, session=session, lazy_events=True)
+    assert not full.lazy_events
+    assert lazy.lazy_events
+
+    expected = [event.model_dump() for event in await full.get_events()]
+    for events in (
+        await lazy.get_events(),
+        [event async for event in lazy.stream_events()],
+        [event async for event in lazy.iter_events(page_size=2)],
+    ):
+        assert all(isinstance(event, LazyEvent) for event in events)
+        assert [event.model_dump() for event in events] == expected
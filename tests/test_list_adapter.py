@@ -0,0 +1,36 @@
+import json
+
+import pytest
+from pydantic import ValidationError
+from testdata import create_event, create_events
+
+from toadr3._internal import ListAdapter
+from toadr3.models import Event
+
+
+def test_list_adapter_validate_json() -> None:
+    adapter = ListAdapter(Event)
+    data = json.dumps(create_events()).encode()
+
+    events = adapter.validate_json(data)
+
+    assert [event.id for event in events] == ["37", "38", "39", "40", "41"]
+    assert events == [Event.model_validate(event) for event in create_events()]
+    assert "object_type" in events[0].model_fields_set
+
+
+def test_list_adapter_empty_list() -> None:
+    assert ListAdapter(Event).validate_json(b"[]") == []
+
+
+def test_list_adapter_not_a_list() -> None:
+    msg = "Expected result to be a list. Got <class 'dict'> instead."
+    with pytest.raises(ValueError, match=msg):
+        _ = ListAdapter(Event).validate_json(json.dumps(create_event()))
+
+
+def test_list_adapter_invalid_item() -> None:
+    data = json.dumps([create_event(), create_event(programID="")])
+
+    with pytest.raises(ValidationError, match=r"1\.programID"):
+        _ = ListAdapter(Event).validate_json(data)
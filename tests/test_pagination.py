@@ -0,0 +1,204 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from aiohttp import ClientSession
+
+from toadr3 import AccessToken, ToadrClient, get_events, iter_events
+from toadr3._internal import paginate
+from toadr3.models import Event
+
+
+async def test_iter_events(session: ClientSession, token: AccessToken) -> None:
+    events = [event async for event in iter_events(session, "vtn_url", token, page_size=2)]
+
+    assert [event.id for event in events] == ["37", "38", "39", "40", "41"]
+
+
+async def test_iter_events_with_filter(session: ClientSession, token: AccessToken) -> None:
+    events = [
+        event
+        async for event in iter_events(session, "vtn_url", token, program_id="34", page_size=1)
+    ]
+
+    assert [event.id for event in events] == ["37", "39", "41"]
+
+
+@pytest.mark.parametrize(
+    ("method_name", "expected_count"),
+    [
+        ("events", 5),
+        ("programs", 3),
+        ("reports", 7),
+        ("subscriptions", 4),
+    ],
+)
+async def test_client_iter(client: ToadrClient, method_name: str, expected_count: int) -> None:
+    items = [item async for item in getattr(client, f"iter_{method_name}")(page_size=2)]
+    page = await getattr(client, f"get_{method_name}")()
+
+    assert len(items) == expected_count
+    assert [item.id for item in items] == [item.id for item in page]
+
+
+async def test_paginate_stops_on_short_page() -> None:
+    calls: list[tuple[int, int]] = []
+
+    async def fetch_page(skip: int, limit: int) -> list[int]:
+        calls.append((skip, limit))
+        return list(range(10))[skip : skip + limit]
+
+    assert [item async for item in paginate(fetch_page, 4)] == list(range(10))
+    assert calls == [(0, 4), (4, 4), (8, 4)]
+
+    calls.clear()
+    assert [item async for item in paginate(fetch_page, 5)] == list(range(10))
+    assert calls == [(0, 5), (5, 5), (10, 5)]
+
+
+async def test_paginate_prefetches_next_page() -> None:
+    calls: list[tuple[int, int]] = []
+    release = asyncio.Event()
+
+    async def fetch_page(skip: int, limit: int) -> list[int]:
+        calls.append((skip, limit))
+        if skip > 0:
+            await release.wait()
+        return list(range(3))[skip : skip + limit]
+
+    iterator = paginate(fetch_page, 2)
+    assert await anext(iterator) == 0
+    await asyncio.sleep(0)
+
+    # the second page is requested before the first page has been consumed
+    assert calls == [(0, 2), (2, 2)]
+    assert await anext(iterator) == 1
+
+    release.set()
+    assert [item async for item in iterator] == [2]
+
+
+async def test_paginate_close_cancels_prefetch() -> None:
+    started = asyncio.Event()
+    cancelled = asyncio.Event()
+
+    async def fetch_page(skip: int, limit: int) -> list[int]:
+        if skip > 0:
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+        return list(range(limit))
+
+    iterator = paginate(fetch_page, 2)
+    assert await anext(iterator) == 0
+    await started.wait()
+    await iterator.aclose()
+    await asyncio.wait_for(cancelled.wait(), timeout=1)
+
+
+@pytest.mark.parametrize(
+    ("page_size", "msg"),
+    [
+        (0, "page_size must be a positive integer"),
+        (-1, "page_size must be a positive integer"),
+        ("10", "page_size must be an integer"),
+    ],
+)
+async def test_paginate_invalid_page_size(page_size: int, msg: str) -> None:
+    async def fetch_page(_skip: int, _limit: int) -> list[int]:
+        return []
+
+    with pytest.raises(ValueError, match=msg):
+        _ = [item async for item in paginate(fetch_page, page_size)]
+
+
+async def test_paginate_concurrent_pages_in_order() -> None:
+    in_flight = 0
+    max_in_flight = 0
+    calls: list[int] = []
+
+    async def fetch_page(skip: int, limit: int) -> list[int]:
+        nonlocal in_flight, max_in_flight
+        calls.append(skip)
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        # later pages finish first
+        await asyncio.sleep(0.01 * (10 - skip // limit))
+        in_flight -= 1
+        return list(range(23))[skip : skip + limit]
+
+    items = [item async for item in paginate(fetch_page, 5, max_concurrency=3)]
+
+    assert items == list(range(23))
+    assert max_in_flight == 3
+    # at most max_concurrency - 1 pages are requested after the short page at skip=20
+    assert calls[:5] == [0, 5, 10, 15, 20]
+    assert max(calls) <= 30
+
+
+async def test_paginate_stops_requesting_after_short_page() -> None:
+    calls: list[int] = []
+
+    async def fetch_page(skip: int, limit: int) -> list[int]:
+        calls.append(skip)
+        await asyncio.sleep(0)
+        return list(range(3))[skip : skip + limit]
+
+    items = [item async for item in paginate(fetch_page, 2, max_concurrency=4)]
+
+    assert items == [0, 1, 2]
+    assert calls == [0, 2, 4, 6]
+
+
+async def test_paginate_skips_duplicate_ids(session: ClientSession, token: AccessToken) -> None:
+    pages = [
+        await get_events(session, "vtn_url", token, skip=0, limit=3),
+        # the VTN shifted the items by one between the two requests
+        await get_events(session, "vtn_url", token, skip=2, limit=3),
+    ]
+
+    async def fetch_page(skip: int, _limit: int) -> list[Event]:
+        return pages[skip // 3] if skip // 3 < len(pages) else []
+
+    events = [event async for event in paginate(fetch_page, 3, max_concurrency=2)]
+
+    assert [event.id for event in events] == ["37", "38", "39", "40", "41"]
+
+
+async def test_paginate_keeps_ids_of_recent_pages() -> None:
+    pages = [["1", "2"], ["2", "3"], ["4", "5"], ["1", "6"], ["7"]]
+
+    async def fetch_page(skip: int, _limit: int) -> list[SimpleNamespace]:
+        return [SimpleNamespace(id=item_id) for item_id in pages[skip // 2]]
+
+    items = [item.id async for item in paginate(fetch_page, 2)]
+
+    # only the IDs of the last two pages are kept, so "1" is yielded again
+    assert items == ["1", "2", "3", "4", "5", "1", "6", "7"]
+
+
+async def test_iter_events_concurrent(session: ClientSession, token: AccessToken) -> None:
+    events = [
+        event
+        async for event in iter_events(session, "vtn_url", token, page_size=1, max_concurrency=4)
+    ]
+
+    assert [event.id for event in events] == ["37", "38", "39", "40", "41"]
+
+
+@pytest.mark.parametrize(
+    ("max_concurrency", "msg"),
+    [
+        (0, "max_concurrency must be a positive integer"),
+        (None, "max_concurrency must be an integer"),
+    ],
+)
+async def test_paginate_invalid_max_concurrency(max_concurrency: int, msg: str) -> None:
+    async def fetch_page(_skip: int, _limit: int) -> list[int]:
+        return []
+
+    with pytest.raises(ValueError, match=msg):
+        _ = [item async for item in paginate(fetch_page, 10, max_concurrency)]
@@ -0,0 +1,135 @@
+import asyncio
+import time
+
+import pytest
+from _common_test_utils import create_problem_response
+from aiohttp import ClientSession, web
+from aiohttp.pytest_plugin import AiohttpClient
+from testdata import create_events, create_program
+
+from toadr3 import RateLimiter, ToadrClient, ToadrError, TokenBucket
+
+
+async def test_token_bucket_rate() -> None:
+    bucket = TokenBucket(rate=100, burst=2)
+
+    started = time.monotonic()
+    for _ in range(6):
+        await bucket.acquire()
+
+    # the first two tokens are the burst, the other four arrive at the rate
+    assert time.monotonic() - started >= 0.035
+    assert bucket.tokens < 1
+
+
+async def test_token_bucket_fair() -> None:
+    bucket = TokenBucket(rate=200, burst=1)
+    order: list[int] = []
+
+    async def acquire(i: int) -> None:
+        await bucket.acquire()
+        order.append(i)
+
+    await asyncio.gather(*(acquire(i) for i in range(10)))
+    assert order == list(range(10))
+
+
+async def test_token_bucket_throttle() -> None:
+    bucket = TokenBucket(rate=1000, burst=10)
+
+    bucket.throttle(0.05)
+    started = time.monotonic()
+    await bucket.acquire()
+    assert time.monotonic() - started >= 0.045
+
+    bucket = TokenBucket(rate=1000, burst=10)
+    bucket.throttle()
+    assert bucket.tokens < 1
+
+
+def test_rate_limiter_endpoints() -> None:
+    limiter = RateLimiter(endpoint_limits={"/events": (1, 1), "programs": (2, 2)})
+
+    assert limiter.global_bucket is None
+    events = limiter.endpoint_bucket("https://vtn.example.com/openadr3/3.0.1/events")
+    programs = limiter.endpoint_bucket("vtn_url/programs/12")
+    assert events is not None
+    assert events.rate == 1
+    assert programs is not None
+    assert programs.burst == 2
+    assert limiter.endpoint_bucket("vtn_url/reports") is None
+
+    with pytest.raises(ValueError, match="Unknown endpoint /vens"):
+        _ = RateLimiter(endpoint_limits={"/vens": (1, 1)})
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "msg"),
+    [
+        ({"rate": 0}, "rate must be positive"),
+        ({"rate": 1, "burst": 0}, "burst must be a positive integer"),
+    ],
+)
+def test_invalid_token_bucket(kwargs: dict[str, float], msg: str) -> None:
+    with pytest.raises(ValueError, match=msg):
+        _ = TokenBucket(**kwargs)  # type: ignore[arg-type]
+
+
+@pytest.fixture
+async def limited_vtn(aiohttp_client: AiohttpClient) -> tuple[ClientSession, list[float]]:
+    """VTN that records the time of every request and rejects the first with 429."""
+    requests: list[float] = []
+
+    async def events(_request: web.Request) -> web.Response:
+        requests.append(time.monotonic())
+        if len(requests) == 1:
+            response = create_problem_response("Too many requests", 429, "Slow down")
+            response.headers["Retry-After"] = "0"
+            return response
+        return web.json_response(data=create_events())
+
+    async def program(_request: web.Request) -> web.Response:
+        requests.append(time.monotonic())
+        return web.json_response(data=create_program("1", "DR", "Demand Response"))
+
+    app = web.Application()
+    app.router.add_get("/vtn_url/events", events)
+    app.router.add_delete("/vtn_url/programs/{id}", program)
+    return await aiohttp_client(app), requests  # type: ignore[return-value]
+
+
+async def test_client_rate_limited(limited_vtn: tuple[ClientSession, list[float]]) -> None:
+    session, requests = limited_vtn
+    limiter = RateLimiter(rate=1000, burst=5, endpoint_limits={"/events": (50, 1)})
+    client = ToadrClient("vtn_url", None, session, rate_limiter=limiter)
+
+    with pytest.raises(ToadrError, match="Slow down"):
+        _ = await client.get_events()
+
+    _ = await asyncio.gather(*(client.get_events() for _ in range(3)))
+    assert len(requests) == 4
+    assert requests[-1] - requests[0] >= 0.055
+
+    # other endpoints only use the global bucket
+    requests.clear()
+    _ = await asyncio.gather(*(client.delete_program("1") for _ in range(3)))
+    assert len(requests) == 3
+    assert requests[-1] - requests[0] < 0.02
+
+
+async def test_client_rate_limited_non_json(aiohttp_client: AiohttpClient) -> None:
+    async def events(_request: web.Request) -> web.Response:
+        return web.Response(status=429, text="Slow down", headers={"Retry-After": "5"})
+
+    app = web.Application()
+    app.router.add_get("/vtn_url/events", events)
+    session = await aiohttp_client(app)
+    limiter = RateLimiter(rate=10, burst=10)
+    client = ToadrClient("vtn_url", None, session, rate_limiter=limiter)  # type: ignore[arg-type]
+
+    with pytest.raises(ToadrError) as e:
+        _ = await client.get_events()
+
+    assert e.value.status_code == 429
+    assert limiter.global_bucket is not None
+    assert limiter.global_bucket.tokens <= 1
@@ -0,0 +1,93 @@
+import pytest
+from _common_test_utils import create_problem_response
+from aiohttp import web
+from aiohttp.pytest_plugin import AiohttpServer
+from testdata import create_events, create_program
+
+from toadr3 import RequestMetrics, RequestTimings, ToadrClient, ToadrError
+from toadr3.request_metrics import PHASES, endpoint_name
+
+
+@pytest.fixture
+async def vtn_url(aiohttp_server: AiohttpServer) -> str:
+    """URL of a VTN with events and programs."""
+
+    async def events(_request: web.Request) -> web.Response:
+        return web.json_response(data=create_events())
+
+    async def program(request: web.Request) -> web.Response:
+        if request.match_info["program_id"] == "missing":
+            return create_problem_response("Bad Gateway", 502, "Upstream failed")
+        return web.json_response(data=create_program(request.match_info["program_id"], "a", "b"))
+
+    app = web.Application()
+    app.router.add_get("/vtn_url/events", events)
+    app.router.add_delete("/vtn_url/programs/{program_id}", program)
+    server = await aiohttp_server(app)
+    return str(server.make_url("/vtn_url"))
+
+
+async def test_request_metrics(vtn_url: str) -> None:
+    recorded: list[RequestTimings] = []
+    metrics = RequestMetrics(on_request=recorded.append)
+
+    async with ToadrClient(vtn_url, None, metrics=metrics) as client:
+        assert client.metrics is metrics
+        _ = await client.get_events()
+        _ = await client.get_events()
+        _ = await client.delete_program("37")
+
+    assert metrics.endpoints == ["GET /events", "DELETE /programs/{id}"]
+    assert [timings.status for timings in recorded] == [200, 200, 200]
+
+    first, second, _ = recorded
+    # only the first request opens a connection
+    assert first.connect is not None
+    assert second.connect is None
+    for timings in recorded:
+        assert timings.waiting is not None
+        assert timings.transfer is not None
+        assert timings.validation is not None
+        assert timings.total is not None
+        assert timings.total >= timings.waiting + timings.transfer + timings.validation
+
+    stats = metrics.stats("GET /events")
+    assert stats["total"].count == 2
+    assert stats["connect"].count == 1
+    assert stats["total"].max >= stats["total"].mean > 0
+    assert set(metrics.summary()["GET /events"]) <= set(PHASES)
+    assert "GET /events 200" in repr(first)
+
+    metrics.clear()
+    assert metrics.endpoints == []
+    assert metrics.stats("GET /events") == {}
+
+
+async def test_request_metrics_error(vtn_url: str) -> None:
+    recorded: list[RequestTimings] = []
+    metrics = RequestMetrics(on_request=recorded.append)
+
+    async with ToadrClient(vtn_url, None, metrics=metrics) as client:
+        with pytest.raises(ToadrError):
+            _ = await client.delete_program("missing")
+
+    (timings,) = recorded
+    assert timings.status == 502
+    assert timings.waiting is not None
+    assert timings.validation is None
+    assert timings.total is not None
+    assert "validation" not in metrics.stats("DELETE /programs/{id}")
+
+
+@pytest.mark.parametrize(
+    ("url", "endpoint"),
+    [
+        ("https://vtn.example.com/openadr3/3.0.1/events", "/events"),
+        ("https://vtn.example.com/openadr3/3.0.1/programs/37", "/programs/{id}"),
+        ("https://vtn.example.com/subscriptions/", "/subscriptions"),
+        ("https://vtn.example.com/reports?skip=10", "/reports"),
+        ("https://vtn.example.com/auth/token", "/auth/token"),
+    ],
+)
+def test_endpoint_name(url: str, endpoint: str) -> None:
+    assert endpoint_name(url) == endpoint
@@ -0,0 +1,143 @@
+import functools
+
+import pytest
+from aiohttp import ClientSession, web
+from aiohttp.pytest_plugin import AiohttpClient
+from testdata import create_events
+
+from toadr3 import AccessToken, ResponseCache, ToadrClient, get_events
+from toadr3.models import LazyEvent
+
+
+@pytest.fixture
+async def etag_session(aiohttp_client: AiohttpClient) -> tuple[ClientSession, list[str | None]]:
+    """Session towards a VTN that sends an ETag for events and answers 304 when unchanged."""
+    conditions: list[str | None] = []
+    version = {"etag": '"1"'}
+
+    async def events(request: web.Request) -> web.Response:
+        conditions.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == version["etag"]:
+            return web.Response(status=304)
+
+        events = create_events()
+        if version["etag"] != '"1"':
+            events = events[:2]
+        return web.json_response(data=events, headers={"ETag": version["etag"]})
+
+    async def update(_request: web.Request) -> web.Response:
+        version["etag"] = '"2"'
+        return web.json_response(data={})
+
+    app = web.Application()
+    app.router.add_get("/vtn_url/events", events)
+    app.router.add_post("/vtn_url/update", update)
+    return await aiohttp_client(app), conditions  # type: ignore[return-value]
+
+
+async def test_response_cache_etag(
+    etag_session: tuple[ClientSession, list[str | None]], token: AccessToken
+) -> None:
+    session, conditions = etag_session
+    cache = ResponseCache()
+
+    events = await get_events(session, "vtn_url", token, cache=cache)
+    same_events = await get_events(session, "vtn_url", token, cache=cache)
+
+    assert len(events) == 5
+    assert same_events is events
+    assert conditions == [None, '"1"']
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # a different query is cached separately
+    _ = await get_events(session, "vtn_url", token, program_id="34", cache=cache)
+    assert conditions[-1] is None
+    assert len(cache) == 2
+
+    await session.post("/vtn_url/update")
+    new_events = await get_events(session, "vtn_url", token, cache=cache)
+    assert len(new_events) == 2
+    assert conditions[-1] == '"1"'
+    assert (cache.hits, cache.misses) == (1, 3)
+
+
+async def test_response_cache_parsers(
+    etag_session: tuple[ClientSession, list[str | None]], token: AccessToken
+) -> None:
+    session, conditions = etag_session
+    cache = ResponseCache()
+
+    events = await get_events(session, "vtn_url", token, cache=cache)
+    trusted = await get_events(session, "vtn_url", token, validation="trusted", cache=cache)
+    lazy = await get_events(session, "vtn_url", token, lazy=True, cache=cache)
+
+    # results of different parsers are never shared
+    assert trusted is not events
+    assert all(type(event) is LazyEvent for event in lazy)
+    assert conditions == [None, None, None]
+    assert len(cache) == 3
+
+    assert await get_events(session, "vtn_url", token, lazy=True, cache=cache) is lazy
+    assert conditions[-1] == '"1"'
+
+
+async def test_response_cache_body_hash(client: ToadrClient) -> None:
+    # the default test VTN does not send any validators
+    cache = ResponseCache()
+    client = ToadrClient(
+        client.vtn_url,
+        client._oauth_config,  # noqa: SLF001
+        client.client_session,
+        response_cache=cache,
+    )
+
+    programs = await client.get_programs()
+    same_programs = await client.get_programs()
+    program = await client.get_program("0")
+    same_program = await client.get_program("0")
+
+    assert same_programs is programs
+    assert same_program is program
+    assert (cache.hits, cache.misses) == (2, 2)
+
+
+async def test_response_cache_eviction(session: ClientSession, token: AccessToken) -> None:
+    cache = ResponseCache(max_entries=2)
+
+    first = await get_events(session, "vtn_url", token, program_id="34", cache=cache)
+    _ = await get_events(session, "vtn_url", token, program_id="35", cache=cache)
+    assert await get_events(session, "vtn_url", token, program_id="34", cache=cache) is first
+
+    _ = await get_events(session, "vtn_url", token, cache=cache)
+    assert len(cache) == 2
+    # program 35 was the least recently used entry
+    misses = cache.misses
+    _ = await get_events(session, "vtn_url", token, program_id="35", cache=cache)
+    assert cache.misses == misses + 1
+
+
+def test_response_cache_key() -> None:
+    key = ResponseCache.create_key(
+        "url", {"b": ["2", "1"], "a": 3}, {"Authorization": "Bearer x", "X-Custom": "1"}
+    )
+    same_key = ResponseCache.create_key(
+        "url", {"a": "3", "b": ["1", "2"]}, {"x-custom": "1", "Authorization": "Bearer y"}
+    )
+
+    assert key == same_key
+    assert key == ("url", (("a", "3"), ("b", "1"), ("b", "2")), (("x-custom", "1"),), None)
+
+    # equivalent partial functions are the same parser
+    parser = functools.partial(int, base=2)
+    assert ResponseCache.create_key("url", None, None, parser) == ResponseCache.create_key(
+        "url", None, None, functools.partial(int, base=2)
+    )
+    assert ResponseCache.create_key("url", None, None, parser) != ResponseCache.create_key(
+        "url", None, None, functools.partial(int, base=8)
+    )
+
+
+@pytest.mark.parametrize("max_entries", [0, -1, None])
+def test_response_cache_invalid_size(max_entries: int) -> None:
+    with pytest.raises(ValueError, match="max_entries must be a positive integer"):
+        _ = ResponseCache(max_entries=max_entries)
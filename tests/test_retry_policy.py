@@ -0,0 +1,196 @@
+import datetime
+import email.utils
+
+import pytest
+from _common_test_utils import create_problem_response
+from aiohttp import ClientSession, ServerDisconnectedError, web
+from aiohttp.pytest_plugin import AiohttpClient
+from testdata import create_events, create_report, default_report_model
+
+from toadr3 import RetryPolicy, ToadrClient, ToadrError, get_events, post_report
+from toadr3.retry_policy import parse_retry_after
+
+NO_DELAY = RetryPolicy(max_attempts=3, base_delay=0, max_delay=0)
+
+
+@pytest.fixture
+async def flaky_session(aiohttp_client: AiohttpClient) -> tuple[ClientSession, list[int]]:
+    """Session towards a VTN that fails with the statuses in the returned list before succeeding.
+
+    The statuses are consumed one per request.
+    """
+    failures: list[int] = []
+
+    def failure() -> web.Response | None:
+        if not failures:
+            return None
+        status = failures.pop(0)
+        response = create_problem_response("Failure", status, "Flaky VTN")
+        if status in (429, 503):
+            response.headers["Retry-After"] = "0"
+        return response
+
+    async def events(_request: web.Request) -> web.Response:
+        return failure() or web.json_response(data=create_events())
+
+    async def reports(_request: web.Request) -> web.Response:
+        return failure() or web.json_response(data=create_report())
+
+    app = web.Application()
+    app.router.add_get("/vtn_url/events", events)
+    app.router.add_post("/vtn_url/reports", reports)
+    return await aiohttp_client(app), failures  # type: ignore[return-value]
+
+
+async def test_retry_get(flaky_session: tuple[ClientSession, list[int]]) -> None:
+    session, failures = flaky_session
+    failures.extend([500, 503])
+
+    events = await get_events(session, "vtn_url", None, retry_policy=NO_DELAY)
+
+    assert len(events) == 5
+    assert failures == []
+
+
+async def test_retry_gives_up(flaky_session: tuple[ClientSession, list[int]]) -> None:
+    session, failures = flaky_session
+    failures.extend([500, 502, 504, 500])
+
+    with pytest.raises(ToadrError, match="Flaky VTN") as e:
+        _ = await get_events(session, "vtn_url", None, retry_policy=NO_DELAY)
+
+    assert e.value.status_code == 504
+    assert failures == [500]
+
+
+async def test_retry_non_json_error(aiohttp_client: AiohttpClient) -> None:
+    attempts = 0
+
+    async def events(_request: web.Request) -> web.Response:
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            return web.Response(
+                status=503,
+                text="<html><body>Service Unavailable</body></html>",
+                content_type="text/html",
+                headers={"Retry-After": "0"},
+            )
+        return web.json_response(data=create_events())
+
+    app = web.Application()
+    app.router.add_get("/vtn_url/events", events)
+    session = await aiohttp_client(app)
+
+    events_ = await get_events(session, "vtn_url", None, retry_policy=RetryPolicy(base_delay=0))  # type: ignore[arg-type]
+
+    assert len(events_) == 5
+    assert attempts == 2
+
+
+async def test_retry_not_retryable_status(flaky_session: tuple[ClientSession, list[int]]) -> None:
+    session, failures = flaky_session
+    failures.extend([400])
+
+    with pytest.raises(ToadrError) as e:
+        _ = await get_events(session, "vtn_url", None, retry_policy=NO_DELAY)
+
+    assert e.value.status_code == 400
+
+
+async def test_retry_without_policy(flaky_session: tuple[ClientSession, list[int]]) -> None:
+    session, failures = flaky_session
+    failures.extend([500])
+
+    with pytest.raises(ToadrError):
+        _ = await get_events(session, "vtn_url", None)
+
+
+async def test_retry_post_requires_idempotency_key(
+    flaky_session: tuple[ClientSession, list[int]],
+) -> None:
+    session, failures = flaky_session
+    client = ToadrClient("vtn_url", None, session, retry_policy=NO_DELAY)
+    failures.extend([500])
+
+    with pytest.raises(ToadrError):
+        _ = await client.post_report(default_report_model())
+
+    failures.extend([500])
+    report = await post_report(
+        session,
+        "vtn_url",
+        None,
+        default_report_model(),
+        custom_headers={"Idempotency-Key": "report-1"},
+        retry_policy=NO_DELAY,
+    )
+    assert report.id is not None
+    assert failures == []
+
+
+def test_retryable_request() -> None:
+    policy = RetryPolicy()
+
+    assert policy.is_retryable_request("GET", {})
+    assert policy.is_retryable_request("put", {})
+    assert policy.is_retryable_request("DELETE", {})
+    assert not policy.is_retryable_request("POST", {})
+    assert policy.is_retryable_request("POST", {"idempotency-key": "1"})
+
+
+def test_retry_delay() -> None:
+    policy = RetryPolicy(max_attempts=3, base_delay=1, max_delay=4, deadline=10)
+    error = ToadrError("failed", 500)
+
+    first = policy.retry_delay(error, 1, 0, None)
+    assert first is not None
+    assert 1 <= first <= 3
+    assert policy.retry_delay(error, 3, 0, None) is None
+    assert policy.retry_delay(error, 1, 9.5, None) is None
+    assert policy.retry_delay(ToadrError("failed", 404), 1, 0, None) is None
+    assert policy.retry_delay(ServerDisconnectedError(), 1, 0, None) is not None
+    assert policy.retry_delay(ValueError(), 1, 0, None) is None
+
+    for _ in range(100):
+        delay = policy.backoff(3)
+        assert 1 <= delay <= 4
+
+
+def test_retry_delay_retry_after() -> None:
+    policy = RetryPolicy(base_delay=1, max_delay=4, deadline=10)
+
+    error = ToadrError("failed", 429, headers={"Retry-After": "7"})
+    assert policy.retry_delay(error, 1, 0, None) == 7
+    assert policy.retry_delay(error, 1, 5, None) is None
+
+    # Retry-After is only honored for 429 and 503
+    error = ToadrError("failed", 500, headers={"Retry-After": "7"})
+    delay = policy.retry_delay(error, 1, 0, None)
+    assert delay is not None
+    assert delay <= 3
+
+
+def test_parse_retry_after() -> None:
+    retry_at = datetime.datetime.now(tz=datetime.UTC) + datetime.timedelta(seconds=30)
+
+    assert parse_retry_after("120") == 120
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+    delay = parse_retry_after(email.utils.format_datetime(retry_at, usegmt=True))
+    assert delay is not None
+    assert 25 < delay <= 30
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "msg"),
+    [
+        ({"max_attempts": 0}, "max_attempts must be a positive integer"),
+        ({"base_delay": 5, "max_delay": 1}, "base_delay must be positive"),
+        ({"deadline": 0}, "deadline must be a positive number or None"),
+    ],
+)
+def test_invalid_retry_policy(kwargs: dict[str, float], msg: str) -> None:
+    with pytest.raises(ValueError, match=msg):
+        _ = RetryPolicy(**kwargs)  # type: ignore[arg-type]
@@ -0,0 +1,160 @@
+import asyncio
+
+import pytest
+from aiohttp import web
+from aiohttp.pytest_plugin import AiohttpClient
+from testdata import create_events, create_program
+
+from toadr3 import ToadrClient
+from toadr3._internal import SingleFlight, freeze
+
+
+@pytest.fixture
+async def slow_client(aiohttp_client: AiohttpClient) -> tuple[ToadrClient, list[str]]:
+    """Client towards a VTN that answers slowly and records every request."""
+    requests: list[str] = []
+
+    async def events(request: web.Request) -> web.Response:
+        requests.append(request.path_qs)
+        await asyncio.sleep(0.05)
+        return web.json_response(data=create_events())
+
+    async def program(request: web.Request) -> web.Response:
+        requests.append(request.path_qs)
+        await asyncio.sleep(0.05)
+        return web.json_response(
+            data=create_program(request.match_info["id"], "DR", "Demand Response")
+        )
+
+    app = web.Application()
+    app.router.add_get("/vtn_url/events", events)
+    app.router.add_get("/vtn_url/programs/{id}", program)
+    session = await aiohttp_client(app)
+    client = ToadrClient("vtn_url", None, session, coalesce_requests=True)  # type: ignore[arg-type]
+    return client, requests
+
+
+async def test_coalesce_identical_requests(slow_client: tuple[ToadrClient, list[str]]) -> None:
+    client, requests = slow_client
+
+    results = await asyncio.gather(*(client.get_events(program_id="34") for _ in range(10)))
+
+    assert requests == ["/vtn_url/events?programID=34"]
+    assert all(result is results[0] for result in results)
+
+
+async def test_coalesce_different_requests(slow_client: tuple[ToadrClient, list[str]]) -> None:
+    client, requests = slow_client
+
+    programs = await asyncio.gather(
+        client.get_program("1"),
+        client.get_program("2"),
+        client.get_program("1"),
+        client.get_program("1", custom_headers={"X-Custom-Header": "CustomValue"}),
+    )
+
+    assert sorted(requests) == ["/vtn_url/programs/1", "/vtn_url/programs/1", "/vtn_url/programs/2"]
+    assert programs[0] is programs[2]
+    assert programs[0] is not programs[3]
+
+    # finished requests are not reused
+    _ = await client.get_program("1")
+    assert len(requests) == 4
+
+
+async def test_coalesce_cancelled_caller(slow_client: tuple[ToadrClient, list[str]]) -> None:
+    client, requests = slow_client
+
+    first = asyncio.create_task(client.get_events())
+    second = asyncio.create_task(client.get_events())
+    await asyncio.sleep(0.01)
+    first.cancel()
+
+    events = await second
+    assert len(events) == 5
+    assert first.cancelled()
+    assert len(requests) == 1
+
+
+async def test_coalesce_different_deadlines(slow_client: tuple[ToadrClient, list[str]]) -> None:
+    client, requests = slow_client
+
+    first = asyncio.create_task(client.get_events(timeout=0.02))
+    second = asyncio.create_task(client.get_events(timeout=1))
+
+    # the deadline of the first caller does not apply to the shared request
+    with pytest.raises(TimeoutError):
+        await first
+    events = await second
+    assert len(events) == 5
+    assert len(requests) == 1
+
+
+async def test_single_flight_cancelled_when_all_callers_cancelled() -> None:
+    single_flight = SingleFlight()
+    cancelled = asyncio.Event()
+
+    async def call() -> int:
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return 1  # pragma: no cover
+
+    callers = [asyncio.create_task(single_flight.do("key", call)) for _ in range(3)]
+    await asyncio.sleep(0)
+    assert len(single_flight) == 1
+
+    for caller in callers:
+        caller.cancel()
+
+    await asyncio.wait_for(cancelled.wait(), timeout=1)
+    await asyncio.sleep(0)
+    assert len(single_flight) == 0
+
+
+async def test_single_flight_new_call_after_cancellation() -> None:
+    single_flight = SingleFlight()
+    calls = 0
+
+    async def call() -> int:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return calls
+
+    first = asyncio.create_task(single_flight.do("key", call))
+    await asyncio.sleep(0)
+    first.cancel()
+    # arrives while the cancelled call is still finishing
+    second = asyncio.create_task(single_flight.do("key", call))
+
+    assert await second == 2
+    assert first.cancelled()
+    assert len(single_flight) == 0
+
+
+async def test_single_flight_shares_exceptions() -> None:
+    single_flight = SingleFlight()
+    calls = 0
+
+    async def call() -> int:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        raise ValueError("failed")
+
+    results = await asyncio.gather(
+        single_flight.do("key", call), single_flight.do("key", call), return_exceptions=True
+    )
+
+    assert calls == 1
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+def test_freeze() -> None:
+    key = freeze({"b": ["1", "2"], "a": {"y": None, "x": 1}})
+
+    assert key == (("a", (("x", 1), ("y", None))), ("b", ("1", "2")))
+    assert hash(key) == hash(freeze({"a": {"x": 1, "y": None}, "b": ["1", "2"]}))
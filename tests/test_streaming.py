@@ -0,0 +1,136 @@
+import asyncio
+import json
+
+import pytest
+from aiohttp import web
+from aiohttp.pytest_plugin import AiohttpServer
+from testdata import create_events
+
+from toadr3 import ToadrClient, ToadrError, stream_events
+from toadr3._internal.json_stream import JsonArraySplitter
+
+ITEMS = [
+    {"id": "1", "name": 'a "quoted" [name] with {braces}', "values": [1, [2, 3]]},
+    {"id": "2", "name": "back\\slash\\", "nested": {"list": [{"a": None}]}},
+    {"id": "3", "name": "unicode æøå ☃", "escaped": '\\"}'},
+]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 64, 10_000])
+def test_json_array_splitter(chunk_size: int) -> None:
+    body = json.dumps(ITEMS, indent=2, ensure_ascii=False).encode()
+    splitter = JsonArraySplitter()
+
+    items = []
+    for i in range(0, len(body), chunk_size):
+        items.extend(splitter.feed(body[i : i + chunk_size]))
+    splitter.close()
+
+    assert [json.loads(item) for item in items] == ITEMS
+
+
+def test_json_array_splitter_empty() -> None:
+    splitter = JsonArraySplitter()
+    assert splitter.feed(b" [ ] ") == []
+    splitter.close()
+
+
+@pytest.mark.parametrize(
+    ("body", "msg"),
+    [
+        (b'{"id": "1"}', "Expected result to be a list."),
+        (b'[{"id": "1"}', "Incomplete JSON array."),
+        (b'[{"id": "1"}]]', "Unexpected data after the JSON array."),
+        (b"", "Incomplete JSON array."),
+    ],
+)
+def test_json_array_splitter_invalid(body: bytes, msg: str) -> None:
+    def split() -> list[bytes]:
+        splitter = JsonArraySplitter()
+        items = splitter.feed(body)
+        splitter.close()
+        return items
+
+    with pytest.raises(ValueError, match=msg):
+        _ = split()
+
+
+async def test_stream_events(client: ToadrClient) -> None:
+    events = [event async for event in client.stream_events(program_id="34")]
+
+    assert events == await client.get_events(program_id="34")
+    assert len(events) == 3
+
+
+async def test_stream_reports(client: ToadrClient) -> None:
+    reports = [report async for report in client.stream_reports(limit=1)]
+
+    assert reports == await client.get_reports(limit=1)
+    assert len(reports) == 1
+
+
+async def test_stream_events_errors(client: ToadrClient) -> None:
+    with pytest.raises(ToadrError):
+        _ = [e async for e in client.stream_events(custom_headers={"X-Custom-Header": "Wrong"})]
+
+    with pytest.raises(ValueError, match="Expected result to be a list"):
+        _ = [e async for e in client.stream_events(custom_headers={"X-result-type": "dict"})]
+
+
+@pytest.fixture
+async def slow_vtn(aiohttp_server: AiohttpServer) -> tuple[str, asyncio.Event]:
+    """URL of a VTN that sends the first event, then waits before sending the rest."""
+    resume = asyncio.Event()
+
+    async def events(request: web.Request) -> web.StreamResponse:
+        response = web.StreamResponse(headers={"Content-Type": "application/json"})
+        _ = await response.prepare(request)
+        first, *rest = create_events()
+        await response.write(b"[" + json.dumps(first).encode())
+        await resume.wait()
+        for event in rest:
+            await response.write(b"," + json.dumps(event).encode())
+        await response.write(b"]")
+        return response
+
+    app = web.Application()
+    app.router.add_get("/vtn_url/events", events)
+    server = await aiohttp_server(app)
+    return str(server.make_url("/vtn_url")), resume
+
+
+async def test_stream_events_incremental(slow_vtn: tuple[str, asyncio.Event]) -> None:
+    url, resume = slow_vtn
+
+    async with ToadrClient(url, None) as client:
+        stream = client.stream_events()
+        first = await asyncio.wait_for(anext(stream), 1)
+        assert first.id == create_events()[0]["id"]
+
+        resume.set()
+        rest = [event async for event in stream]
+        assert [event.id for event in rest] == [event["id"] for event in create_events()[1:]]
+
+
+async def test_stream_events_timeout(slow_vtn: tuple[str, asyncio.Event]) -> None:
+    url, resume = slow_vtn
+
+    async with ToadrClient(url, None) as client:
+        stream = client.stream_events(timeout=0.1)
+        _ = await anext(stream)
+        # the deadline passes while the caller handles an event, so the next read times out
+        await asyncio.sleep(0.2)
+        with pytest.raises(TimeoutError):
+            _ = await anext(stream)
+        resume.set()
+
+
+async def test_stream_events_function(slow_vtn: tuple[str, asyncio.Event]) -> None:
+    url, resume = slow_vtn
+    resume.set()
+
+    async with ToadrClient(url, None) as client:
+        events = [
+            event async for event in stream_events(client.client_session, url, None, limit=10)
+        ]
+    assert len(events) == len(create_events())
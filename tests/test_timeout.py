@@ -0,0 +1,124 @@
+import asyncio
+
+import pytest
+from _common_test_utils import create_problem_response
+from aiohttp import ClientSession, web
+from aiohttp.pytest_plugin import AiohttpClient
+from testdata import create_events
+
+from toadr3 import RetryPolicy, ToadrClient, ToadrError
+
+
+@pytest.fixture
+async def slow_session(aiohttp_client: AiohttpClient) -> tuple[ClientSession, list[str]]:
+    """Session towards a VTN that takes 40 ms per request and records every request.
+
+    The /failing/events endpoint always fails with 500, the /busy/events endpoint always fails
+    with 503 and asks to retry after 30 seconds.
+    """
+    requests: list[str] = []
+
+    async def events(request: web.Request) -> web.Response:
+        requests.append(request.path_qs)
+        await asyncio.sleep(0.04)
+        skip = int(request.query.get("skip", 0))
+        limit = int(request.query.get("limit", 5))
+        data = [event | {"id": str(skip + i)} for i, event in enumerate(create_events())]
+        return web.json_response(data=data[:limit])
+
+    async def failing(request: web.Request) -> web.Response:
+        requests.append(request.path_qs)
+        await asyncio.sleep(0.04)
+        return create_problem_response("Failure", 500, "Failing VTN")
+
+    async def busy(request: web.Request) -> web.Response:
+        requests.append(request.path_qs)
+        await asyncio.sleep(0.04)
+        response = create_problem_response("Busy", 503, "Busy VTN")
+        response.headers["Retry-After"] = "30"
+        return response
+
+    app = web.Application()
+    app.router.add_get("/vtn_url/events", events)
+    app.router.add_get("/failing/events", failing)
+    app.router.add_get("/busy/events", busy)
+    return await aiohttp_client(app), requests  # type: ignore[return-value]
+
+
+async def test_timeout(slow_session: tuple[ClientSession, list[str]]) -> None:
+    session, _ = slow_session
+    client = ToadrClient("vtn_url", None, session)
+
+    with pytest.raises(TimeoutError):
+        _ = await client.get_events(timeout=0.01)
+
+    assert len(await client.get_events(timeout=1)) == 5
+
+
+async def test_default_timeout(slow_session: tuple[ClientSession, list[str]]) -> None:
+    session, _ = slow_session
+    client = ToadrClient("vtn_url", None, session, default_timeout=0.01)
+
+    with pytest.raises(TimeoutError):
+        _ = await client.get_events()
+
+    # an explicit timeout or deadline replaces the default
+    assert len(await client.get_events(timeout=1)) == 5
+    loop = asyncio.get_running_loop()
+    assert len(await client.get_events(deadline=loop.time() + 1)) == 5
+
+
+async def test_deadline(slow_session: tuple[ClientSession, list[str]]) -> None:
+    session, _ = slow_session
+    client = ToadrClient("vtn_url", None, session)
+    loop = asyncio.get_running_loop()
+
+    with pytest.raises(TimeoutError):
+        _ = await client.get_events(deadline=loop.time() + 0.01)
+
+    # the earlier of timeout and deadline applies
+    with pytest.raises(TimeoutError):
+        _ = await client.get_events(timeout=1, deadline=loop.time() + 0.01)
+
+
+async def test_timeout_includes_retries(slow_session: tuple[ClientSession, list[str]]) -> None:
+    session, requests = slow_session
+    retry_policy = RetryPolicy(max_attempts=10, base_delay=0, max_delay=0)
+    client = ToadrClient("failing", None, session, retry_policy=retry_policy)
+
+    with pytest.raises(TimeoutError):
+        _ = await client.get_events(timeout=0.1)
+
+    assert 2 <= len(requests) <= 3
+
+
+async def test_timeout_stops_retries(slow_session: tuple[ClientSession, list[str]]) -> None:
+    session, requests = slow_session
+    retry_policy = RetryPolicy(max_attempts=10, base_delay=0, deadline=None)
+    client = ToadrClient("busy", None, session, retry_policy=retry_policy)
+    loop = asyncio.get_running_loop()
+
+    # the retry after 30 seconds cannot complete in time, the error is raised at once
+    started = loop.time()
+    with pytest.raises(ToadrError, match="Busy VTN") as e:
+        _ = await client.get_events(timeout=2)
+
+    assert e.value.status_code == 503
+    assert loop.time() - started < 1
+    assert len(requests) == 1
+
+
+async def test_timeout_iteration(slow_session: tuple[ClientSession, list[str]]) -> None:
+    session, requests = slow_session
+    client = ToadrClient("vtn_url", None, session)
+    events = []
+
+    async def collect() -> None:
+        async for event in client.iter_events(page_size=2, timeout=0.1):
+            events.append(event)
+
+    with pytest.raises(TimeoutError):
+        await collect()
+
+    assert 1 <= len(requests) <= 3
+    assert len(events) == 2 * (len(requests) - 1)
@@ -0,0 +1,110 @@
+import asyncio
+import time
+
+import pytest
+from aiohttp import web
+from aiohttp.pytest_plugin import AiohttpServer
+
+from toadr3 import AccessToken, OAuthScopeConfig, ToadrClient, TokenCache, shared_token_cache
+
+
+@pytest.fixture
+async def token_url(aiohttp_server: AiohttpServer) -> str:
+    """URL of a token server that issues a new token for every request after a short delay."""
+    issued = 0
+
+    async def token(_request: web.Request) -> web.Response:
+        nonlocal issued
+        issued += 1
+        await asyncio.sleep(0.01)
+        return web.json_response(
+            {"token_type": "Bearer", "expires_in": 3600, "access_token": f"token{issued}"}
+        )
+
+    app = web.Application()
+    app.router.add_post("/token", token)
+    server = await aiohttp_server(app)
+    return str(server.make_url("/token"))
+
+
+def create_config(token_url: str, scope: str = "test_scope") -> OAuthScopeConfig:
+    return OAuthScopeConfig(
+        token_url=token_url,
+        grant_type="client_credentials",
+        scope=scope,
+        client_id="test_client_id",
+        client_secret="test_client_secret",
+    )
+
+
+async def test_shared_token(token_url: str) -> None:
+    cache = TokenCache()
+    clients = [
+        ToadrClient("vtn_url", create_config(token_url), token_cache=cache) for _ in range(100)
+    ]
+    other = ToadrClient("vtn_url", create_config(token_url, "other_scope"), token_cache=cache)
+    assert clients[0].token_cache is cache
+
+    # all clients start at once and share one token request
+    tokens = await asyncio.gather(*(client.token for client in clients))
+    assert {token.token for token in tokens if token is not None} == {"token1"}
+
+    other_token = await other.token
+    assert other_token is not None
+    assert other_token.token == "token2"
+    assert len(cache) == 2
+
+    # once the shared token expires, the token refreshed by one client is used by the others
+    token = tokens[0]
+    assert token is not None
+    token._refresh_at_ns = time.monotonic_ns()  # noqa: SLF001
+    new_token = await clients[0].token
+    assert new_token is not None
+    assert new_token.token == "token3"
+    assert await clients[1].token is new_token
+
+    for client in [*clients, other]:
+        await client.close()
+
+
+async def test_stale_token() -> None:
+    cache = TokenCache()
+    config = create_config("https://idp.example.com/token")
+    issued: list[AccessToken] = []
+
+    async def fetch() -> AccessToken:
+        issued.append(AccessToken(f"token{len(issued) + 1}", 3600))
+        return issued[-1]
+
+    first = await cache.get(config, fetch)
+    assert await cache.get(config, fetch) is first
+    assert cache.get_cached(config) is first
+
+    # a stale token is replaced even though it has not expired
+    second = await cache.get(config, fetch, stale=first)
+    assert second is not first
+    # another client holding the stale token gets the replacement
+    assert await cache.get(config, fetch, stale=first) is second
+
+    await cache.invalidate(config, first)
+    assert cache.get_cached(config) is second
+    await cache.invalidate(config)
+    assert cache.get_cached(config) is None
+    assert len(issued) == 2
+
+
+async def test_evict_expired() -> None:
+    cache = TokenCache()
+    configs = [create_config("https://idp.example.com/token", f"scope{i}") for i in range(3)]
+
+    for config in configs:
+        _ = await cache.get(config, lambda: asyncio.sleep(0, AccessToken("token", 30)))
+    assert len(cache) == 1
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_shared_token_cache() -> None:
+    assert isinstance(shared_token_cache(), TokenCache)
+    assert shared_token_cache() is shared_token_cache()
@@ -0,0 +1,172 @@
+import asyncio
+
+import pytest
+from aiohttp import web
+from aiohttp.pytest_plugin import AiohttpServer
+
+from toadr3 import OAuthScopeConfig, ToadrClient, ToadrError, TokenRefreshPolicy
+
+
+@pytest.fixture
+async def token_server(aiohttp_server: AiohttpServer) -> tuple[OAuthScopeConfig, list[int]]:
+    """OAuth config of a token server and the statuses of its responses.
+
+    The statuses are popped from the list, requests without a status get a new token.
+    """
+    statuses: list[int] = []
+    issued = 0
+
+    async def token(_request: web.Request) -> web.Response:
+        nonlocal issued
+        status = statuses.pop(0) if statuses else 200
+        if status != 200:
+            return web.json_response({"error": "temporarily_unavailable"}, status=status)
+        issued += 1
+        return web.json_response(
+            {"token_type": "Bearer", "expires_in": 3600, "access_token": f"token{issued}"}
+        )
+
+    app = web.Application()
+    app.router.add_post("/token", token)
+    server = await aiohttp_server(app)
+    config = OAuthScopeConfig(
+        token_url=str(server.make_url("/token")),
+        grant_type="client_credentials",
+        scope="test_scope",
+        client_id="test_client_id",
+        client_secret="test_client_secret",
+    )
+    return config, statuses
+
+
+async def test_background_refresh(token_server: tuple[OAuthScopeConfig, list[int]]) -> None:
+    config, _ = token_server
+    # refresh after about 0.35 seconds of the 3540 seconds until the token is considered expired
+    policy = TokenRefreshPolicy(refresh_ratio=0.0001, jitter=0)
+
+    async with ToadrClient("vtn_url", config, token_refresh_policy=policy) as client:
+        assert client.token_refresh_policy is policy
+        token = await client.token
+        assert token is not None
+        assert token.token == "token1"
+
+        await asyncio.sleep(0.5)
+        token = await client.token
+        assert token is not None
+        assert token.token == "token2"
+
+    assert client._token_refresh_task is None  # noqa: SLF001
+
+
+async def test_background_refresh_failure(
+    token_server: tuple[OAuthScopeConfig, list[int]],
+) -> None:
+    config, statuses = token_server
+    errors: list[BaseException] = []
+    policy = TokenRefreshPolicy(
+        refresh_ratio=0.0001, jitter=0, base_delay=0.01, max_delay=0.02, on_error=errors.append
+    )
+
+    async with ToadrClient("vtn_url", config, token_refresh_policy=policy) as client:
+        token = await client.token
+        assert token is not None
+
+        statuses[:] = [503, 503]
+        await asyncio.sleep(0.5)
+
+        # the current token was used until the refresh succeeded
+        assert len(errors) == 2
+        assert all(isinstance(error, ToadrError) for error in errors)
+        token = await client.token
+        assert token is not None
+        assert token.token == "token2"
+
+
+async def test_background_refresh_before_skew(aiohttp_server: AiohttpServer) -> None:
+    issued = 0
+
+    async def issue(_request: web.Request) -> web.Response:
+        nonlocal issued
+        issued += 1
+        return web.json_response(
+            {"token_type": "Bearer", "expires_in": 1, "access_token": f"token{issued}"}
+        )
+
+    app = web.Application()
+    app.router.add_post("/token", issue)
+    server = await aiohttp_server(app)
+    config = OAuthScopeConfig(
+        token_url=str(server.make_url("/token")),
+        grant_type="client_credentials",
+        scope="test_scope",
+        client_id="test_client_id",
+        client_secret="test_client_secret",
+        expiry_skew=0.5,
+    )
+    policy = TokenRefreshPolicy(refresh_ratio=0.9, jitter=0)
+
+    async with ToadrClient("vtn_url", config, token_refresh_policy=policy) as client:
+        _ = await client.token
+
+        # refreshed after 0.45 seconds, before the token is considered expired after 0.5 seconds
+        await asyncio.sleep(0.7)
+        token = client._token  # noqa: SLF001
+        assert token is not None
+        assert token.token == "token2"
+        assert not token.is_expired()
+
+
+async def test_background_refresh_restarts_after_renewal(
+    token_server: tuple[OAuthScopeConfig, list[int]],
+) -> None:
+    config, _ = token_server
+    # refresh after about 1.06 seconds of the 3540 seconds until the token is considered expired
+    policy = TokenRefreshPolicy(refresh_ratio=0.0003, jitter=0)
+
+    async with ToadrClient("vtn_url", config, token_refresh_policy=policy) as client:
+        _ = await client.token
+        await asyncio.sleep(0.5)
+        _ = await client._token_flight.do("token", client._renew_token)  # noqa: SLF001
+
+        # the background refresh waits for the lifetime of the renewed token
+        await asyncio.sleep(0.8)
+        token = await client.token
+        assert token is not None
+        assert token.token == "token2"
+
+        await asyncio.sleep(0.5)
+        token = await client.token
+        assert token is not None
+        assert token.token == "token3"
+
+
+async def test_no_background_refresh_without_oauth() -> None:
+    async with ToadrClient("vtn_url", None, token_refresh_policy=TokenRefreshPolicy()) as client:
+        assert await client.token is None
+        assert client._token_refresh_task is None  # noqa: SLF001
+
+
+def test_refresh_delays() -> None:
+    policy = TokenRefreshPolicy(refresh_ratio=0.75, jitter=0.1, base_delay=1, max_delay=8)
+
+    for _ in range(100):
+        assert 0.65 * 3600 <= policy.refresh_delay(3600) <= 0.85 * 3600
+        assert 1 <= policy.retry_delay(1) <= 1
+        assert 1 <= policy.retry_delay(3) <= 4
+        assert 1 <= policy.retry_delay(10) <= 8
+    assert policy.refresh_delay(-10) == 0
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "msg"),
+    [
+        ({"refresh_ratio": 1}, "refresh_ratio must be between 0 and 1"),
+        ({"refresh_ratio": 0.9, "jitter": 0.1}, "jitter must be non-negative"),
+        ({"jitter": -0.1}, "jitter must be non-negative"),
+        ({"base_delay": 0}, "base_delay must be positive"),
+        ({"base_delay": 2, "max_delay": 1}, "base_delay must be positive"),
+    ],
+)
+def test_invalid_token_refresh_policy(kwargs: dict[str, float], msg: str) -> None:
+    with pytest.raises(ValueError, match=msg):
+        _ = TokenRefreshPolicy(**kwargs)  # type: ignore[arg-type]
@@ -0,0 +1,115 @@
+import datetime
+import json
+from typing import Any
+
+import pytest
+from aiohttp import ClientSession
+from pydantic import ValidationError
+from testdata import create_event, create_events, create_programs, create_reports
+
+from toadr3 import OAuthScopeConfig, ToadrClient
+from toadr3._internal import ListAdapter, model_parser, trusted_validator
+from toadr3.models import Event, Interval, IntervalPeriod, Program, Report
+
+
+@pytest.mark.parametrize(
+    ("model", "data"),
+    [(Event, create_events()), (Program, create_programs()), (Report, create_reports())],
+)
+def test_same_models(model: type[Event | Program | Report], data: list[dict[str, Any]]) -> None:
+    body = json.dumps(data)
+    adapter = ListAdapter(model)
+
+    full = adapter.validate_json(body)
+    trusted = adapter.validate_json(body, validation="trusted")
+    assert trusted == full
+    assert [item.model_fields_set for item in trusted] == [item.model_fields_set for item in full]
+    assert all(type(item) is model for item in trusted)
+
+    item = json.dumps(data[0])
+    assert model_parser(model, "trusted")(item) == model_parser(model, "full")(item)
+
+
+def test_converted_types() -> None:
+    event = model_parser(Event, "trusted")(json.dumps(create_event()))
+
+    assert event.created == datetime.datetime(
+        2024, 8, 15, 8, 52, 55, 578000, tzinfo=datetime.timezone.utc
+    )
+    assert event.interval_period is not None
+    assert event.interval_period.duration == datetime.timedelta(minutes=15)
+    assert event.interval_period.randomize_start == datetime.timedelta(0)
+    assert "object_type" in event.model_fields_set
+
+
+def test_constraints_not_checked() -> None:
+    body = json.dumps([create_event(id="not a valid id!", programID="")])
+
+    with pytest.raises(ValidationError, match="String should match pattern"):
+        _ = ListAdapter(Event).validate_json(body)
+
+    events = ListAdapter(Event).validate_json(body, validation="trusted")
+    assert events[0].id == "not a valid id!"
+    assert events[0].program_id == ""
+
+
+def test_types_still_checked() -> None:
+    event = create_event()
+    del event["intervals"]
+    with pytest.raises(ValidationError, match="intervals"):
+        _ = model_parser(Event, "trusted")(json.dumps(event))
+
+    with pytest.raises(ValueError, match="Invalid ISO 8601 duration"):
+        _ = model_parser(Event, "trusted")(
+            json.dumps(
+                create_event(id="1")
+                | {
+                    "intervalPeriod": {
+                        "start": "2024-08-15T10:00:00.000Z",
+                        "duration": "15 minutes",
+                    }
+                }
+            )
+        )
+
+
+def test_trusted_p9999y_duration() -> None:
+    data = {"start": "2024-08-15T10:00:00Z", "duration": "P9999Y"}
+    validator = trusted_validator(IntervalPeriod)
+
+    with pytest.raises(ValueError, match="Invalid ISO 8601 duration"):
+        _ = validator.validate_python(data)
+
+    period = validator.validate_python(data, context={"allow_P9999Y_duration": True})
+    assert period.duration == datetime.timedelta(days=365 * 9999)
+
+
+def test_models_still_complete() -> None:
+    _ = trusted_validator(list[Report])
+
+    assert Report.__pydantic_complete__
+    assert Interval.__pydantic_complete__
+    with pytest.raises(ValidationError, match="String should match pattern"):
+        _ = Report.model_validate(create_reports()[0] | {"id": "not a valid id!"})
+
+
+async def test_trusted_client(session: ClientSession) -> None:
+    config = OAuthScopeConfig(
+        token_url="/oauth_url/token_endpoint",
+        grant_type="client_credentials",
+        scope="test_scope",
+        client_id="test_client_id",
+        client_secret="test_client_secret",
+    )
+    full = ToadrClient("vtn_url", config, session=session)
+    trusted = ToadrClient("vtn_url", config, session=session, validation="trusted")
+    assert full.validation == "full"
+    assert trusted.validation == "trusted"
+
+    assert await trusted.get_events(program_id="34") == await full.get_events(program_id="34")
+    assert [e async for e in trusted.stream_events()] == await full.get_events()
+    assert [e async for e in trusted.iter_events(page_size=2)] == await full.get_events()
+    assert await trusted.get_programs() == await full.get_programs()
+    assert await trusted.get_program("1") == await full.get_program("1")
+    assert await trusted.get_reports() == await full.get_reports()
+    assert [r async for r in trusted.stream_reports()] == await full.get_reports()
@@ -0,0 +1,150 @@
+import asyncio
+from typing import Any
+
+import pytest
+from aiohttp import web
+from aiohttp.pytest_plugin import AiohttpServer
+from testdata import create_events, default_report, default_report_model
+
+from toadr3 import OAuthScopeConfig, ToadrClient, ToadrError, TokenCache
+
+
+class Vtn:
+    """VTN that only accepts the latest token issued by its token endpoint."""
+
+    def __init__(self) -> None:
+        self.issued = 0
+        self.accepted: str | None = None
+        self.rejected = 0
+        self.reject_all = False
+        self.bodies: list[Any] = []
+
+    def revoke(self) -> None:
+        """Reject all tokens issued so far."""
+        self.accepted = None
+
+    async def token(self, _request: web.Request) -> web.Response:
+        """Issue a new token and reject the previous tokens."""
+        self.issued += 1
+        self.accepted = f"token{self.issued}"
+        return web.json_response(
+            {"token_type": "Bearer", "expires_in": 3600, "access_token": self.accepted}
+        )
+
+    def authorized(self, request: web.Request) -> bool:
+        """Check the token of a request, counting the rejected requests."""
+        authorization = request.headers.get("Authorization")
+        if not self.reject_all and authorization == f"Bearer {self.accepted}":
+            return True
+        self.rejected += 1
+        return False
+
+    async def events(self, request: web.Request) -> web.Response:
+        """List the events, with a 401 response without a body for rejected tokens."""
+        if not self.authorized(request):
+            raise web.HTTPUnauthorized(headers={"WWW-Authenticate": 'Bearer error="invalid_token"'})
+        await asyncio.sleep(0.01)
+        return web.json_response(create_events())
+
+    async def reports(self, request: web.Request) -> web.Response:
+        """Create a report, with a Problem JSON 401 response for rejected tokens."""
+        if not self.authorized(request):
+            return web.json_response(
+                {"type": "about:blank", "title": "Unauthorized", "status": 401}, status=401
+            )
+        self.bodies.append(await request.json())
+        return web.json_response(default_report(), status=201)
+
+
+@pytest.fixture
+async def vtn(aiohttp_server: AiohttpServer) -> tuple[Vtn, str, OAuthScopeConfig]:
+    """VTN, its URL and the OAuth configuration of its token endpoint."""
+    vtn = Vtn()
+    app = web.Application()
+    app.router.add_post("/token", vtn.token)
+    app.router.add_get("/events", vtn.events)
+    app.router.add_post("/reports", vtn.reports)
+    server = await aiohttp_server(app)
+
+    config = OAuthScopeConfig(
+        token_url=str(server.make_url("/token")),
+        grant_type="client_credentials",
+        scope="test_scope",
+        client_id="test_client_id",
+        client_secret="test_client_secret",
+    )
+    return vtn, str(server.make_url("")), config
+
+
+async def test_replay_get(vtn: tuple[Vtn, str, OAuthScopeConfig]) -> None:
+    server, url, config = vtn
+
+    async with ToadrClient(url, config, coalesce_requests=True) as client:
+        assert len(await client.get_events()) == 5
+        server.revoke()
+
+        # concurrent calls rejected with the same token share one new token
+        results = await asyncio.gather(*(client.get_events() for _ in range(10)))
+        assert all(len(events) == 5 for events in results)
+        assert server.issued == 2
+        assert server.rejected == 1
+
+        token = await client.token
+        assert token is not None
+        assert token.token == "token2"
+
+
+async def test_replay_post(vtn: tuple[Vtn, str, OAuthScopeConfig]) -> None:
+    server, url, config = vtn
+
+    async with ToadrClient(url, config) as client:
+        _ = await client.token
+        server.revoke()
+
+        report = default_report_model()
+        _ = await client.post_report(report)
+        assert server.rejected == 1
+        assert server.bodies == [report.model_dump(mode="json", by_alias=True, exclude_none=True)]
+
+
+async def test_replay_stream(vtn: tuple[Vtn, str, OAuthScopeConfig]) -> None:
+    server, url, config = vtn
+
+    async with ToadrClient(url, config) as client:
+        _ = await client.token
+        server.revoke()
+
+        events = [event async for event in client.stream_events()]
+        assert len(events) == 5
+        assert server.rejected == 1
+
+
+async def test_replay_once(vtn: tuple[Vtn, str, OAuthScopeConfig]) -> None:
+    server, url, config = vtn
+    cache = TokenCache()
+
+    async with ToadrClient(url, config, token_cache=cache) as client:
+        first = await client.token
+        server.reject_all = True
+
+        with pytest.raises(ToadrError) as exc:
+            _ = await client.get_events()
+        assert exc.value.status_code == 401
+        assert server.rejected == 2
+        assert server.issued == 2
+
+        # the rejected token was replaced in the shared cache
+        second = cache.get_cached(config)
+        assert second is not None
+        assert second is not first
+        assert await client.token is second
+
+
+async def test_no_replay_without_oauth(vtn: tuple[Vtn, str, OAuthScopeConfig]) -> None:
+    server, url, _ = vtn
+
+    async with ToadrClient(url, None) as client:
+        with pytest.raises(ToadrError, match="Unauthorized") as exc:
+            _ = await client.get_events()
+        assert exc.value.status_code == 401
+        assert server.rejected == 1
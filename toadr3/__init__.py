@@ -7,33 +7,65 @@ from .access_token import (
     acquire_access_token,
     acquire_access_token_from_config,
 )
+from .circuit_breaker import CircuitBreaker, CircuitState
 from .client import ToadrClient
-from .events import get_events
-from .exceptions import ToadrError
+from .compression import RequestCompression
+from .connection_config import ConnectionConfig
+from .events import get_events, iter_events, stream_events
+from .exceptions import CircuitOpenError, ToadrError
+from .hedge_policy import HedgePolicy
+from .json_codec import JsonCodec, MsgspecCodec, OrjsonCodec, default_json_codec
 from .programs import (
     delete_program_by_id,
     get_program_by_id,
     get_programs,
+    iter_programs,
     put_program_by_id,
 )
-from .reports import get_reports, post_report
+from .rate_limiter import RateLimiter, TokenBucket
+from .reports import get_reports, iter_reports, post_report, stream_reports
+from .request_metrics import RequestMetrics, RequestTimings
+from .response_cache import ResponseCache
+from .retry_policy import RetryPolicy
 from .subscriptions import (
     delete_subscription_by_id,
     get_subscription_by_id,
     get_subscriptions,
+    iter_subscriptions,
     post_subscription,
     put_subscription_by_id,
 )
+from .token_cache import FileTokenCache, TokenCache, shared_token_cache
+from .token_refresh_policy import TokenRefreshPolicy
 
 __all__ = [
     "AccessToken",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "CircuitState",
+    "ConnectionConfig",
+    "FileTokenCache",
+    "HedgePolicy",
+    "JsonCodec",
+    "MsgspecCodec",
     "OAuthAudienceConfig",
     "OAuthConfig",
     "OAuthScopeConfig",
+    "OrjsonCodec",
+    "RateLimiter",
+    "RequestCompression",
+    "RequestMetrics",
+    "RequestTimings",
+    "ResponseCache",
+    "RetryPolicy",
     "ToadrClient",
     "ToadrError",
+    "TokenBucket",
+    "TokenCache",
+    "TokenRefreshPolicy",
     "acquire_access_token",
     "acquire_access_token_from_config",
+    "default_json_codec",
     "delete_program_by_id",
     "delete_subscription_by_id",
     "get_events",
@@ -42,9 +74,16 @@ __all__ = [
     "get_reports",
     "get_subscription_by_id",
     "get_subscriptions",
+    "iter_events",
+    "iter_programs",
+    "iter_reports",
+    "iter_subscriptions",
     "models",
     "post_report",
     "post_subscription",
     "put_program_by_id",
     "put_subscription_by_id",
+    "shared_token_cache",
+    "stream_events",
+    "stream_reports",
 ]
@@ -1,26 +1,50 @@
 from .client_name import ClientName
+from .lazy_validation import defer_fields, lazy_parser, lazy_validator
+from .list_adapter import ListAdapter
 from .object_id import EventID, ProgramID, ProgramIDPathParameter, SubscriptionID
 from .objects import Objects
+from .pagination import DEFAULT_PAGE_SIZE, paginate
 from .parameter_builder import ParameterBuilder
-from .query_handler import default_error_handler, delete_query, get_query, put_query
+from .query_handler import (
+    default_error_handler,
+    delete_query,
+    get_query,
+    post_query,
+    put_query,
+    stream_query,
+)
 from .query_parameter import QueryParameter, QueryParams
+from .single_flight import SingleFlight, freeze
 from .skip_and_limit import SkipAndLimit
 from .targets import Targets
+from .trusted_validation import model_parser, trusted_validator
 
 __all__ = [
+    "DEFAULT_PAGE_SIZE",
     "ClientName",
     "EventID",
+    "ListAdapter",
     "Objects",
     "ParameterBuilder",
     "ProgramID",
     "ProgramIDPathParameter",
     "QueryParameter",
     "QueryParams",
+    "SingleFlight",
     "SkipAndLimit",
     "SubscriptionID",
     "Targets",
     "default_error_handler",
+    "defer_fields",
     "delete_query",
+    "freeze",
     "get_query",
+    "lazy_parser",
+    "lazy_validator",
+    "model_parser",
+    "paginate",
+    "post_query",
     "put_query",
+    "stream_query",
+    "trusted_validator",
 ]
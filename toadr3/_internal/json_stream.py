@@ -0,0 +1,107 @@
+import re
+
+_TOKENS = re.compile(rb'[\[\]{}"\\]')
+_QUOTE = ord('"')
+_BACKSLASH = ord("\\")
+_OPEN = frozenset(b"[{")
+
+
+class JsonArraySplitter:
+    """Split a JSON array of objects into the raw JSON of each object as the bytes arrive.
+
+    Only the bytes of the object being received are kept, so the memory used does not grow with
+    the length of the array. The objects themselves are not validated, that is left to the
+    parser of each object.
+    """
+
+    def __init__(self) -> None:
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._done = False
+        self._buffer = bytearray()
+
+    def feed(self, chunk: bytes) -> list[bytes]:
+        """Feed the next chunk of the array.
+
+        Parameters
+        ----------
+        chunk : bytes
+            The next bytes of the JSON document.
+
+        Returns
+        -------
+        list[bytes]
+            The raw JSON of the objects completed by the chunk.
+
+        Raises
+        ------
+        ValueError
+            If the document is not a JSON array.
+        """
+        items: list[bytes] = []
+        start = 0 if self._depth > 1 else None
+        skip = 1 if self._escaped else 0
+        self._escaped = False
+
+        for match in _TOKENS.finditer(chunk, skip):
+            i = match.start()
+            if i < skip:
+                continue
+
+            char = chunk[i]
+            if self._in_string:
+                skip = self._string_token(char, i, len(chunk))
+                continue
+
+            if self._done:
+                raise ValueError("Unexpected data after the JSON array.")
+
+            if char == _QUOTE:
+                self._in_string = True
+            elif char in _OPEN:
+                if self._open(char):
+                    start = i
+            elif self._close() and start is not None:
+                items.append(bytes(self._buffer + chunk[start : i + 1]))
+                self._buffer.clear()
+                start = None
+
+        if start is not None:
+            self._buffer += chunk[start:]
+        return items
+
+    def _string_token(self, char: int, i: int, size: int) -> int:
+        """Handle a token inside a string and return the position of the next token to handle."""
+        if char == _BACKSLASH:
+            self._escaped = i + 2 > size
+            return i + 2
+        if char == _QUOTE:
+            self._in_string = False
+        return i + 1
+
+    def _open(self, char: int) -> bool:
+        """Handle an opening bracket and return whether it starts an item of the array."""
+        self._depth += 1
+        if self._depth == 1 and char != ord("["):
+            raise ValueError("Expected result to be a list.")
+        return self._depth == 2  # noqa: PLR2004
+
+    def _close(self) -> bool:
+        """Handle a closing bracket and return whether it ends an item of the array."""
+        self._depth -= 1
+        if self._depth < 0:
+            raise ValueError("Unexpected end of a JSON array.")
+        self._done = self._depth == 0
+        return self._depth == 1
+
+    def close(self) -> None:
+        """Check that the complete array has been fed.
+
+        Raises
+        ------
+        ValueError
+            If the array is incomplete.
+        """
+        if not self._done:
+            raise ValueError("Incomplete JSON array.")
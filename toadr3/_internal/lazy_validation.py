@@ -0,0 +1,113 @@
+import copy
+import functools
+from collections.abc import Callable
+from typing import Any, Literal, TypeVar
+
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import SchemaValidator, from_json
+
+from toadr3.models import LazyEvent
+
+from .trusted_validation import incomplete, trust_schema, trusted_validator
+
+L = TypeVar("L", bound=LazyEvent)
+
+
+@functools.cache
+def lazy_validator(type_: Any, validation: Literal["full", "trusted"]) -> SchemaValidator:  # noqa: ANN401
+    """Get a validator of a type that keeps the lazy fields of lazy events as decoded JSON.
+
+    The validator should be given the decoded JSON, since decoding the lazy fields as part of
+    the validation is several times slower than `pydantic_core.from_json`. The lazy fields are
+    not deferred by the validator, call `defer_fields` on the validated events to validate
+    them on first access.
+
+    Parameters
+    ----------
+    type_ : Any
+        The model or type to validate, such as `list[LazyEvent]`.
+    validation : Literal["full", "trusted"]
+        "full" to check all constraints, "trusted" to skip the constraint checks.
+
+    Returns
+    -------
+    SchemaValidator
+        The validator, shared by all callers with the same type and validation.
+    """
+    schema = copy.deepcopy(TypeAdapter(type_).core_schema)
+    models: set[type[BaseModel]] = set()
+    if validation == "trusted":
+        trust_schema(schema, models)
+    _keep_lazy_fields(schema, models)
+
+    with incomplete(models):
+        return SchemaValidator(schema)
+
+
+def defer_fields(event: LazyEvent, validation: Literal["full", "trusted"]) -> None:
+    """Defer the validation of the lazy fields of an event validated by `lazy_validator`.
+
+    Parameters
+    ----------
+    event : LazyEvent
+        The event, with its lazy fields still decoded JSON.
+    validation : Literal["full", "trusted"]
+        "full" to check all constraints, "trusted" to skip the constraint checks.
+    """
+    for name in event.lazy_fields:
+        event.defer(name, _field_validator(type(event), name, validation))
+
+
+def lazy_parser(
+    model: type[L], validation: Literal["full", "trusted"]
+) -> Callable[[bytes | str], L]:
+    """Get the function validating a JSON document containing one lazy event.
+
+    Parameters
+    ----------
+    model : type[L]
+        The lazy event model to validate.
+    validation : Literal["full", "trusted"]
+        "full" to check all constraints, "trusted" to skip the constraint checks.
+    """
+    validator = lazy_validator(model, validation)
+
+    def parse(data: bytes | str) -> L:
+        event: L = validator.validate_python(from_json(data))
+        defer_fields(event, validation)
+        return event
+
+    return parse
+
+
+@functools.cache
+def _field_validator(
+    model: type[BaseModel], name: str, validation: Literal["full", "trusted"]
+) -> Callable[[Any], Any]:
+    """Get the function validating the decoded JSON of a field."""
+    annotation: Any = model.model_fields[name].annotation
+    if validation == "trusted":
+        return trusted_validator(annotation).validate_python
+    return TypeAdapter(annotation).validate_python
+
+
+def _keep_lazy_fields(schema: Any, models: set[type[BaseModel]]) -> None:  # noqa: ANN401
+    """Accept any decoded JSON for the lazy fields of the lazy events in a core schema."""
+    if isinstance(schema, list):
+        children = schema
+    elif isinstance(schema, dict):
+        if schema.get("type") == "model" and issubclass(schema["cls"], LazyEvent):
+            models.add(schema["cls"])
+            fields = schema["schema"]["fields"]
+            for name in schema["cls"].lazy_fields:
+                field = fields[name]
+                # keep the default of optional fields
+                if field["schema"]["type"] == "default":
+                    field = field["schema"]
+                field["schema"] = {"type": "any"}
+        children = list(schema.values())
+    else:
+        return
+
+    for child in children:
+        _keep_lazy_fields(child, models)
@@ -0,0 +1,69 @@
+import json
+from typing import Generic, Literal, TypeVar
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from pydantic_core import from_json
+
+from toadr3.models import LazyEvent
+
+from .lazy_validation import defer_fields, lazy_validator
+from .trusted_validation import trusted_validator
+
+T = TypeVar("T", bound=BaseModel)
+
+
+class ListAdapter(Generic[T]):
+    """Validate a JSON list of models directly from the raw response body.
+
+    The body is validated in a single call without first decoding it into Python objects.
+    Create one instance per model at module level since building the adapter is expensive.
+    The lazy fields of lazy events are validated on first access.
+    """
+
+    def __init__(self, model: type[T]) -> None:
+        self._model = model
+        self._adapter = TypeAdapter(list[model])  # type: ignore[valid-type]
+
+    def validate_json(
+        self, data: bytes | str, validation: Literal["full", "trusted"] = "full"
+    ) -> list[T]:
+        """Validate a JSON document containing a list of models.
+
+        Parameters
+        ----------
+        data : bytes | str
+            The JSON document.
+        validation : Literal["full", "trusted"]
+            "full" to check all constraints, "trusted" to skip the constraint checks of the
+            models, for responses from a trusted VTN.
+
+        Returns
+        -------
+        list[T]
+            The validated models.
+
+        Raises
+        ------
+        ValueError
+            If the document is not a list or any of the items are invalid.
+        """
+        result: list[T]
+        try:
+            if issubclass(self._model, LazyEvent):
+                validator = lazy_validator(list[self._model], validation)  # type: ignore[name-defined]
+                result = validator.validate_python(from_json(data))
+                for event in result:
+                    defer_fields(event, validation)  # type: ignore[arg-type]
+            elif validation == "trusted":
+                result = trusted_validator(list[self._model]).validate_json(data)  # type: ignore[name-defined]
+            else:
+                result = self._adapter.validate_json(data)
+        except ValidationError as e:
+            error = e.errors()[0]
+            if error["type"] == "list_type" and error["loc"] == ():
+                data_type = type(json.loads(data))
+                raise ValueError(
+                    f"Expected result to be a list. Got {data_type} instead."
+                ) from None
+            raise
+        return result
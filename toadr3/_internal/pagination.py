@@ -0,0 +1,129 @@
+import asyncio
+from collections import deque
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_PAGE_SIZE = 50
+"""Default number of items requested per page when iterating over a list endpoint."""
+
+
+def check_page_size(page_size: int) -> None:
+    """Check that the page size is usable for pagination.
+
+    Raises
+    ------
+    ValueError
+        If the page size is not a positive integer.
+    """
+    if not isinstance(page_size, int):
+        raise ValueError("page_size must be an integer")
+
+    if page_size <= 0:
+        raise ValueError("page_size must be a positive integer")
+
+
+def check_max_concurrency(max_concurrency: int) -> None:
+    """Check that the maximum number of concurrent page requests is valid.
+
+    Raises
+    ------
+    ValueError
+        If the maximum concurrency is not a positive integer.
+    """
+    if not isinstance(max_concurrency, int):
+        raise ValueError("max_concurrency must be an integer")
+
+    if max_concurrency <= 0:
+        raise ValueError("max_concurrency must be a positive integer")
+
+
+def _discard(task: "asyncio.Future[Any] | None") -> None:
+    """Cancel a prefetch task that will never be awaited."""
+    if task is None:
+        return
+
+    if not task.done():
+        task.cancel()
+    elif not task.cancelled():
+        # mark the exception as retrieved to avoid 'exception was never retrieved' warnings
+        task.exception()
+
+
+async def paginate(
+    fetch_page: Callable[[int, int], Awaitable[list[T]]],
+    page_size: int = DEFAULT_PAGE_SIZE,
+    max_concurrency: int = 1,
+) -> AsyncGenerator[T, None]:
+    """Iterate over all items of a paginated list endpoint.
+
+    Pages are requested with `fetch_page(skip, limit)`. Up to `max_concurrency` pages are
+    requested ahead of the page that is currently consumed, and the pages are yielded in order.
+    No new pages are requested once a page with fewer than `page_size` items has been returned,
+    and the iteration stops after the first such page.
+
+    Items with an `id` that has already been yielded are skipped, since offset based pagination
+    can return the same item twice if items are added while iterating. Only the IDs of the last
+    `max_concurrency + 1` pages are kept, since a shifted item reappears in one of the pages
+    requested together with the page it was first returned in.
+
+    Parameters
+    ----------
+    fetch_page : Callable[[int, int], Awaitable[list[T]]]
+        Coroutine function returning the page for the given skip and limit.
+    page_size : int
+        The number of items to request per page. Must not be larger than the maximum
+        number of items the VTN returns in one response.
+    max_concurrency : int
+        The maximum number of page requests in flight at the same time.
+
+    Yields
+    ------
+    T
+        The items of each page in order.
+    """
+    check_page_size(page_size)
+    check_max_concurrency(max_concurrency)
+
+    pending: deque[asyncio.Future[list[T]]] = deque()
+    next_skip = 0
+    last_page_seen = False
+
+    def on_page_done(task: "asyncio.Future[list[T]]") -> None:
+        nonlocal last_page_seen
+        if task.cancelled() or task.exception() is not None or len(task.result()) < page_size:
+            last_page_seen = True
+
+    def request_pages() -> None:
+        nonlocal next_skip
+        while not last_page_seen and len(pending) < max_concurrency:
+            task = asyncio.ensure_future(fetch_page(next_skip, page_size))
+            task.add_done_callback(on_page_done)
+            pending.append(task)
+            next_skip += page_size
+
+    recent_ids: deque[set[object]] = deque(maxlen=max_concurrency + 1)
+    try:
+        request_pages()
+        while pending:
+            page = await pending.popleft()
+
+            if len(page) < page_size:
+                while pending:
+                    _discard(pending.pop())
+            else:
+                request_pages()
+
+            page_ids: set[object] = set()
+            recent_ids.append(page_ids)
+            for item in page:
+                item_id = getattr(item, "id", None)
+                if item_id is not None:
+                    if any(item_id in ids for ids in recent_ids):
+                        continue
+                    page_ids.add(item_id)
+                yield item
+    finally:
+        while pending:
+            _discard(pending.pop())
@@ -1,12 +1,42 @@
-from typing import Any
+import asyncio
+import functools
+import time
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from typing import Any, TypeAlias, TypeVar
 
 import aiohttp
 
+from toadr3._internal.json_stream import JsonArraySplitter
 from toadr3.access_token import AccessToken
-from toadr3.exceptions import ToadrError
-
-
-async def default_error_handler(response: aiohttp.ClientResponse, msg: str | None = None) -> None:
+from toadr3.circuit_breaker import CircuitBreaker
+from toadr3.compression import RequestCompression
+from toadr3.exceptions import (
+    NOT_MODIFIED,
+    TOO_MANY_REQUESTS,
+    UNSUPPORTED_MEDIA_TYPE,
+    ToadrError,
+)
+from toadr3.hedge_policy import HedgePolicy
+from toadr3.json_codec import JsonCodec, default_json_codec
+from toadr3.rate_limiter import RateLimiter
+from toadr3.request_metrics import RequestMetrics
+from toadr3.response_cache import ResponseCache
+from toadr3.retry_policy import RetryPolicy, parse_retry_after
+
+T = TypeVar("T")
+
+STREAM_CHUNK_SIZE = 64 * 1024
+"""Number of bytes read from a streamed response at a time."""
+
+ResponseParser: TypeAlias = Callable[[bytes], Any]
+"""Function converting the raw response body into the query result."""
+
+
+async def default_error_handler(
+    response: aiohttp.ClientResponse,
+    msg: str | None = None,
+    json_codec: JsonCodec | None = None,
+) -> None:
     """Error handler that generates a ToadrError from a Problem JSON response.
 
     Parameters
@@ -15,13 +45,17 @@ async def default_error_handler(response: aiohttp.ClientResponse, msg: str | Non
         Response from server
     msg: str | None
         Pre-message to add to the message.
+    json_codec: JsonCodec | None
+        Codec used to decode the response or None to use the fastest available codec.
 
     Raises
     ------
     ToadrError
         Raises a ToadrError from a Problem JSON response.
     """
-    json_response = await response.json()  # JSON should be of type Problem schema
+    json_codec = json_codec or default_json_codec()
+    # JSON should be of type Problem schema
+    json_response = await response.json(loads=json_codec.loads)
     status = response.status
 
     message = ""
@@ -54,6 +88,17 @@ async def _query(
     params: dict[str, str | int | list[str]] | None = None,
     custom_headers: dict[str, str] | None = None,
     accept_404: bool = False,
+    parser: ResponseParser | None = None,
+    cache: ResponseCache | None = None,
+    accept_409: bool = False,
+    retry_policy: RetryPolicy | None = None,
+    circuit_breaker: CircuitBreaker | None = None,
+    rate_limiter: RateLimiter | None = None,
+    json_codec: JsonCodec | None = None,
+    metrics: RequestMetrics | None = None,
+    hedge_policy: HedgePolicy | None = None,
+    compression: RequestCompression | None = None,
+    deadline: float | None = None,
 ) -> Any:  # noqa: ANN401
     """Perform query with some default behaviour.
 
@@ -73,11 +118,34 @@ async def _query(
         Extra headers to include in the request.
     accept_404: bool
         Flag to indicate if the API can return a 404 response.
+    parser: ResponseParser | None
+        Function that converts the raw response body into the result, None to parse as JSON.
+    cache: ResponseCache | None
+        Cache used to make GET requests conditional and to reuse unchanged results.
+    accept_409: bool
+        Flag to indicate if the API can return a 409 response.
+    retry_policy: RetryPolicy | None
+        Policy for retrying failed requests or None to not retry.
+    circuit_breaker: CircuitBreaker | None
+        Circuit breaker guarding the VTN or None to always send requests.
+    rate_limiter: RateLimiter | None
+        Rate limiter for the requests to the VTN or None to not limit requests.
+    json_codec: JsonCodec | None
+        Codec used to decode JSON responses or None to use the fastest available codec.
+    metrics: RequestMetrics | None
+        Metrics recording the latency breakdown of requests or None to not record them.
+    hedge_policy: HedgePolicy | None
+        Policy for hedging slow GET requests or None to not hedge them.
+    compression: RequestCompression | None
+        Compression of the request body or None to send it uncompressed.
+    deadline: float | None
+        Absolute deadline in event loop time for the request and its retries, None for no
+        deadline. Retries are not attempted if they would start after the deadline.
 
     Returns
     -------
     Any
-        The response parsed as JSON.
+        The response parsed as JSON or the result of the parser.
 
     Raises
     ------
@@ -87,29 +155,323 @@ async def _query(
         If the request to the VTN fails. Specifically, if the response status is 400, 403, or 500,
     aiohttp.ClientError
         If there is an unexpected error with the HTTP request to the VTN.
+    TimeoutError
+        If the request did not complete before the deadline.
 
     """
+    headers = _headers(custom_headers, access_token)
+
+    vtn_url = vtn_url.rstrip("/")
+    json_codec = json_codec or default_json_codec()
+
+    compressed = None
+    if compression is not None and body is not None:
+        compressed = await compression.compress(body)
+
+    async def request() -> Any:  # noqa: ANN401
+        nonlocal compressed
+        if compression is not None and compressed is not None:
+            try:
+                return await _request(
+                    method,
+                    session,
+                    vtn_url,
+                    headers | {"Content-Encoding": compression.encoding},
+                    compressed,
+                    params,
+                    accept_404,
+                    accept_409,
+                    parser,
+                    cache,
+                    json_codec,
+                    metrics,
+                )
+            except ToadrError as e:
+                if e.status_code != UNSUPPORTED_MEDIA_TYPE:
+                    raise
+            # the VTN does not accept compressed bodies, send them uncompressed from now on
+            compression.disable()
+            compressed = None
+
+        return await _request(
+            method,
+            session,
+            vtn_url,
+            headers,
+            body,
+            params,
+            accept_404,
+            accept_409,
+            parser,
+            cache,
+            json_codec,
+            metrics,
+        )
+
+    timeout = asyncio.timeout_at(deadline)
+
+    async def send() -> Any:  # noqa: ANN401
+        if rate_limiter is not None:
+            await rate_limiter.acquire(vtn_url)
+        if circuit_breaker is not None:
+            circuit_breaker.acquire()
+
+        sent_at = time.monotonic()
+        error: BaseException | None = None
+        try:
+            return await request()
+        except BaseException as e:
+            error = e
+            if isinstance(e, asyncio.CancelledError) and timeout.expired():
+                # the VTN did not answer before the deadline, unlike a cancel by the caller
+                error = TimeoutError()
+            if (
+                rate_limiter is not None
+                and isinstance(e, ToadrError)
+                and e.status_code == TOO_MANY_REQUESTS
+            ):
+                rate_limiter.throttle(vtn_url, parse_retry_after(e.headers.get("Retry-After")))
+            raise
+        finally:
+            if circuit_breaker is not None:
+                circuit_breaker.release(time.monotonic() - sent_at, error)
+
+    perform: Callable[[], Awaitable[Any]] = send
+    if hedge_policy is not None and method == "GET":
+        perform = functools.partial(hedge_policy.run, vtn_url, send)
+
+    async with timeout:
+        if retry_policy is None or not retry_policy.is_retryable_request(method, headers):
+            return await perform()
+        return await _retry(perform, retry_policy, deadline)
+
+
+def _headers(
+    custom_headers: dict[str, str] | None, access_token: AccessToken | None
+) -> dict[str, str]:
+    """Create the headers of a request with the custom headers and the access token."""
     headers: dict[str, str] = {}
     if custom_headers is not None:
         headers |= custom_headers
 
     if access_token is not None:
         headers["Authorization"] = f"Bearer {access_token.token}"
+    return headers
 
-    vtn_url = vtn_url.rstrip("/")
-    async with session.request(
-        method, vtn_url, params=params, headers=headers, data=body
-    ) as response:
-        if not response.ok:
-            match response.status:
-                case 400 | 403 | 500:
-                    await default_error_handler(response)
-                case 404 if accept_404:
-                    await default_error_handler(response)
-                case _:
-                    await default_error_handler(response, "Unexpected error status!")
 
-        return await response.json()
+async def _retry(
+    perform: Callable[[], Awaitable[Any]], retry_policy: RetryPolicy, deadline: float | None
+) -> Any:  # noqa: ANN401
+    """Perform a request and retry it as long as the retry policy and the deadline allow.
+
+    A retry that would start after the deadline is not attempted, the error of the last attempt
+    is raised instead of waiting for the deadline to expire.
+    """
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    attempt = 0
+    delay = None
+    while True:
+        attempt += 1
+        try:
+            return await perform()
+        except (ToadrError, aiohttp.ClientError, TimeoutError) as e:
+            now = loop.time()
+            delay = retry_policy.retry_delay(e, attempt, now - started, delay)
+            if delay is None or (deadline is not None and now + delay >= deadline):
+                raise
+        await asyncio.sleep(delay)
+
+
+async def _request(
+    method: str,
+    session: aiohttp.ClientSession,
+    vtn_url: str,
+    headers: dict[str, str],
+    body: str | bytes | None,
+    params: dict[str, str | int | list[str]] | None,
+    accept_404: bool,
+    accept_409: bool,
+    parser: ResponseParser | None,
+    cache: ResponseCache | None,
+    json_codec: JsonCodec,
+    metrics: RequestMetrics | None,
+) -> Any:  # noqa: ANN401
+    """Perform a single request to the VTN and parse the response."""
+    cache_key = None
+    cache_entry = None
+    if cache is not None and method == "GET":
+        cache_key = cache.create_key(vtn_url, params, headers, parser)
+        cache_entry = cache.get(cache_key)
+        if cache_entry is not None:
+            headers = headers | cache_entry.conditional_headers()
+
+    timings = metrics.start(method, vtn_url) if metrics is not None else None
+    try:
+        async with session.request(
+            method, vtn_url, params=params, headers=headers, data=body, trace_request_ctx=timings
+        ) as response:
+            if timings is not None:
+                timings.response_received(response.status)
+
+            if cache is not None and cache_entry is not None and response.status == NOT_MODIFIED:
+                return cache.not_modified(cache_entry)
+
+            if not response.ok:
+                await _handle_error(response, accept_404, accept_409, json_codec)
+
+            data = await response.read()
+            if timings is not None:
+                timings.body_received()
+
+            if cache is not None and cache_key is not None:
+                result = cache.update(
+                    cache_key, cache_entry, response.headers, data, parser or json_codec.loads
+                )
+            elif parser is not None:
+                result = parser(data)
+            else:
+                result = await response.json(loads=json_codec.loads)
+
+            if timings is not None:
+                timings.validated()
+            return result
+    finally:
+        if metrics is not None and timings is not None:
+            metrics.record(timings)
+
+
+async def _handle_error(
+    response: aiohttp.ClientResponse, accept_404: bool, accept_409: bool, json_codec: JsonCodec
+) -> None:
+    """Raise a ToadrError for an error response from the VTN."""
+    if not response.content_type.endswith("json"):
+        # proxies, gateways and rejected tokens often answer without a Problem JSON body
+        raise ToadrError(
+            f"Unexpected error status! {response.reason}",
+            status_code=response.status,
+            reason=response.reason,
+            headers=response.headers,  # type: ignore[arg-type]
+            json_response=await response.read(),
+        )
+
+    match response.status:
+        case 400 | 403 | 500:
+            await default_error_handler(response, json_codec=json_codec)
+        case 404 if accept_404:
+            await default_error_handler(response, json_codec=json_codec)
+        case 409 if accept_409:
+            await default_error_handler(response, json_codec=json_codec)
+        case _:
+            await default_error_handler(response, "Unexpected error status!", json_codec=json_codec)
+
+
+async def stream_query(
+    session: aiohttp.ClientSession,
+    vtn_url: str,
+    access_token: AccessToken | None,
+    params: dict[str, str | int | list[str]] | None,
+    custom_headers: dict[str, str] | None,
+    parser: Callable[[bytes], T],
+    circuit_breaker: CircuitBreaker | None = None,
+    rate_limiter: RateLimiter | None = None,
+    json_codec: JsonCodec | None = None,
+    deadline: float | None = None,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+) -> AsyncGenerator[T, None]:
+    """Perform a GET query and parse the items of the returned JSON array as they arrive.
+
+    Only the bytes of the item being received are kept in memory. The request is not retried
+    or cached since items may already have been yielded when it fails.
+
+    Parameters
+    ----------
+    session: aiohttp.ClientSession
+        The aiohttp session to use for the request.
+    vtn_url: str
+        The URL of the VTN.
+    access_token: AccessToken | None
+        The access token to use for the request, use None if no token is required.
+    params: dict[str, str | int | list[str]] | None
+        Extra query parameters to include in the request.
+    custom_headers: dict[str, str] | None
+        Extra headers to include in the request.
+    parser: Callable[[bytes], T]
+        Function that converts the raw JSON of an item into the result.
+    circuit_breaker: CircuitBreaker | None
+        Circuit breaker guarding the VTN or None to always send requests.
+    rate_limiter: RateLimiter | None
+        Rate limiter for the requests to the VTN or None to not limit requests.
+    json_codec: JsonCodec | None
+        Codec used to decode error responses or None to use the fastest available codec.
+    deadline: float | None
+        Absolute deadline in event loop time for the request and every read of the body, None
+        for no deadline. It is only enforced while waiting for the VTN, never while the caller
+        handles an item.
+    chunk_size: int
+        The maximum number of bytes to read from the response at a time.
+
+    Yields
+    ------
+    T
+        The parsed items in the order returned by the VTN.
+
+    Raises
+    ------
+    ValueError
+        If the response is not a JSON array or an item is invalid.
+    toadr3.ToadrException
+        If the request to the VTN fails. Specifically, if the response status is 400, 403, or 500,
+    aiohttp.ClientError
+        If there is an unexpected error with the HTTP request to the VTN.
+    TimeoutError
+        If the request or a read of the body did not complete before the deadline.
+    """
+    headers = _headers(custom_headers, access_token)
+
+    vtn_url = vtn_url.rstrip("/")
+    json_codec = json_codec or default_json_codec()
+
+    async with asyncio.timeout_at(deadline):
+        if rate_limiter is not None:
+            await rate_limiter.acquire(vtn_url)
+    if circuit_breaker is not None:
+        circuit_breaker.acquire()
+
+    sent_at = time.monotonic()
+    released = circuit_breaker is None
+    try:
+        async with asyncio.timeout_at(deadline):
+            response = await session.get(vtn_url, params=params, headers=headers)
+        try:
+            if not response.ok:
+                async with asyncio.timeout_at(deadline):
+                    await _handle_error(response, False, False, json_codec)
+            if circuit_breaker is not None:
+                released = True
+                circuit_breaker.release(time.monotonic() - sent_at)
+
+            splitter = JsonArraySplitter()
+            while True:
+                async with asyncio.timeout_at(deadline):
+                    chunk = await response.content.read(chunk_size)
+                if not chunk:
+                    break
+                for item in splitter.feed(chunk):
+                    yield parser(item)
+            splitter.close()
+        finally:
+            response.release()
+    except BaseException as e:
+        if (
+            rate_limiter is not None
+            and isinstance(e, ToadrError)
+            and e.status_code == TOO_MANY_REQUESTS
+        ):
+            rate_limiter.throttle(vtn_url, parse_retry_after(e.headers.get("Retry-After")))
+        if circuit_breaker is not None and not released:
+            circuit_breaker.release(time.monotonic() - sent_at, e)
+        raise
 
 
 async def get_query(
@@ -119,6 +481,15 @@ async def get_query(
     params: dict[str, str | int | list[str]] | None = None,
     custom_headers: dict[str, str] | None = None,
     accept_404: bool = False,
+    parser: ResponseParser | None = None,
+    cache: ResponseCache | None = None,
+    retry_policy: RetryPolicy | None = None,
+    circuit_breaker: CircuitBreaker | None = None,
+    rate_limiter: RateLimiter | None = None,
+    json_codec: JsonCodec | None = None,
+    metrics: RequestMetrics | None = None,
+    hedge_policy: HedgePolicy | None = None,
+    deadline: float | None = None,
 ) -> Any:  # noqa: ANN401
     """Perform default handling of a GET query.
 
@@ -136,11 +507,30 @@ async def get_query(
         Extra headers to include in the request.
     accept_404: bool
         Flag to indicate if the API can return a 404 response.
+    parser: ResponseParser | None
+        Function that converts the raw response body into the result, None to parse as JSON.
+    cache: ResponseCache | None
+        Cache used to make GET requests conditional and to reuse unchanged results.
+    retry_policy: RetryPolicy | None
+        Policy for retrying failed requests or None to not retry.
+    circuit_breaker: CircuitBreaker | None
+        Circuit breaker guarding the VTN or None to always send requests.
+    rate_limiter: RateLimiter | None
+        Rate limiter for the requests to the VTN or None to not limit requests.
+    json_codec: JsonCodec | None
+        Codec used to decode JSON responses or None to use the fastest available codec.
+    metrics: RequestMetrics | None
+        Metrics recording the latency breakdown of requests or None to not record them.
+    hedge_policy: HedgePolicy | None
+        Policy for hedging slow GET requests or None to not hedge them.
+    deadline: float | None
+        Absolute deadline in event loop time for the request and its retries, None for no
+        deadline.
 
     Returns
     -------
     Any
-        The response parsed as JSON.
+        The response parsed as JSON or the result of the parser.
 
     Raises
     ------
@@ -150,10 +540,27 @@ async def get_query(
         If the request to the VTN fails. Specifically, if the response status is 400, 403, or 500,
     aiohttp.ClientError
         If there is an unexpected error with the HTTP request to the VTN.
+    TimeoutError
+        If the request did not complete before the deadline.
 
     """
     return await _query(
-        "GET", session, vtn_url, access_token, None, params, custom_headers, accept_404
+        "GET",
+        session,
+        vtn_url,
+        access_token,
+        params=params,
+        custom_headers=custom_headers,
+        accept_404=accept_404,
+        parser=parser,
+        cache=cache,
+        retry_policy=retry_policy,
+        circuit_breaker=circuit_breaker,
+        rate_limiter=rate_limiter,
+        json_codec=json_codec,
+        metrics=metrics,
+        hedge_policy=hedge_policy,
+        deadline=deadline,
     )
 
 
@@ -164,6 +571,12 @@ async def delete_query(
     params: dict[str, str | int | list[str]] | None = None,
     custom_headers: dict[str, str] | None = None,
     accept_404: bool = False,
+    retry_policy: RetryPolicy | None = None,
+    circuit_breaker: CircuitBreaker | None = None,
+    rate_limiter: RateLimiter | None = None,
+    json_codec: JsonCodec | None = None,
+    metrics: RequestMetrics | None = None,
+    deadline: float | None = None,
 ) -> Any:  # noqa: ANN401
     """Perform default handling of a DELETE query.
 
@@ -181,6 +594,19 @@ async def delete_query(
         Extra headers to include in the request.
     accept_404: bool
         Flag to indicate if the API can return a 404 response.
+    retry_policy: RetryPolicy | None
+        Policy for retrying failed requests or None to not retry.
+    circuit_breaker: CircuitBreaker | None
+        Circuit breaker guarding the VTN or None to always send requests.
+    rate_limiter: RateLimiter | None
+        Rate limiter for the requests to the VTN or None to not limit requests.
+    json_codec: JsonCodec | None
+        Codec used to decode JSON responses or None to use the fastest available codec.
+    metrics: RequestMetrics | None
+        Metrics recording the latency breakdown of requests or None to not record them.
+    deadline: float | None
+        Absolute deadline in event loop time for the request and its retries, None for no
+        deadline.
 
     Returns
     -------
@@ -195,10 +621,24 @@ async def delete_query(
         If the request to the VTN fails. Specifically, if the response status is 400, 403, or 500,
     aiohttp.ClientError
         If there is an unexpected error with the HTTP request to the VTN.
+    TimeoutError
+        If the request did not complete before the deadline.
 
     """
     return await _query(
-        "DELETE", session, vtn_url, access_token, None, params, custom_headers, accept_404
+        "DELETE",
+        session,
+        vtn_url,
+        access_token,
+        params=params,
+        custom_headers=custom_headers,
+        accept_404=accept_404,
+        retry_policy=retry_policy,
+        circuit_breaker=circuit_breaker,
+        rate_limiter=rate_limiter,
+        json_codec=json_codec,
+        metrics=metrics,
+        deadline=deadline,
     )
 
 
@@ -210,6 +650,13 @@ async def put_query(
     params: dict[str, str | int | list[str]] | None = None,
     custom_headers: dict[str, str] | None = None,
     accept_404: bool = False,
+    retry_policy: RetryPolicy | None = None,
+    circuit_breaker: CircuitBreaker | None = None,
+    rate_limiter: RateLimiter | None = None,
+    compression: RequestCompression | None = None,
+    json_codec: JsonCodec | None = None,
+    metrics: RequestMetrics | None = None,
+    deadline: float | None = None,
 ) -> Any:  # noqa: ANN401
     """Perform default handling of a PUT query.
 
@@ -229,6 +676,21 @@ async def put_query(
         Extra headers to include in the request.
     accept_404: bool
         Flag to indicate if the API can return a 404 response.
+    retry_policy: RetryPolicy | None
+        Policy for retrying failed requests or None to not retry.
+    circuit_breaker: CircuitBreaker | None
+        Circuit breaker guarding the VTN or None to always send requests.
+    rate_limiter: RateLimiter | None
+        Rate limiter for the requests to the VTN or None to not limit requests.
+    compression: RequestCompression | None
+        Compression of the request body or None to send it uncompressed.
+    json_codec: JsonCodec | None
+        Codec used to decode JSON responses or None to use the fastest available codec.
+    metrics: RequestMetrics | None
+        Metrics recording the latency breakdown of requests or None to not record them.
+    deadline: float | None
+        Absolute deadline in event loop time for the request and its retries, None for no
+        deadline.
 
     Returns
     -------
@@ -243,8 +705,108 @@ async def put_query(
         If the request to the VTN fails. Specifically, if the response status is 400, 403, or 500,
     aiohttp.ClientError
         If there is an unexpected error with the HTTP request to the VTN.
+    TimeoutError
+        If the request did not complete before the deadline.
+
+    """
+    return await _query(
+        "PUT",
+        session,
+        vtn_url,
+        access_token,
+        body,
+        params=params,
+        custom_headers=custom_headers,
+        accept_404=accept_404,
+        retry_policy=retry_policy,
+        circuit_breaker=circuit_breaker,
+        rate_limiter=rate_limiter,
+        compression=compression,
+        json_codec=json_codec,
+        metrics=metrics,
+        deadline=deadline,
+    )
+
+
+async def post_query(
+    session: aiohttp.ClientSession,
+    vtn_url: str,
+    access_token: AccessToken | None,
+    body: str,
+    custom_headers: dict[str, str] | None = None,
+    accept_409: bool = False,
+    retry_policy: RetryPolicy | None = None,
+    circuit_breaker: CircuitBreaker | None = None,
+    rate_limiter: RateLimiter | None = None,
+    compression: RequestCompression | None = None,
+    json_codec: JsonCodec | None = None,
+    metrics: RequestMetrics | None = None,
+    deadline: float | None = None,
+) -> Any:  # noqa: ANN401
+    """Perform default handling of a POST query.
+
+    POST requests are only retried if they include the idempotency key of the retry policy.
+
+    Parameters
+    ----------
+    session: aiohttp.ClientSession
+        The aiohttp session to use for the request.
+    vtn_url: str
+        The URL of the VTN.
+    access_token: AccessToken | None
+        The access token to use for the request, use None if no token is required.
+    body: str
+        The body to include in the POST request.
+    custom_headers: dict[str, str] | None
+        Extra headers to include in the request.
+    accept_409: bool
+        Flag to indicate if the API can return a 409 response.
+    retry_policy: RetryPolicy | None
+        Policy for retrying failed requests or None to not retry.
+    circuit_breaker: CircuitBreaker | None
+        Circuit breaker guarding the VTN or None to always send requests.
+    rate_limiter: RateLimiter | None
+        Rate limiter for the requests to the VTN or None to not limit requests.
+    compression: RequestCompression | None
+        Compression of the request body or None to send it uncompressed.
+    json_codec: JsonCodec | None
+        Codec used to decode JSON responses or None to use the fastest available codec.
+    metrics: RequestMetrics | None
+        Metrics recording the latency breakdown of requests or None to not record them.
+    deadline: float | None
+        Absolute deadline in event loop time for the request and its retries, None for no
+        deadline.
+
+    Returns
+    -------
+    Any
+        The response parsed as JSON.
+
+    Raises
+    ------
+    ValueError
+        If the query parameters are invalid.
+    toadr3.ToadrException
+        If the request to the VTN fails. Specifically, response status 400, 403, 409, or 500,
+    aiohttp.ClientError
+        If there is an unexpected error with the HTTP request to the VTN.
+    TimeoutError
+        If the request did not complete before the deadline.
 
     """
     return await _query(
-        "PUT", session, vtn_url, access_token, body, params, custom_headers, accept_404
+        "POST",
+        session,
+        vtn_url,
+        access_token,
+        body,
+        custom_headers=custom_headers,
+        accept_409=accept_409,
+        retry_policy=retry_policy,
+        circuit_breaker=circuit_breaker,
+        rate_limiter=rate_limiter,
+        compression=compression,
+        json_codec=json_codec,
+        metrics=metrics,
+        deadline=deadline,
     )
@@ -0,0 +1,73 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable, Mapping
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+def freeze(value: Any) -> Hashable:  # noqa: ANN401
+    """Convert a value with nested lists and dicts into a hashable key."""
+    if isinstance(value, Mapping):
+        return tuple(sorted((str(k), freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple, set)):
+        return tuple(freeze(item) for item in value)
+    return value  # type: ignore[no-any-return]
+
+
+class _Call:
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: "asyncio.Future[Any]") -> None:
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Share one in-flight call between concurrent callers with the same key.
+
+    The call runs in its own task, so cancelling one caller does not affect the others.
+    The call is only cancelled when every caller waiting for it has been cancelled.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[Hashable, _Call] = {}
+
+    def __len__(self) -> int:
+        """Return the number of calls in flight."""
+        return len(self._calls)
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        """Run `func` or wait for the call with the same key that is already in flight.
+
+        Parameters
+        ----------
+        key : Hashable
+            Identifies calls that can share a result.
+        func : Callable[[], Awaitable[T]]
+            Coroutine function performing the call.
+
+        Returns
+        -------
+        T
+            The result of the shared call.
+        """
+        call = self._calls.get(key)
+        if call is None or call.task.cancelled():
+            call = _Call(asyncio.ensure_future(func()))
+            self._calls[key] = call
+            call.task.add_done_callback(lambda _: self._forget(key, call))
+
+        call.waiters += 1
+        try:
+            result: T = await asyncio.shield(call.task)
+            return result
+        finally:
+            call.waiters -= 1
+            if call.waiters == 0 and not call.task.done():
+                # callers arriving before the cancelled task finishes must start a new call
+                self._forget(key, call)
+                call.task.cancel()
+
+    def _forget(self, key: Hashable, call: _Call) -> None:
+        if self._calls.get(key) is call:
+            del self._calls[key]
@@ -0,0 +1,94 @@
+import contextlib
+import copy
+import functools
+from collections.abc import Callable, Iterator
+from typing import Any, Literal, TypeVar
+
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import SchemaValidator
+
+T = TypeVar("T", bound=BaseModel)
+
+_CONSTRAINTS = ("pattern", "min_length", "max_length", "ge", "gt", "le", "lt")
+_CONSTRAINED_TYPES = ("str", "int", "float")
+
+
+@functools.cache
+def trusted_validator(type_: Any) -> SchemaValidator:  # noqa: ANN401
+    """Get a validator of a type that builds the same models without checking constraints.
+
+    The validator is built from the schema of the type with the patterns, lengths and bounds
+    removed, and without the post-init hook of models that do not need it. Values are still
+    converted, so datetimes are parsed and ISO 8601 durations are converted to timedeltas.
+
+    Parameters
+    ----------
+    type_ : Any
+        The model or type to validate, such as `list[Event]`.
+
+    Returns
+    -------
+    SchemaValidator
+        The validator, shared by all callers with the same type.
+    """
+    schema = copy.deepcopy(TypeAdapter(type_).core_schema)
+    models: set[type[BaseModel]] = set()
+    trust_schema(schema, models)
+
+    with incomplete(models):
+        return SchemaValidator(schema)
+
+
+def model_parser(
+    model: type[T], validation: Literal["full", "trusted"]
+) -> Callable[[bytes | str], T]:
+    """Get the function validating a JSON document containing one model.
+
+    Parameters
+    ----------
+    model : type[T]
+        The model to validate.
+    validation : Literal["full", "trusted"]
+        "full" to check all constraints, "trusted" to skip the constraint checks.
+    """
+    if validation == "trusted":
+        return trusted_validator(model).validate_json
+    return model.model_validate_json
+
+
+def trust_schema(schema: Any, models: set[type[BaseModel]]) -> None:  # noqa: ANN401
+    """Remove the constraints and unneeded post-init hooks from a core schema in place."""
+    if isinstance(schema, list):
+        children = schema
+    elif isinstance(schema, dict):
+        if schema.get("type") in _CONSTRAINED_TYPES:
+            for constraint in _CONSTRAINTS:
+                _ = schema.pop(constraint, None)
+
+        if schema.get("type") == "model":
+            models.add(schema["cls"])
+            # the post-init hook only marks the object type as set
+            if "object_type" not in schema["cls"].model_fields:
+                _ = schema.pop("post_init", None)
+        children = list(schema.values())
+    else:
+        return
+
+    for child in children:
+        trust_schema(child, models)
+
+
+@contextlib.contextmanager
+def incomplete(models: set[type[BaseModel]]) -> Iterator[None]:
+    """Mark models as incomplete while building a validator.
+
+    pydantic-core reuses the validator of a complete model instead of building one from the
+    schema, which would check the constraints again.
+    """
+    for model in models:
+        model.__pydantic_complete__ = False
+    try:
+        yield
+    finally:
+        for model in models:
+            model.__pydantic_complete__ = True
@@ -1,10 +1,18 @@
+import base64
 import datetime
+import json
 import os
+import time
+from typing import Any, TypeGuard
 
 import aiohttp
 from aiohttp import ClientResponse
 
 from .exceptions import ToadrError
+from .json_codec import JsonCodec, default_json_codec
+
+DEFAULT_EXPIRY_SKEW = 60.0
+"""Seconds before the expiry of an access token from which it is considered expired."""
 
 
 class OAuthConfig:
@@ -17,6 +25,7 @@ class OAuthConfig:
         claims: dict[str, str],
         client_id: str | None = None,
         client_secret: str | None = None,
+        expiry_skew: float = DEFAULT_EXPIRY_SKEW,
     ) -> None:
         """Encapsulate configuration required for authorization.
 
@@ -37,12 +46,18 @@ class OAuthConfig:
             The client ID or None if acquirable from the environment as CLIENT_ID.
         client_secret : str | None
             The client secret or None if acquirable from the environment as CLIENT_SECRET.
+        expiry_skew : float
+            Seconds before the expiry of an access token from which it is considered expired.
         """
+        if expiry_skew < 0:
+            raise ValueError("expiry_skew cannot be negative")
+
         self._token_url = token_url
         self._client_id = client_id
         self._client_secret = client_secret
         self._grant_type = grant_type
         self._claims = claims
+        self._expiry_skew = expiry_skew
 
     @property
     def url(self) -> str:
@@ -69,6 +84,11 @@ class OAuthConfig:
         """Claims to include in the token request."""
         return self._claims
 
+    @property
+    def expiry_skew(self) -> float:
+        """Seconds before the expiry of an access token from which it is considered expired."""
+        return self._expiry_skew
+
 
 class OAuthScopeConfig(OAuthConfig):
     """Model encapsulating values required for authorization with scope."""
@@ -80,6 +100,7 @@ class OAuthScopeConfig(OAuthConfig):
         scope: str,
         client_id: str | None = None,
         client_secret: str | None = None,
+        expiry_skew: float = DEFAULT_EXPIRY_SKEW,
     ) -> None:
         """Encapsulate configuration required for authorization with scope.
 
@@ -98,6 +119,8 @@ class OAuthScopeConfig(OAuthConfig):
             The client ID or None if acquirable from the environment as CLIENT_ID.
         client_secret : str | None
             The client secret or None if acquirable from the environment as CLIENT_SECRET.
+        expiry_skew : float
+            Seconds before the expiry of an access token from which it is considered expired.
         """
         if scope is None:
             raise ValueError("scope cannot be None")
@@ -107,6 +130,7 @@ class OAuthScopeConfig(OAuthConfig):
             claims={"scope": scope},
             client_id=client_id,
             client_secret=client_secret,
+            expiry_skew=expiry_skew,
         )
 
     @property
@@ -125,6 +149,7 @@ class OAuthAudienceConfig(OAuthConfig):
         audience: str,
         client_id: str | None = None,
         client_secret: str | None = None,
+        expiry_skew: float = DEFAULT_EXPIRY_SKEW,
     ) -> None:
         """Encapsulate configuration required for authorization with audience.
 
@@ -143,6 +168,8 @@ class OAuthAudienceConfig(OAuthConfig):
             The client ID or None if acquirable from the environment as CLIENT_ID.
         client_secret : str | None
             The client secret or None if acquirable from the environment as CLIENT_SECRET.
+        expiry_skew : float
+            Seconds before the expiry of an access token from which it is considered expired.
         """
         if audience is None:
             raise ValueError("audience cannot be None")
@@ -152,6 +179,7 @@ class OAuthAudienceConfig(OAuthConfig):
             claims={"audience": audience},
             client_id=client_id,
             client_secret=client_secret,
+            expiry_skew=expiry_skew,
         )
 
     @property
@@ -166,23 +194,49 @@ class AccessToken:
     Enables tracking of expiration time and checking if the token is expired.
     """
 
-    def __init__(self, token: str, expires_in: int):
+    def __init__(
+        self, token: str, expires_in: int | None = None, skew: float = DEFAULT_EXPIRY_SKEW
+    ) -> None:
         """Initialize the access token with an expiration time in seconds.
 
         Checking if the token is expired can be done with the is_expired() method. The
         is_expired() method will return True if the token is expired or will expire within
-        the next 60 seconds.
+        the next `skew` seconds.
+
+        The expiry is tracked with the monotonic clock, so it is not affected by changes of the
+        system time. If the token is a JWT with an `exp` claim, the lifetime is also limited by
+        the claims: `exp - iat` if the token has an `iat` claim, otherwise `exp` minus the current
+        time. The claims are read without verifying the signature of the token.
 
         Parameters
         ----------
         token : str
             The access token.
-        expires_in : int
-            The time in seconds until the token expires.
+        expires_in : int | None
+            The time in seconds until the token expires, None to only use the JWT claims.
+        skew : float
+            Seconds before the expiry from which the token is considered expired.
+
+        Raises
+        ------
+        ValueError
+            If `expires_in` is None and the token has no `exp` claim.
         """
+        lifetimes = [] if expires_in is None else [float(expires_in)]
+        claims = _jwt_claims(token)
+        exp, iat = claims.get("exp"), claims.get("iat")
+        if _is_number(exp):
+            lifetimes.append(exp - iat if _is_number(iat) else exp - time.time())
+        if not lifetimes:
+            raise ValueError("expires_in is required for tokens without an exp claim")
+
+        lifetime = min(lifetimes)
         self._token = token
-        time_delta = datetime.timedelta(seconds=expires_in)
-        self._expires_at = datetime.datetime.now(tz=datetime.timezone.utc) + time_delta
+        self._expires_at = datetime.datetime.now(tz=datetime.timezone.utc) + datetime.timedelta(
+            seconds=lifetime
+        )
+        self._expires_at_ns = time.monotonic_ns() + int(lifetime * 1e9)
+        self._refresh_at_ns = self._expires_at_ns - int(skew * 1e9)
 
     @property
     def token(self) -> str:
@@ -191,19 +245,22 @@ class AccessToken:
 
     @property
     def expires_at(self) -> datetime.datetime:
-        """The time in seconds until the token expires."""
+        """The time when the token expires, as an absolute time to persist the token."""
         return self._expires_at
 
     @property
     def expires_in(self) -> int:
         """The time in seconds until the token expires."""
-        expires_in = self._expires_at - datetime.datetime.now(tz=datetime.timezone.utc)
-        return int(expires_in.total_seconds())
+        return (self._expires_at_ns - time.monotonic_ns()) // 1_000_000_000
+
+    @property
+    def refresh_in(self) -> float:
+        """The time in seconds until the token is considered expired, so `expires_in - skew`."""
+        return (self._refresh_at_ns - time.monotonic_ns()) / 1e9
 
     def is_expired(self) -> bool:
-        """Check if the token is expired."""
-        time_delta = self._expires_at - datetime.datetime.now(tz=datetime.timezone.utc)
-        return time_delta < datetime.timedelta(seconds=60)
+        """Check if the token is expired or expires within the skew."""
+        return time.monotonic_ns() >= self._refresh_at_ns
 
     def __str__(self) -> str:
         """Return a string representation of the access token."""
@@ -214,8 +271,27 @@ class AccessToken:
         return f"AccessToken(token='{self.token}', expires_in={self.expires_in})"
 
 
+def _jwt_claims(token: str) -> dict[str, Any]:
+    """Get the claims of a JWT without verifying it, empty if the token is not a JWT."""
+    parts = token.split(".")
+    if len(parts) != 3:  # noqa: PLR2004
+        return {}
+
+    payload = parts[1]
+    try:
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+    except ValueError:
+        return {}
+    return claims if isinstance(claims, dict) else {}
+
+
+def _is_number(value: object) -> TypeGuard[int | float]:
+    """Check if a claim is a number of seconds."""
+    return isinstance(value, int | float) and not isinstance(value, bool)
+
+
 async def acquire_access_token_from_config(
-    session: aiohttp.ClientSession, config: OAuthConfig
+    session: aiohttp.ClientSession, config: OAuthConfig, json_codec: JsonCodec | None = None
 ) -> AccessToken:
     """Acquire an access token from the token provider.
 
@@ -230,6 +306,8 @@ async def acquire_access_token_from_config(
     config: OAuthConfig
         The configuration object required to acquire an access token. It can be either an instance
         of OAuthScopeConfig or OAuthAudienceConfig.
+    json_codec : JsonCodec | None
+        Codec used to decode the response or None to use the fastest available codec.
 
     Returns
     -------
@@ -251,6 +329,8 @@ async def acquire_access_token_from_config(
         config.claims,
         config.client_id,
         config.client_secret,
+        json_codec,
+        config.expiry_skew,
     )
 
 
@@ -261,6 +341,8 @@ async def acquire_access_token(
     claims: dict[str, str],
     client_id: str | None = None,
     client_secret: str | None = None,
+    json_codec: JsonCodec | None = None,
+    expiry_skew: float = DEFAULT_EXPIRY_SKEW,
 ) -> AccessToken:
     """Acquire an access token from the token provider.
 
@@ -282,6 +364,10 @@ async def acquire_access_token(
         The client ID or None if acquirable from environment as CLIENT_ID.
     client_secret : str | None
         The client secret or None if acquirable from environment as CLIENT_SECRET.
+    json_codec : JsonCodec | None
+        Codec used to decode the response or None to use the fastest available codec.
+    expiry_skew : float
+        Seconds before the expiry of the access token from which it is considered expired.
 
     Returns
     -------
@@ -321,19 +407,20 @@ async def acquire_access_token(
     }
 
     credentials |= claims
+    json_codec = json_codec or default_json_codec()
 
     async with session.post(token_url, data=credentials) as response:
         # 400 is the start of HTTP error codes
         if response.status >= 400:  # noqa PLR2004 - Magic value used in comparison
-            await _process_error(response)  # will raise a ToadrError
+            await _process_error(response, json_codec)  # will raise a ToadrError
 
-        data = await response.json()
-        return AccessToken(data["access_token"], data["expires_in"])
+        data = await response.json(loads=json_codec.loads)
+        return AccessToken(data["access_token"], data.get("expires_in"), expiry_skew)
 
 
-async def _process_error(response: ClientResponse) -> None:
+async def _process_error(response: ClientResponse, json_codec: JsonCodec) -> None:
     message = "Failed to acquire access token: "
-    json = await response.json()
+    json = await response.json(loads=json_codec.loads)
 
     if "error" in json:
         message += json["error"]
@@ -0,0 +1,226 @@
+import asyncio
+import math
+import time
+from collections import deque
+from collections.abc import Callable, Collection
+from enum import StrEnum
+
+import aiohttp
+
+from .exceptions import CircuitOpenError, ToadrError
+
+SERVICE_UNAVAILABLE = 503
+
+
+class CircuitState(StrEnum):
+    """State of a circuit breaker."""
+
+    CLOSED = "closed"
+    """Requests are sent to the VTN and their outcome is recorded."""
+    OPEN = "open"
+    """Requests fail immediately without being sent to the VTN."""
+    HALF_OPEN = "half_open"
+    """A limited number of trial requests are sent to check if the VTN has recovered."""
+
+
+class CircuitBreaker:
+    """Circuit breaker that stops sending requests to a VTN that is failing or slow.
+
+    The outcome of the most recent requests is kept in a sliding window. When the share of
+    failed requests or of slow requests in the window reaches its threshold, the circuit opens
+    and every request fails immediately with a CircuitOpenError with status 503 and a
+    Retry-After header, instead of waiting for the VTN to time out. The error is not retried.
+    After `open_duration` seconds the circuit becomes half-open and lets `half_open_calls` trial
+    requests through. If they all succeed the circuit closes again, otherwise it opens for
+    another `open_duration`.
+
+    Failures are connection errors, timeouts and error responses with a status in
+    `failure_statuses`. Other error responses, such as 400 or 404, show that the VTN is
+    responding and count as successful calls. Timeouts also count as slow calls, and so do
+    calls cancelled after `slow_call_duration`.
+
+    A circuit breaker is meant to be shared by all clients of the same VTN.
+    """
+
+    def __init__(
+        self,
+        failure_rate_threshold: float = 0.5,
+        slow_call_rate_threshold: float = 1.0,
+        slow_call_duration: float = 5.0,
+        window_size: int = 20,
+        minimum_calls: int = 10,
+        open_duration: float = 30.0,
+        half_open_calls: int = 3,
+        failure_statuses: Collection[int] = (500, 502, 503, 504),
+        on_state_change: Callable[[CircuitState, CircuitState], None] | None = None,
+    ) -> None:
+        """Initialize the circuit breaker.
+
+        Parameters
+        ----------
+        failure_rate_threshold : float
+            Share of failed calls in the window, between 0 and 1, that opens the circuit.
+        slow_call_rate_threshold : float
+            Share of slow calls in the window, between 0 and 1, that opens the circuit.
+        slow_call_duration : float
+            Duration in seconds after which a call is considered slow.
+        window_size : int
+            Number of most recent calls used to calculate the failure and slow call rates.
+        minimum_calls : int
+            Number of calls that must be recorded before the circuit can open.
+        open_duration : float
+            Time in seconds the circuit stays open before allowing trial calls.
+        half_open_calls : int
+            Number of trial calls that must succeed in the half-open state to close the circuit.
+        failure_statuses : Collection[int]
+            HTTP status codes that are counted as failures.
+        on_state_change : Callable[[CircuitState, CircuitState], None] | None
+            Function called with the old and the new state whenever the state changes.
+        """
+        if not 0 < failure_rate_threshold <= 1 or not 0 < slow_call_rate_threshold <= 1:
+            raise ValueError("Rate thresholds must be between 0 and 1")
+
+        if not isinstance(window_size, int) or window_size <= 0:
+            raise ValueError("window_size must be a positive integer")
+
+        if not isinstance(minimum_calls, int) or not 0 < minimum_calls <= window_size:
+            raise ValueError("minimum_calls must be a positive integer not larger than window_size")
+
+        if not isinstance(half_open_calls, int) or half_open_calls <= 0:
+            raise ValueError("half_open_calls must be a positive integer")
+
+        if slow_call_duration <= 0 or open_duration <= 0:
+            raise ValueError("Durations must be positive")
+
+        self._failure_rate_threshold = failure_rate_threshold
+        self._slow_call_rate_threshold = slow_call_rate_threshold
+        self._slow_call_duration = slow_call_duration
+        self._minimum_calls = minimum_calls
+        self._open_duration = open_duration
+        self._half_open_calls = half_open_calls
+        self._failure_statuses = frozenset(failure_statuses)
+        self._on_state_change = on_state_change
+
+        self._state = CircuitState.CLOSED
+        self._window: deque[tuple[bool, bool]] = deque(maxlen=window_size)
+        self._opened_at = 0.0
+        self._trials_started = 0
+        self._trials_succeeded = 0
+
+    @property
+    def state(self) -> CircuitState:
+        """The current state of the circuit."""
+        if (
+            self._state is CircuitState.OPEN
+            and time.monotonic() - self._opened_at >= self._open_duration
+        ):
+            self._transition(CircuitState.HALF_OPEN)
+        return self._state
+
+    @property
+    def failure_rate(self) -> float:
+        """Share of failed calls in the current window."""
+        if not self._window:
+            return 0.0
+        return sum(failed for failed, _ in self._window) / len(self._window)
+
+    @property
+    def slow_call_rate(self) -> float:
+        """Share of slow calls in the current window."""
+        if not self._window:
+            return 0.0
+        return sum(slow for _, slow in self._window) / len(self._window)
+
+    def is_failure(self, error: BaseException | None) -> bool:
+        """Check if the error raised by a call counts as a failure of the VTN."""
+        if isinstance(error, ToadrError):
+            return error.status_code in self._failure_statuses
+        return isinstance(error, (aiohttp.ClientConnectionError, TimeoutError))
+
+    def acquire(self) -> None:
+        """Get permission to make a call.
+
+        Every successful `acquire` must be followed by a `release` once the call is done.
+
+        Raises
+        ------
+        toadr3.CircuitOpenError
+            If the circuit is open or all trial calls of the half-open circuit are in progress.
+        """
+        state = self.state
+        if state is CircuitState.CLOSED:
+            return
+
+        if state is CircuitState.HALF_OPEN and self._trials_started < self._half_open_calls:
+            self._trials_started += 1
+            return
+
+        retry_after = max(self._open_duration - (time.monotonic() - self._opened_at), 0)
+        raise CircuitOpenError(
+            f"Circuit breaker is {state}, the VTN is unavailable",
+            status_code=SERVICE_UNAVAILABLE,
+            reason="Circuit breaker open",
+            headers={"Retry-After": str(math.ceil(retry_after))},
+        )
+
+    def release(self, duration: float, error: BaseException | None = None) -> None:
+        """Record the outcome of a call made after `acquire`.
+
+        Parameters
+        ----------
+        duration : float
+            Duration of the call in seconds.
+        error : BaseException | None
+            The error raised by the call or None if it succeeded.
+        """
+        slow = duration >= self._slow_call_duration or isinstance(error, TimeoutError)
+        if isinstance(error, asyncio.CancelledError):
+            if not slow:
+                # a cancelled call says nothing about the VTN, give the trial to another call
+                if self._state is CircuitState.HALF_OPEN:
+                    self._trials_started -= 1
+                return
+            # the call was slow, whatever the reason it was cancelled
+            error = None
+
+        failed = self.is_failure(error)
+
+        if self._state is CircuitState.HALF_OPEN:
+            if failed or slow:
+                self._open()
+                return
+            self._trials_succeeded += 1
+            if self._trials_succeeded >= self._half_open_calls:
+                self._window.clear()
+                self._transition(CircuitState.CLOSED)
+            return
+
+        if self._state is CircuitState.OPEN:
+            # call started before the circuit opened
+            return
+
+        self._window.append((failed, slow))
+        if len(self._window) >= self._minimum_calls and (
+            self.failure_rate >= self._failure_rate_threshold
+            or self.slow_call_rate >= self._slow_call_rate_threshold
+        ):
+            self._open()
+
+    def reset(self) -> None:
+        """Close the circuit and forget all recorded calls."""
+        self._window.clear()
+        self._transition(CircuitState.CLOSED)
+
+    def _open(self) -> None:
+        self._opened_at = time.monotonic()
+        self._transition(CircuitState.OPEN)
+
+    def _transition(self, state: CircuitState) -> None:
+        self._trials_started = 0
+        self._trials_succeeded = 0
+        if state is self._state:
+            return
+
+        old_state, self._state = self._state, state
+        if self._on_state_change is not None:
+            self._on_state_change(old_state, state)
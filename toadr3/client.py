@@ -1,13 +1,31 @@
 import asyncio
+import contextlib
+import functools
+from collections.abc import AsyncGenerator, Awaitable, Callable
 from types import TracebackType
-from typing import Literal, Self
+from typing import Any, Literal, Self, TypeVar
 
+import aiohttp
 from aiohttp import ClientSession
 
 import toadr3
 from toadr3.models import Event, ObjectType, Program, Report, Subscription, TargetType
 
-from .exceptions import NOT_FOUND, ToadrError
+from ._internal import DEFAULT_PAGE_SIZE, SingleFlight, freeze, paginate
+from .circuit_breaker import CircuitBreaker, CircuitState
+from .compression import RequestCompression
+from .connection_config import ConnectionConfig
+from .exceptions import NOT_FOUND, UNAUTHORIZED, ToadrError
+from .hedge_policy import HedgePolicy
+from .json_codec import JsonCodec, default_json_codec
+from .rate_limiter import RateLimiter
+from .request_metrics import RequestMetrics
+from .response_cache import ResponseCache
+from .retry_policy import RetryPolicy
+from .token_cache import TokenCache
+from .token_refresh_policy import TokenRefreshPolicy
+
+T = TypeVar("T")
 
 
 class ToadrClient:
@@ -23,6 +41,21 @@ class ToadrClient:
         oauth_config: toadr3.OAuthConfig | None,
         session: ClientSession | None = None,
         default_custom_headers: dict[str, str] | None = None,
+        response_cache: ResponseCache | None = None,
+        coalesce_requests: bool = False,
+        retry_policy: RetryPolicy | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        rate_limiter: RateLimiter | None = None,
+        compression: RequestCompression | None = None,
+        default_timeout: float | None = None,
+        connection_config: ConnectionConfig | None = None,
+        json_codec: JsonCodec | None = None,
+        metrics: RequestMetrics | None = None,
+        hedge_policy: HedgePolicy | None = None,
+        token_refresh_policy: TokenRefreshPolicy | None = None,
+        token_cache: TokenCache | None = None,
+        validation: Literal["full", "trusted"] = "full",
+        lazy_events: bool = False,
     ) -> None:
         """Initialize the client.
 
@@ -36,13 +69,81 @@ class ToadrClient:
             The session to use or None if the client should make its own session.
         default_custom_headers : dict[str, str] | None
             Default custom headers to include in every request.
+        response_cache : ResponseCache | None
+            Cache for GET responses or None to disable caching. With a cache, requests are made
+            conditional and unchanged responses are returned without validating them again.
+        coalesce_requests : bool
+            Whether concurrent identical GET requests should share one request and its result.
+        retry_policy : RetryPolicy | None
+            Policy for retrying failed requests or None to not retry.
+        circuit_breaker : CircuitBreaker | None
+            Circuit breaker guarding the VTN or None to always send requests.
+        rate_limiter : RateLimiter | None
+            Rate limiter for the requests to the VTN or None to not limit requests.
+        compression : RequestCompression | None
+            Compression of the request body or None to send it uncompressed.
+        default_timeout : float | None
+            Timeout in seconds for calls that do not specify a timeout or deadline, None for no
+            timeout.
+        connection_config : ConnectionConfig | None
+            Configuration of the connection pool when the client creates its own session, None to
+            use the aiohttp defaults. Cannot be combined with `session`.
+        json_codec : JsonCodec | None
+            Codec used to decode JSON responses or None to use the fastest available codec.
+        metrics : RequestMetrics | None
+            Metrics recording the latency breakdown of every request or None to not record them.
+            The connection phases are only recorded if the client creates its own session.
+        hedge_policy : HedgePolicy | None
+            Policy for hedging slow requests of `get_events`, `get_program` and
+            `get_subscription`, or None to not hedge them.
+        token_refresh_policy : TokenRefreshPolicy | None
+            Policy for refreshing the access token in a background task before it expires, or
+            None to refresh it when a request finds it expired.
+        token_cache : TokenCache | None
+            Cache sharing access tokens between clients with the same OAuth configuration, such as
+            `shared_token_cache()`, or None for a token per client.
+        validation : Literal["full", "trusted"]
+            "full" to check all constraints of the events, programs and reports returned by the
+            VTN, "trusted" to skip the constraint checks for a trusted VTN. Types are converted in
+            both modes.
+        lazy_events : bool
+            Validate the intervals, targets and report descriptors of events on first access, for
+            callers that filter events by their top-level fields. The events are
+            `toadr3.models.LazyEvent` instances.
         """
+        if session is not None and connection_config is not None:
+            raise ValueError("connection_config can only be used if the client creates its session")
+
         self._default_custom_headers = default_custom_headers or {}
         self._vtn_url = vtn_url.rstrip("/")
         self._oauth_config = oauth_config
-        self._session = session if session is not None else ClientSession()
-        self._token_lock = asyncio.Lock()
+        if session is None:
+            trace_configs = [metrics.trace_config()] if metrics is not None else None
+            session = (
+                connection_config.create_session(trace_configs)
+                if connection_config is not None
+                else ClientSession(trace_configs=trace_configs)
+            )
+        self._session = session
+        self._connection_config = connection_config
+        self._token_flight = SingleFlight()
         self._token: toadr3.AccessToken | None = None
+        self._response_cache = response_cache
+        self._single_flight = SingleFlight() if coalesce_requests else None
+        self._retry_policy = retry_policy
+        self._circuit_breaker = circuit_breaker
+        self._rate_limiter = rate_limiter
+        self._compression = compression
+        self._default_timeout = default_timeout
+        self._json_codec = json_codec or default_json_codec()
+        self._metrics = metrics
+        self._hedge_policy = hedge_policy
+        self._token_refresh_policy = token_refresh_policy
+        self._token_refresh_task: asyncio.Task[None] | None = None
+        self._token_renewed = asyncio.Event()
+        self._token_cache = token_cache
+        self._validation: Literal["full", "trusted"] = validation
+        self._lazy_events = lazy_events
         self._closed = False
 
     @property
@@ -60,31 +161,277 @@ class ToadrClient:
         """Whether or not the client is closed."""
         return self._closed
 
+    @property
+    def response_cache(self) -> ResponseCache | None:
+        """Cache for GET responses, None if caching is disabled."""
+        return self._response_cache
+
+    @property
+    def retry_policy(self) -> RetryPolicy | None:
+        """Policy for retrying failed requests, None if requests are not retried."""
+        return self._retry_policy
+
+    @property
+    def circuit_breaker(self) -> CircuitBreaker | None:
+        """Circuit breaker guarding the VTN, None if requests are always sent."""
+        return self._circuit_breaker
+
+    @property
+    def rate_limiter(self) -> RateLimiter | None:
+        """Rate limiter for the requests to the VTN, None if requests are not limited."""
+        return self._rate_limiter
+
+    @property
+    def compression(self) -> RequestCompression | None:
+        """Compression of request bodies, None if bodies are sent uncompressed."""
+        return self._compression
+
+    @property
+    def default_timeout(self) -> float | None:
+        """Timeout in seconds for calls without a timeout or deadline, None for no timeout."""
+        return self._default_timeout
+
+    @property
+    def json_codec(self) -> JsonCodec:
+        """Codec used to decode JSON responses."""
+        return self._json_codec
+
+    @property
+    def metrics(self) -> RequestMetrics | None:
+        """Latency breakdown of the requests to the VTN, None if it is not recorded."""
+        return self._metrics
+
+    @property
+    def hedge_policy(self) -> HedgePolicy | None:
+        """Policy for hedging slow GET requests, None if requests are not hedged."""
+        return self._hedge_policy
+
+    @property
+    def token_refresh_policy(self) -> TokenRefreshPolicy | None:
+        """Policy for refreshing the access token in the background, None if disabled."""
+        return self._token_refresh_policy
+
+    @property
+    def token_cache(self) -> TokenCache | None:
+        """Cache sharing access tokens between clients, None if the client has its own token."""
+        return self._token_cache
+
+    @property
+    def validation(self) -> Literal["full", "trusted"]:
+        """Validation of the events, programs and reports returned by the VTN."""
+        return self._validation
+
+    @property
+    def lazy_events(self) -> bool:
+        """Whether the intervals, targets and report descriptors of events are validated lazily."""
+        return self._lazy_events
+
+    @property
+    def circuit_state(self) -> CircuitState:
+        """State of the circuit towards the VTN, always closed without a circuit breaker.
+
+        A scheduler can pause polling the VTN while the circuit is open.
+        """
+        if self._circuit_breaker is None:
+            return CircuitState.CLOSED
+        return self._circuit_breaker.state
+
     @property
     def default_custom_headers(self) -> dict[str, str]:
         """Default custom headers to include in every request."""
         return self._default_custom_headers
 
     async def _fetch_token(self) -> toadr3.AccessToken | None:
-        """Fetch an access token from the OAuth2 server."""
+        """Fetch an access token from the OAuth2 server or the shared token cache."""
         if self._oauth_config is None:
             return None
-        return await toadr3.acquire_access_token_from_config(self._session, self._oauth_config)
+        config = self._oauth_config
+
+        async def fetch() -> toadr3.AccessToken:
+            return await toadr3.acquire_access_token_from_config(
+                self._session, config, self._json_codec
+            )
+
+        if self._token_cache is None:
+            return await fetch()
+        return await self._token_cache.get(config, fetch, stale=self._token)
 
     @property
     async def token(self) -> toadr3.AccessToken | None:
-        """Access token for the Switch API."""
-        async with self._token_lock:
-            if self._token is None or self._token.is_expired():
-                self._token = await self._fetch_token()
+        """Access token for the Switch API.
 
-            return self._token
+        A valid token is returned without waiting. Otherwise a new token is fetched, and
+        concurrent callers share the same fetch.
+        """
+        token = self._token
+        if token is None or token.is_expired():
+            if self._oauth_config is None:
+                return None
+            token = await self._token_flight.do("token", self._renew_token)
+        return token
+
+    async def _renew_token(self) -> toadr3.AccessToken | None:
+        """Fetch a new access token, store it and start the background refresh if enabled."""
+        self._token = await self._fetch_token()
+        self._token_renewed.set()
+
+        if (
+            self._token is not None
+            and self._token_refresh_policy is not None
+            and self._token_refresh_task is None
+        ):
+            self._token_refresh_task = asyncio.create_task(
+                self._refresh_token(self._token_refresh_policy)
+            )
+        return self._token
+
+    async def _refresh_token(self, policy: TokenRefreshPolicy) -> None:
+        """Refresh the access token in the background until the client is closed.
+
+        The token is refreshed a fraction of the time before it is considered expired, and the
+        timer restarts whenever a request renews the token itself. The current token stays in use
+        until the new one has arrived. A failed refresh is retried with backoff, and once the
+        current token has expired requests fetch a new one themselves.
+        """
+        failures = 0
+        while True:
+            if failures:
+                delay = policy.retry_delay(failures)
+            elif self._token is not None:
+                delay = policy.refresh_delay(self._token.refresh_in)
+            else:  # pragma: no cover
+                delay = 0
+
+            self._token_renewed.clear()
+            try:
+                async with asyncio.timeout(delay):
+                    _ = await self._token_renewed.wait()
+            except TimeoutError:
+                pass
+            else:
+                failures = 0
+                continue
+
+            try:
+                _ = await self._token_flight.do("token", self._renew_token)
+            except Exception as e:  # noqa: BLE001
+                failures += 1
+                policy.failed(e)
+                continue
+
+            failures = 0
+
+    async def _authorized(self, query: Callable[..., Awaitable[T]], **kwargs: Any) -> T:  # noqa: ANN401
+        """Perform a query function with the access token of the client.
+
+        If the VTN rejects the token with a 401 response, for example because it was revoked
+        before it expired, the token is replaced and the query is performed once more.
+        """
+        access_token = await self.token
+        try:
+            return await query(access_token=access_token, **kwargs)
+        except ToadrError as e:
+            if e.status_code != UNAUTHORIZED or self._oauth_config is None:
+                raise
+
+        return await query(access_token=await self._replace_token(access_token), **kwargs)
+
+    async def _authorized_stream(
+        self,
+        stream: Callable[..., AsyncGenerator[T, None]],
+        deadline: float | None,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> AsyncGenerator[T, None]:
+        """Iterate over a stream function with the access token of the client.
+
+        Like `_authorized`, the stream is started once more with a new token if the VTN rejects
+        the token. The response status is checked before any object is yielded.
+        """
+        async with asyncio.timeout_at(deadline):
+            access_token = await self.token
+        try:
+            async for item in stream(access_token=access_token, deadline=deadline, **kwargs):
+                yield item
+        except ToadrError as e:
+            if e.status_code != UNAUTHORIZED or self._oauth_config is None:
+                raise
+        else:
+            return
+
+        async with asyncio.timeout_at(deadline):
+            access_token = await self._replace_token(access_token)
+        async for item in stream(access_token=access_token, deadline=deadline, **kwargs):
+            yield item
+
+    async def _replace_token(
+        self, rejected: toadr3.AccessToken | None
+    ) -> toadr3.AccessToken | None:
+        """Replace an access token rejected by the VTN, unless it has already been replaced.
+
+        Concurrent calls rejected with the same token share one fetch of a new token.
+        """
+        if self._token is not rejected:
+            return await self.token
+
+        if self._token_cache is not None and self._oauth_config is not None and rejected:
+            await self._token_cache.invalidate(self._oauth_config, rejected)
+        return await self._token_flight.do("token", self._renew_token)
 
     def _prepare_headers(self, custom_headers: dict[str, str] | None) -> dict[str, str]:
         """Prepare headers for the request."""
         custom_headers = custom_headers or {}
         return self._default_custom_headers | custom_headers
 
+    def _deadline(self, timeout: float | None, deadline: float | None) -> float | None:
+        """Get the absolute deadline of a call in event loop time, None for no deadline."""
+        if timeout is None and deadline is None:
+            timeout = self._default_timeout
+
+        if timeout is not None:
+            timeout_at = asyncio.get_running_loop().time() + timeout
+            deadline = timeout_at if deadline is None else min(deadline, timeout_at)
+        return deadline
+
+    async def _get(
+        self,
+        query: Callable[..., Awaitable[T]],
+        deadline: float | None,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> T:
+        """Perform a GET query function with the session, token and cache of the client.
+
+        If request coalescing is enabled, concurrent calls with the same query function,
+        arguments, headers and access token share one request and its result. The shared
+        request runs without a deadline, each caller only waits until its own deadline, and the
+        request is cancelled once every caller has given up.
+        """
+        kwargs["custom_headers"] = self._prepare_headers(kwargs.get("custom_headers"))
+
+        async def perform(access_token: toadr3.AccessToken | None) -> T:
+            async def request(deadline: float | None) -> T:
+                return await query(
+                    session=self._session,
+                    vtn_url=self._vtn_url,
+                    access_token=access_token,
+                    cache=self._response_cache,
+                    retry_policy=self._retry_policy,
+                    circuit_breaker=self._circuit_breaker,
+                    rate_limiter=self._rate_limiter,
+                    json_codec=self._json_codec,
+                    metrics=self._metrics,
+                    deadline=deadline,
+                    **kwargs,
+                )
+
+            if self._single_flight is None:
+                return await request(deadline)
+
+            token = access_token.token if access_token is not None else None
+            key = (query.__name__, token, freeze(kwargs))
+            return await self._single_flight.do(key, functools.partial(request, None))
+
+        return await self._authorized(perform)
+
     async def get_events(
         self,
         program_id: str | None = None,
@@ -94,6 +441,8 @@ class ToadrClient:
         limit: int | None = None,
         extra_params: dict[str, str | int | list[str]] | None = None,
         custom_headers: dict[str, str] | None = None,
+        timeout: float | None = None,
+        deadline: float | None = None,
     ) -> list[Event]:
         """Get a list of events from the VTN.
 
@@ -116,6 +465,11 @@ class ToadrClient:
             Extra query parameters to include in the request.
         custom_headers : dict[str, str] | None
             Extra headers to include in the request.
+        timeout : float | None
+            Maximum time in seconds for the call, including acquiring the access token and retries.
+            None to use the default timeout of the client.
+        deadline : float | None
+            Absolute deadline of the call in event loop time (`loop.time()`), None for no deadline.
 
         Returns
         -------
@@ -130,11 +484,161 @@ class ToadrClient:
             If the request to the VTN fails. Specifically, response status 400, 403, or 500,
         aiohttp.ClientError
             If there is an unexpected error with the HTTP request to the VTN.
+        TimeoutError
+            If the call did not complete before the timeout or deadline.
+        """
+        deadline = self._deadline(timeout, deadline)
+        async with asyncio.timeout_at(deadline):
+            return await self._get(
+                toadr3.get_events,
+                deadline=deadline,
+                program_id=program_id,
+                target_type=target_type,
+                target_values=target_values,
+                skip=skip,
+                limit=limit,
+                extra_params=extra_params,
+                custom_headers=custom_headers,
+                validation=self._validation,
+                lazy=self._lazy_events,
+                hedge_policy=self._hedge_policy,
+            )
+
+    async def iter_events(
+        self,
+        program_id: str | None = None,
+        target_type: TargetType | str | None = None,
+        target_values: list[str] | None = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        max_concurrency: int = 1,
+        extra_params: dict[str, str | int | list[str]] | None = None,
+        custom_headers: dict[str, str] | None = None,
+        timeout: float | None = None,
+        deadline: float | None = None,
+    ) -> AsyncGenerator[Event, None]:
+        """Iterate over all events from the VTN.
+
+        The events are requested page by page using skip and limit. Up to `max_concurrency` pages
+        are requested ahead of the page being consumed, and no new pages are requested once a page
+        with fewer than `page_size` events has been returned. Events with an ID that has already
+        been yielded are skipped. The access token is refreshed between pages if needed.
+
+        Parameters
+        ----------
+        program_id : str | None
+            The program ID to filter the events by.
+        target_type : TargetType | str | None
+            The target type to filter the events by.
+        target_values : list[str] | None
+            The target values to filter the events by (names of the target type).
+        page_size : int
+            The number of events to request per page.
+        max_concurrency : int
+            The maximum number of pages to request concurrently.
+        extra_params : dict[str, str | int | list[str]] | None
+            Extra query parameters to include in the request.
+        custom_headers : dict[str, str] | None
+            Extra headers to include in the request.
+        timeout : float | None
+            Maximum time in seconds for the whole iteration, shared by all pages and retries.
+            None to use the default timeout of the client.
+        deadline : float | None
+            Absolute deadline of the call in event loop time (`loop.time()`), None for no deadline.
+
+        Yields
+        ------
+        Event
+            The events in the order returned by the VTN.
+
+        Raises
+        ------
+        ValueError
+            If the query parameters are invalid.
+        toadr3.ToadrError
+            If the request to the VTN fails. Specifically, response status 400, 403, or 500,
+        aiohttp.ClientError
+            If there is an unexpected error with the HTTP request to the VTN.
+        TimeoutError
+            If the iteration did not complete before the timeout or deadline.
+        """
+        deadline = self._deadline(timeout, deadline)
+
+        async def fetch_page(skip: int, limit: int) -> list[Event]:
+            return await self.get_events(
+                program_id=program_id,
+                target_type=target_type,
+                target_values=target_values,
+                skip=skip,
+                limit=limit,
+                extra_params=extra_params,
+                custom_headers=custom_headers,
+                deadline=deadline,
+            )
+
+        async for event in paginate(fetch_page, page_size, max_concurrency):
+            yield event
+
+    async def stream_events(
+        self,
+        program_id: str | None = None,
+        target_type: TargetType | str | None = None,
+        target_values: list[str] | None = None,
+        skip: int | None = None,
+        limit: int | None = None,
+        extra_params: dict[str, str | int | list[str]] | None = None,
+        custom_headers: dict[str, str] | None = None,
+        timeout: float | None = None,
+        deadline: float | None = None,
+    ) -> AsyncGenerator[Event, None]:
+        """Stream the events from the VTN, validating each event as soon as its bytes arrive.
+
+        Unlike `get_events`, the response is not read into memory before it is validated, so the
+        memory used is about one event instead of the whole list. Streamed requests are not
+        cached, coalesced or retried.
+
+        Parameters
+        ----------
+        program_id : str | None
+            The program ID to filter the events by.
+        target_type : TargetType | str | None
+            The target type to filter the events by.
+        target_values : list[str] | None
+            The target values to filter the events by (names of the target type).
+        skip : int | None
+            The number of events to skip (for pagination).
+        limit : int | None
+            The maximum number of events to return.
+        extra_params : dict[str, str | int | list[str]] | None
+            Extra query parameters to include in the request.
+        custom_headers : dict[str, str] | None
+            Extra headers to include in the request.
+        timeout : float | None
+            Maximum time in seconds for the request and reading the whole response. None to use
+            the default timeout of the client.
+        deadline : float | None
+            Absolute deadline of the call in event loop time (`loop.time()`), None for no deadline.
+
+        Yields
+        ------
+        Event
+            The events in the order returned by the VTN.
+
+        Raises
+        ------
+        ValueError
+            If the query parameters are invalid, or the response is not a list of valid events.
+        toadr3.ToadrError
+            If the request to the VTN fails. Specifically, response status 400, 403, or 500,
+        aiohttp.ClientError
+            If there is an unexpected error with the HTTP request to the VTN.
+        TimeoutError
+            If the request did not complete before the timeout or deadline.
         """
-        return await toadr3.get_events(
+        async for event in self._authorized_stream(
+            toadr3.stream_events,
+            self._deadline(timeout, deadline),
             session=self._session,
             vtn_url=self._vtn_url,
-            access_token=await self.token,
             program_id=program_id,
             target_type=target_type,
             target_values=target_values,
@@ -142,7 +646,13 @@ class ToadrClient:
             limit=limit,
             extra_params=extra_params,
             custom_headers=self._prepare_headers(custom_headers),
-        )
+            circuit_breaker=self._circuit_breaker,
+            rate_limiter=self._rate_limiter,
+            json_codec=self._json_codec,
+            validation=self._validation,
+            lazy=self._lazy_events,
+        ):
+            yield event
 
     async def get_programs(
         self,
@@ -152,6 +662,8 @@ class ToadrClient:
         limit: int | None = None,
         extra_params: dict[str, str | int | list[str]] | None = None,
         custom_headers: dict[str, str] | None = None,
+        timeout: float | None = None,
+        deadline: float | None = None,
     ) -> list[Program]:
         """Get a list of programs from the VTN.
 
@@ -172,6 +684,11 @@ class ToadrClient:
             Extra query parameters to include in the request.
         custom_headers: dict[str, str] | None
             Extra headers to include in the request.
+        timeout: float | None
+            Maximum time in seconds for the call, including acquiring the access token and retries.
+            None to use the default timeout of the client.
+        deadline: float | None
+            Absolute deadline of the call in event loop time (`loop.time()`), None for no deadline.
 
         Returns
         -------
@@ -186,18 +703,92 @@ class ToadrClient:
             If the request to the VTN fails. Specifically, response status 400, 403, or 500,
         aiohttp.ClientError
             If there is an unexpected error with the HTTP request to the VTN.
+        TimeoutError
+            If the call did not complete before the timeout or deadline.
         """
-        return await toadr3.get_programs(
-            session=self._session,
-            vtn_url=self._vtn_url,
-            access_token=await self.token,
-            target_type=target_type,
-            target_values=target_values,
-            skip=skip,
-            limit=limit,
-            extra_params=extra_params,
-            custom_headers=self._prepare_headers(custom_headers),
-        )
+        deadline = self._deadline(timeout, deadline)
+        async with asyncio.timeout_at(deadline):
+            return await self._get(
+                toadr3.get_programs,
+                deadline=deadline,
+                target_type=target_type,
+                target_values=target_values,
+                skip=skip,
+                limit=limit,
+                extra_params=extra_params,
+                custom_headers=custom_headers,
+                validation=self._validation,
+            )
+
+    async def iter_programs(
+        self,
+        target_type: TargetType | str | None = None,
+        target_values: list[str] | None = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        max_concurrency: int = 1,
+        extra_params: dict[str, str | int | list[str]] | None = None,
+        custom_headers: dict[str, str] | None = None,
+        timeout: float | None = None,
+        deadline: float | None = None,
+    ) -> AsyncGenerator[Program, None]:
+        """Iterate over all programs from the VTN.
+
+        The programs are requested page by page using skip and limit. Up to `max_concurrency` pages
+        are requested ahead of the page being consumed, and no new pages are requested once a page
+        with fewer than `page_size` programs has been returned. Programs with an ID that has already
+        been yielded are skipped. The access token is refreshed between pages if needed.
+
+        Parameters
+        ----------
+        target_type : TargetType | str | None
+            The target type to filter the programs by.
+        target_values : list[str] | None
+            The target values to filter the programs by (names of the target type).
+        page_size : int
+            The number of programs to request per page.
+        max_concurrency : int
+            The maximum number of pages to request concurrently.
+        extra_params : dict[str, str | int | list[str]] | None
+            Extra query parameters to include in the request.
+        custom_headers : dict[str, str] | None
+            Extra headers to include in the request.
+        timeout : float | None
+            Maximum time in seconds for the whole iteration, shared by all pages and retries.
+            None to use the default timeout of the client.
+        deadline : float | None
+            Absolute deadline of the call in event loop time (`loop.time()`), None for no deadline.
+
+        Yields
+        ------
+        Program
+            The programs in the order returned by the VTN.
+
+        Raises
+        ------
+        ValueError
+            If the query parameters are invalid.
+        toadr3.ToadrError
+            If the request to the VTN fails. Specifically, response status 400, 403, or 500,
+        aiohttp.ClientError
+            If there is an unexpected error with the HTTP request to the VTN.
+        TimeoutError
+            If the iteration did not complete before the timeout or deadline.
+        """
+        deadline = self._deadline(timeout, deadline)
+
+        async def fetch_page(skip: int, limit: int) -> list[Program]:
+            return await self.get_programs(
+                target_type=target_type,
+                target_values=target_values,
+                skip=skip,
+                limit=limit,
+                extra_params=extra_params,
+                custom_headers=custom_headers,
+                deadline=deadline,
+            )
+
+        async for program in paginate(fetch_page, page_size, max_concurrency):
+            yield program
 
     async def get_subscriptions(
         self,
@@ -210,6 +801,8 @@ class ToadrClient:
         limit: int | None = None,
         extra_params: dict[str, str | int | list[str]] | None = None,
         custom_headers: dict[str, str] | None = None,
+        timeout: float | None = None,
+        deadline: float | None = None,
     ) -> list[Subscription]:
         """List all subscriptions.
 
@@ -237,6 +830,11 @@ class ToadrClient:
             Extra query parameters to include in the request.
         custom_headers: dict[str, str] | None
             Extra headers to include in the request.
+        timeout: float | None
+            Maximum time in seconds for the call, including acquiring the access token and retries.
+            None to use the default timeout of the client.
+        deadline: float | None
+            Absolute deadline of the call in event loop time (`loop.time()`), None for no deadline.
 
         Returns
         -------
@@ -251,26 +849,114 @@ class ToadrClient:
             If the request to the VTN fails. Specifically, response status 400, 403, or 500,
         aiohttp.ClientError
             If there is an unexpected error with the HTTP request to the VTN.
+        TimeoutError
+            If the call did not complete before the timeout or deadline.
         """
-        return await toadr3.get_subscriptions(
-            session=self._session,
-            vtn_url=self._vtn_url,
-            access_token=await self.token,
-            program_id=program_id,
-            client_name=client_name,
-            target_type=target_type,
-            target_values=target_values,
-            objects=objects,
-            skip=skip,
-            limit=limit,
-            extra_params=extra_params,
-            custom_headers=self._prepare_headers(custom_headers),
-        )
+        deadline = self._deadline(timeout, deadline)
+        async with asyncio.timeout_at(deadline):
+            return await self._get(
+                toadr3.get_subscriptions,
+                deadline=deadline,
+                program_id=program_id,
+                client_name=client_name,
+                target_type=target_type,
+                target_values=target_values,
+                objects=objects,
+                skip=skip,
+                limit=limit,
+                extra_params=extra_params,
+                custom_headers=custom_headers,
+            )
+
+    async def iter_subscriptions(
+        self,
+        program_id: str | None = None,
+        client_name: str | None = None,
+        target_type: TargetType | str | None = None,
+        target_values: list[str] | None = None,
+        objects: list[str] | list[ObjectType] | None = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        max_concurrency: int = 1,
+        extra_params: dict[str, str | int | list[str]] | None = None,
+        custom_headers: dict[str, str] | None = None,
+        timeout: float | None = None,
+        deadline: float | None = None,
+    ) -> AsyncGenerator[Subscription, None]:
+        """Iterate over all subscriptions from the VTN.
+
+        The subscriptions are requested page by page using skip and limit. Up to `max_concurrency`
+        pages are requested ahead of the page being consumed, and no new pages are requested once a
+        page with fewer than `page_size` subscriptions has been returned. Subscriptions with an ID
+        that has already been yielded are skipped. The access token is refreshed between pages if
+        needed.
+
+        Parameters
+        ----------
+        program_id : str | None
+            The program ID to filter the subscriptions by.
+        client_name : str | None
+            The client name to filter the subscriptions by.
+        target_type : TargetType | str | None
+            The target type to filter the subscriptions by.
+        target_values : list[str] | None
+            The target values to filter the subscriptions by (names of the target type).
+        objects : list[str] | list[ObjectType] | None
+            The object types to filter the subscriptions by.
+        page_size : int
+            The number of subscriptions to request per page.
+        max_concurrency : int
+            The maximum number of pages to request concurrently.
+        extra_params : dict[str, str | int | list[str]] | None
+            Extra query parameters to include in the request.
+        custom_headers : dict[str, str] | None
+            Extra headers to include in the request.
+        timeout : float | None
+            Maximum time in seconds for the whole iteration, shared by all pages and retries.
+            None to use the default timeout of the client.
+        deadline : float | None
+            Absolute deadline of the call in event loop time (`loop.time()`), None for no deadline.
+
+        Yields
+        ------
+        Subscription
+            The subscriptions in the order returned by the VTN.
+
+        Raises
+        ------
+        ValueError
+            If the query parameters are invalid.
+        toadr3.ToadrError
+            If the request to the VTN fails. Specifically, response status 400, 403, or 500,
+        aiohttp.ClientError
+            If there is an unexpected error with the HTTP request to the VTN.
+        TimeoutError
+            If the iteration did not complete before the timeout or deadline.
+        """
+        deadline = self._deadline(timeout, deadline)
+
+        async def fetch_page(skip: int, limit: int) -> list[Subscription]:
+            return await self.get_subscriptions(
+                program_id=program_id,
+                client_name=client_name,
+                target_type=target_type,
+                target_values=target_values,
+                objects=objects,
+                skip=skip,
+                limit=limit,
+                extra_params=extra_params,
+                custom_headers=custom_headers,
+                deadline=deadline,
+            )
+
+        async for subscription in paginate(fetch_page, page_size, max_concurrency):
+            yield subscription
 
     async def post_subscription(
         self,
         subscription: Subscription,
         custom_headers: dict[str, str] | None = None,
+        timeout: float | None = None,
+        deadline: float | None = None,
     ) -> Subscription:
         """Create a new subscription.
 
@@ -280,6 +966,11 @@ class ToadrClient:
             The subscription to create.
         custom_headers: dict[str, str] | None
             Extra headers to include in the request.
+        timeout: float | None
+            Maximum time in seconds for the call, including acquiring the access token and retries.
+            None to use the default timeout of the client.
+        deadline: float | None
+            Absolute deadline of the call in event loop time (`loop.time()`), None for no deadline.
 
         Returns
         -------
@@ -294,18 +985,33 @@ class ToadrClient:
             If the request to the VTN fails. Specifically, response status 400, 403, or 500,
         aiohttp.ClientError
             If there is an unexpected error with the HTTP request to the VTN.
+        TimeoutError
+            If the call did not complete before the timeout or deadline.
 
         """
-        return await toadr3.post_subscription(
-            session=self._session,
-            vtn_url=self._vtn_url,
-            access_token=await self.token,
-            subscription=subscription,
-            custom_headers=self._prepare_headers(custom_headers),
-        )
+        deadline = self._deadline(timeout, deadline)
+        async with asyncio.timeout_at(deadline):
+            return await self._authorized(
+                toadr3.post_subscription,
+                deadline=deadline,
+                session=self._session,
+                vtn_url=self._vtn_url,
+                subscription=subscription,
+                custom_headers=self._prepare_headers(custom_headers),
+                retry_policy=self._retry_policy,
+                circuit_breaker=self._circuit_breaker,
+                rate_limiter=self._rate_limiter,
+                json_codec=self._json_codec,
+                metrics=self._metrics,
+                compression=self._compression,
+            )
 
     async def get_subscription(
-        self, subscription_id: str, custom_headers: dict[str, str] | None = None
+        self,
+        subscription_id: str,
+        custom_headers: dict[str, str] | None = None,
+        timeout: float | None = None,
+        deadline: float | None = None,
     ) -> Subscription | None:
         """Get a subscription by ID.
 
@@ -315,6 +1021,11 @@ class ToadrClient:
             The subscription ID to search for.
         custom_headers : dict[str, str] | None
             Extra headers to include in the request.
+        timeout : float | None
+            Maximum time in seconds for the call, including acquiring the access token and retries.
+            None to use the default timeout of the client.
+        deadline : float | None
+            Absolute deadline of the call in event loop time (`loop.time()`), None for no deadline.
 
         Returns
         -------
@@ -329,22 +1040,30 @@ class ToadrClient:
             If the request to the VTN fails. Specifically, response status 400, 403, or 500,
         aiohttp.ClientError
             If there is an unexpected error with the HTTP request to the VTN.
+        TimeoutError
+            If the call did not complete before the timeout or deadline.
         """
-        try:
-            return await toadr3.get_subscription_by_id(
-                session=self._session,
-                vtn_url=self._vtn_url,
-                access_token=await self.token,
-                subscription_id=subscription_id,
-                custom_headers=self._prepare_headers(custom_headers),
-            )
-        except ToadrError as e:
-            if e.status_code == NOT_FOUND:
-                return None
-            raise e
+        deadline = self._deadline(timeout, deadline)
+        async with asyncio.timeout_at(deadline):
+            try:
+                return await self._get(
+                    toadr3.get_subscription_by_id,
+                    deadline=deadline,
+                    subscription_id=subscription_id,
+                    custom_headers=custom_headers,
+                    hedge_policy=self._hedge_policy,
+                )
+            except ToadrError as e:
+                if e.status_code == NOT_FOUND:
+                    return None
+                raise e
 
     async def delete_subscription(
-        self, subscription_id: str, custom_headers: dict[str, str] | None = None
+        self,
+        subscription_id: str,
+        custom_headers: dict[str, str] | None = None,
+        timeout: float | None = None,
+        deadline: float | None = None,
     ) -> Subscription | None:
         """Delete a subscription by ID.
 
@@ -354,6 +1073,11 @@ class ToadrClient:
             The subscription ID to search for.
         custom_headers : dict[str, str] | None
             Extra headers to include in the request.
+        timeout : float | None
+            Maximum time in seconds for the call, including acquiring the access token and retries.
+            None to use the default timeout of the client.
+        deadline : float | None
+            Absolute deadline of the call in event loop time (`loop.time()`), None for no deadline.
 
         Returns
         -------
@@ -368,25 +1092,37 @@ class ToadrClient:
             If the request to the VTN fails. Specifically, response status 400, 403, or 500,
         aiohttp.ClientError
             If there is an unexpected error with the HTTP request to the VTN.
+        TimeoutError
+            If the call did not complete before the timeout or deadline.
         """
-        try:
-            return await toadr3.delete_subscription_by_id(
-                session=self._session,
-                vtn_url=self._vtn_url,
-                access_token=await self.token,
-                subscription_id=subscription_id,
-                custom_headers=self._prepare_headers(custom_headers),
-            )
-        except ToadrError as e:
-            if e.status_code == NOT_FOUND:
-                return None
-            raise e
+        deadline = self._deadline(timeout, deadline)
+        async with asyncio.timeout_at(deadline):
+            try:
+                return await self._authorized(
+                    toadr3.delete_subscription_by_id,
+                    deadline=deadline,
+                    session=self._session,
+                    vtn_url=self._vtn_url,
+                    subscription_id=subscription_id,
+                    custom_headers=self._prepare_headers(custom_headers),
+                    retry_policy=self._retry_policy,
+                    circuit_breaker=self._circuit_breaker,
+                    rate_limiter=self._rate_limiter,
+                    json_codec=self._json_codec,
+                    metrics=self._metrics,
+                )
+            except ToadrError as e:
+                if e.status_code == NOT_FOUND:
+                    return None
+                raise e
 
     async def put_subscription(
         self,
         subscription_id: str,
         subscription: Subscription,
         custom_headers: dict[str, str] | None = None,
+        timeout: float | None = None,
+        deadline: float | None = None,
     ) -> Subscription | None:
         """Update a subscription by ID.
 
@@ -398,6 +1134,11 @@ class ToadrClient:
             The subscription object with updated values.
         custom_headers : dict[str, str] | None
             Extra headers to include in the request.
+        timeout : float | None
+            Maximum time in seconds for the call, including acquiring the access token and retries.
+            None to use the default timeout of the client.
+        deadline : float | None
+            Absolute deadline of the call in event loop time (`loop.time()`), None for no deadline.
 
         Returns
         -------
@@ -412,23 +1153,38 @@ class ToadrClient:
             If the request to the VTN fails. Specifically, response status 400, 403, or 500,
         aiohttp.ClientError
             If there is an unexpected error with the HTTP request to the VTN.
+        TimeoutError
+            If the call did not complete before the timeout or deadline.
         """
-        try:
-            return await toadr3.put_subscription_by_id(
-                session=self._session,
-                vtn_url=self._vtn_url,
-                access_token=await self.token,
-                subscription_id=subscription_id,
-                subscription=subscription,
-                custom_headers=self._prepare_headers(custom_headers),
-            )
-        except ToadrError as e:
-            if e.status_code == NOT_FOUND:
-                return None
-            raise e
+        deadline = self._deadline(timeout, deadline)
+        async with asyncio.timeout_at(deadline):
+            try:
+                return await self._authorized(
+                    toadr3.put_subscription_by_id,
+                    deadline=deadline,
+                    session=self._session,
+                    vtn_url=self._vtn_url,
+                    subscription_id=subscription_id,
+                    subscription=subscription,
+                    custom_headers=self._prepare_headers(custom_headers),
+                    retry_policy=self._retry_policy,
+                    circuit_breaker=self._circuit_breaker,
+                    rate_limiter=self._rate_limiter,
+                    json_codec=self._json_codec,
+                    metrics=self._metrics,
+                    compression=self._compression,
+                )
+            except ToadrError as e:
+                if e.status_code == NOT_FOUND:
+                    return None
+                raise e
 
     async def get_program(
-        self, program_id: str, custom_headers: dict[str, str] | None = None
+        self,
+        program_id: str,
+        custom_headers: dict[str, str] | None = None,
+        timeout: float | None = None,
+        deadline: float | None = None,
     ) -> Program | None:
         """Get a program by ID.
 
@@ -438,6 +1194,11 @@ class ToadrClient:
             The program ID to search for.
         custom_headers : dict[str, str] | None
             Extra headers to include in the request.
+        timeout : float | None
+            Maximum time in seconds for the call, including acquiring the access token and retries.
+            None to use the default timeout of the client.
+        deadline : float | None
+            Absolute deadline of the call in event loop time (`loop.time()`), None for no deadline.
 
         Returns
         -------
@@ -452,22 +1213,31 @@ class ToadrClient:
             If the request to the VTN fails. Specifically, response status 400, 403, or 500,
         aiohttp.ClientError
             If there is an unexpected error with the HTTP request to the VTN.
+        TimeoutError
+            If the call did not complete before the timeout or deadline.
         """
-        try:
-            return await toadr3.get_program_by_id(
-                session=self._session,
-                vtn_url=self._vtn_url,
-                access_token=await self.token,
-                program_id=program_id,
-                custom_headers=self._prepare_headers(custom_headers),
-            )
-        except ToadrError as e:
-            if e.status_code == NOT_FOUND:
-                return None
-            raise e
+        deadline = self._deadline(timeout, deadline)
+        async with asyncio.timeout_at(deadline):
+            try:
+                return await self._get(
+                    toadr3.get_program_by_id,
+                    deadline=deadline,
+                    program_id=program_id,
+                    custom_headers=custom_headers,
+                    validation=self._validation,
+                    hedge_policy=self._hedge_policy,
+                )
+            except ToadrError as e:
+                if e.status_code == NOT_FOUND:
+                    return None
+                raise e
 
     async def delete_program(
-        self, program_id: str, custom_headers: dict[str, str] | None = None
+        self,
+        program_id: str,
+        custom_headers: dict[str, str] | None = None,
+        timeout: float | None = None,
+        deadline: float | None = None,
     ) -> Program | None:
         """Delete a program by ID.
 
@@ -477,6 +1247,11 @@ class ToadrClient:
             The program ID to search for.
         custom_headers : dict[str, str] | None
             Extra headers to include in the request.
+        timeout : float | None
+            Maximum time in seconds for the call, including acquiring the access token and retries.
+            None to use the default timeout of the client.
+        deadline : float | None
+            Absolute deadline of the call in event loop time (`loop.time()`), None for no deadline.
 
         Returns
         -------
@@ -491,25 +1266,37 @@ class ToadrClient:
             If the request to the VTN fails. Specifically, response status 400, 403, or 500,
         aiohttp.ClientError
             If there is an unexpected error with the HTTP request to the VTN.
+        TimeoutError
+            If the call did not complete before the timeout or deadline.
         """
-        try:
-            return await toadr3.delete_program_by_id(
-                session=self._session,
-                vtn_url=self._vtn_url,
-                access_token=await self.token,
-                program_id=program_id,
-                custom_headers=self._prepare_headers(custom_headers),
-            )
-        except ToadrError as e:
-            if e.status_code == NOT_FOUND:
-                return None
-            raise e
+        deadline = self._deadline(timeout, deadline)
+        async with asyncio.timeout_at(deadline):
+            try:
+                return await self._authorized(
+                    toadr3.delete_program_by_id,
+                    deadline=deadline,
+                    session=self._session,
+                    vtn_url=self._vtn_url,
+                    program_id=program_id,
+                    custom_headers=self._prepare_headers(custom_headers),
+                    retry_policy=self._retry_policy,
+                    circuit_breaker=self._circuit_breaker,
+                    rate_limiter=self._rate_limiter,
+                    json_codec=self._json_codec,
+                    metrics=self._metrics,
+                )
+            except ToadrError as e:
+                if e.status_code == NOT_FOUND:
+                    return None
+                raise e
 
     async def put_program(
         self,
         program_id: str,
         program: Program,
         custom_headers: dict[str, str] | None = None,
+        timeout: float | None = None,
+        deadline: float | None = None,
     ) -> Program | None:
         """Update a program by ID.
 
@@ -521,6 +1308,11 @@ class ToadrClient:
             The program object with updated values.
         custom_headers : dict[str, str] | None
             Extra headers to include in the request.
+        timeout : float | None
+            Maximum time in seconds for the call, including acquiring the access token and retries.
+            None to use the default timeout of the client.
+        deadline : float | None
+            Absolute deadline of the call in event loop time (`loop.time()`), None for no deadline.
 
         Returns
         -------
@@ -535,20 +1327,31 @@ class ToadrClient:
             If the request to the VTN fails. Specifically, response status 400, 403, or 500,
         aiohttp.ClientError
             If there is an unexpected error with the HTTP request to the VTN.
+        TimeoutError
+            If the call did not complete before the timeout or deadline.
         """
-        try:
-            return await toadr3.put_program_by_id(
-                session=self._session,
-                vtn_url=self._vtn_url,
-                access_token=await self.token,
-                program_id=program_id,
-                program=program,
-                custom_headers=self._prepare_headers(custom_headers),
-            )
-        except ToadrError as e:
-            if e.status_code == NOT_FOUND:
-                return None
-            raise e
+        deadline = self._deadline(timeout, deadline)
+        async with asyncio.timeout_at(deadline):
+            try:
+                return await self._authorized(
+                    toadr3.put_program_by_id,
+                    deadline=deadline,
+                    session=self._session,
+                    vtn_url=self._vtn_url,
+                    program_id=program_id,
+                    program=program,
+                    custom_headers=self._prepare_headers(custom_headers),
+                    retry_policy=self._retry_policy,
+                    circuit_breaker=self._circuit_breaker,
+                    rate_limiter=self._rate_limiter,
+                    json_codec=self._json_codec,
+                    metrics=self._metrics,
+                    compression=self._compression,
+                )
+            except ToadrError as e:
+                if e.status_code == NOT_FOUND:
+                    return None
+                raise e
 
     async def get_reports(
         self,
@@ -559,6 +1362,8 @@ class ToadrClient:
         limit: int | None = None,
         extra_params: dict[str, str | int | list[str]] | None = None,
         custom_headers: dict[str, str] | None = None,
+        timeout: float | None = None,
+        deadline: float | None = None,
     ) -> list[Report]:
         """Get a list of reports from the VTN.
 
@@ -578,6 +1383,11 @@ class ToadrClient:
             Extra query parameters to include in the request.
         custom_headers : dict[str, str] | None
             Extra headers to include in the request.
+        timeout : float | None
+            Maximum time in seconds for the call, including acquiring the access token and retries.
+            None to use the default timeout of the client.
+        deadline : float | None
+            Absolute deadline of the call in event loop time (`loop.time()`), None for no deadline.
 
         Returns
         -------
@@ -592,11 +1402,159 @@ class ToadrClient:
             If the request to the VTN fails. Specifically, response status 400, 403, or 500,
         aiohttp.ClientError
             If there is an unexpected error with the HTTP request to the VTN.
+        TimeoutError
+            If the call did not complete before the timeout or deadline.
         """
-        return await toadr3.get_reports(
+        deadline = self._deadline(timeout, deadline)
+        async with asyncio.timeout_at(deadline):
+            return await self._get(
+                toadr3.get_reports,
+                deadline=deadline,
+                program_id=program_id,
+                event_id=event_id,
+                client_name=client_name,
+                skip=skip,
+                limit=limit,
+                extra_params=extra_params,
+                custom_headers=custom_headers,
+                validation=self._validation,
+            )
+
+    async def iter_reports(
+        self,
+        program_id: str | None = None,
+        event_id: str | None = None,
+        client_name: str | None = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        max_concurrency: int = 1,
+        extra_params: dict[str, str | int | list[str]] | None = None,
+        custom_headers: dict[str, str] | None = None,
+        timeout: float | None = None,
+        deadline: float | None = None,
+    ) -> AsyncGenerator[Report, None]:
+        """Iterate over all reports from the VTN.
+
+        The reports are requested page by page using skip and limit. Up to `max_concurrency` pages
+        are requested ahead of the page being consumed, and no new pages are requested once a page
+        with fewer than `page_size` reports has been returned. Reports with an ID that has already
+        been yielded are skipped. The access token is refreshed between pages if needed.
+
+        Parameters
+        ----------
+        program_id : str | None
+            The program ID to filter the reports by.
+        event_id : str | None
+            The event ID to filter the reports by.
+        client_name : str | None
+            The client name to filter the reports by.
+        page_size : int
+            The number of reports to request per page.
+        max_concurrency : int
+            The maximum number of pages to request concurrently.
+        extra_params : dict[str, str | int | list[str]] | None
+            Extra query parameters to include in the request.
+        custom_headers : dict[str, str] | None
+            Extra headers to include in the request.
+        timeout : float | None
+            Maximum time in seconds for the whole iteration, shared by all pages and retries.
+            None to use the default timeout of the client.
+        deadline : float | None
+            Absolute deadline of the call in event loop time (`loop.time()`), None for no deadline.
+
+        Yields
+        ------
+        Report
+            The reports in the order returned by the VTN.
+
+        Raises
+        ------
+        ValueError
+            If the query parameters are invalid.
+        toadr3.ToadrError
+            If the request to the VTN fails. Specifically, response status 400, 403, or 500,
+        aiohttp.ClientError
+            If there is an unexpected error with the HTTP request to the VTN.
+        TimeoutError
+            If the iteration did not complete before the timeout or deadline.
+        """
+        deadline = self._deadline(timeout, deadline)
+
+        async def fetch_page(skip: int, limit: int) -> list[Report]:
+            return await self.get_reports(
+                program_id=program_id,
+                event_id=event_id,
+                client_name=client_name,
+                skip=skip,
+                limit=limit,
+                extra_params=extra_params,
+                custom_headers=custom_headers,
+                deadline=deadline,
+            )
+
+        async for report in paginate(fetch_page, page_size, max_concurrency):
+            yield report
+
+    async def stream_reports(
+        self,
+        program_id: str | None = None,
+        event_id: str | None = None,
+        client_name: str | None = None,
+        skip: int | None = None,
+        limit: int | None = None,
+        extra_params: dict[str, str | int | list[str]] | None = None,
+        custom_headers: dict[str, str] | None = None,
+        timeout: float | None = None,
+        deadline: float | None = None,
+    ) -> AsyncGenerator[Report, None]:
+        """Stream the reports from the VTN, validating each report as soon as its bytes arrive.
+
+        Unlike `get_reports`, the response is not read into memory before it is validated, so the
+        memory used is about one report instead of the whole list. Streamed requests are not
+        cached, coalesced or retried.
+
+        Parameters
+        ----------
+        program_id : str | None
+            The program ID to filter the reports by.
+        event_id : str | None
+            The event ID to filter the reports by.
+        client_name : str | None
+            The client name to filter the reports by.
+        skip : int | None
+            The number of reports to skip (for pagination).
+        limit : int | None
+            The maximum number of reports to return.
+        extra_params : dict[str, str | int | list[str]] | None
+            Extra query parameters to include in the request.
+        custom_headers : dict[str, str] | None
+            Extra headers to include in the request.
+        timeout : float | None
+            Maximum time in seconds for the request and reading the whole response. None to use
+            the default timeout of the client.
+        deadline : float | None
+            Absolute deadline of the call in event loop time (`loop.time()`), None for no deadline.
+
+        Yields
+        ------
+        Report
+            The reports in the order returned by the VTN.
+
+        Raises
+        ------
+        ValueError
+            If the query parameters are invalid, or the response is not a list of valid reports.
+        toadr3.ToadrError
+            If the request to the VTN fails. Specifically, response status 400, 403, or 500,
+        aiohttp.ClientError
+            If there is an unexpected error with the HTTP request to the VTN.
+        TimeoutError
+            If the request did not complete before the timeout or deadline.
+        """
+        async for report in self._authorized_stream(
+            toadr3.stream_reports,
+            self._deadline(timeout, deadline),
             session=self._session,
             vtn_url=self._vtn_url,
-            access_token=await self.token,
             program_id=program_id,
             event_id=event_id,
             client_name=client_name,
@@ -604,12 +1562,19 @@ class ToadrClient:
             limit=limit,
             extra_params=extra_params,
             custom_headers=self._prepare_headers(custom_headers),
-        )
+            circuit_breaker=self._circuit_breaker,
+            rate_limiter=self._rate_limiter,
+            json_codec=self._json_codec,
+            validation=self._validation,
+        ):
+            yield report
 
     async def post_report(
         self,
         report: Report,
         custom_headers: dict[str, str] | None = None,
+        timeout: float | None = None,
+        deadline: float | None = None,
     ) -> Report:
         """Post a report to the VTN.
 
@@ -619,6 +1584,11 @@ class ToadrClient:
             The report object to post.
         custom_headers : dict[str, str] | None
             Extra headers to include in the request.
+        timeout : float | None
+            Maximum time in seconds for the call, including acquiring the access token and retries.
+            None to use the default timeout of the client.
+        deadline : float | None
+            Absolute deadline of the call in event loop time (`loop.time()`), None for no deadline.
 
         Returns
         -------
@@ -633,17 +1603,69 @@ class ToadrClient:
             If the request to the VTN fails. Specifically, response status 400, 403, 409, or 500,
         aiohttp.ClientError
             If there is an unexpected error with the HTTP request to the VTN.
+        TimeoutError
+            If the call did not complete before the timeout or deadline.
         """
-        return await toadr3.post_report(
-            session=self._session,
-            vtn_url=self._vtn_url,
-            access_token=await self.token,
-            report=report,
-            custom_headers=self._prepare_headers(custom_headers),
-        )
+        deadline = self._deadline(timeout, deadline)
+        async with asyncio.timeout_at(deadline):
+            return await self._authorized(
+                toadr3.post_report,
+                deadline=deadline,
+                session=self._session,
+                vtn_url=self._vtn_url,
+                report=report,
+                custom_headers=self._prepare_headers(custom_headers),
+                retry_policy=self._retry_policy,
+                circuit_breaker=self._circuit_breaker,
+                rate_limiter=self._rate_limiter,
+                json_codec=self._json_codec,
+                metrics=self._metrics,
+                compression=self._compression,
+            )
+
+    async def warm_up(self, connections: int | None = None) -> int:
+        """Open keep-alive connections to the VTN ahead of the first requests.
+
+        The connections are opened with concurrent HEAD requests to the VTN URL and returned to
+        the connection pool, so later requests do not have to wait for TCP and TLS handshakes.
+        The status of the responses is ignored.
+
+        Parameters
+        ----------
+        connections : int | None
+            The number of connections to open, None to use the number from the connection
+            configuration.
+
+        Returns
+        -------
+        int
+            The number of connections that were opened successfully.
+        """
+        if connections is None:
+            connections = (
+                self._connection_config.warm_up_connections
+                if self._connection_config is not None
+                else 0
+            )
+
+        async def connect() -> bool:
+            try:
+                async with self._session.head(self._vtn_url) as response:
+                    await response.read()
+            except (aiohttp.ClientError, TimeoutError):
+                return False
+            return True
+
+        results = await asyncio.gather(*(connect() for _ in range(connections)))
+        return sum(results)
 
     async def close(self) -> None:
-        """Close the client session."""
+        """Close the client session and stop refreshing the access token."""
+        if self._token_refresh_task is not None:
+            _ = self._token_refresh_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._token_refresh_task
+            self._token_refresh_task = None
         await self._session.close()
         self._closed = True
 
@@ -651,6 +1673,8 @@ class ToadrClient:
         """Enter async context."""
         if self.closed:
             raise RuntimeError("Client is closed")
+        if self._connection_config is not None and self._connection_config.warm_up_connections:
+            await self.warm_up()
         return self
 
     async def __aexit__(
@@ -0,0 +1,95 @@
+import asyncio
+import gzip
+import zlib
+from typing import Literal
+
+_THREAD_THRESHOLD = 1024 * 1024
+"""Bodies larger than this are compressed in a thread to not block the event loop."""
+
+
+class RequestCompression:
+    """Compression of the JSON bodies of POST and PUT requests.
+
+    Bodies of at least `threshold` bytes are compressed and sent with a Content-Encoding
+    header. If the VTN rejects a compressed body with 415 Unsupported Media Type, the request
+    is sent again uncompressed and compression is disabled from then on.
+
+    Compressed responses do not need any configuration: aiohttp advertises the encodings it
+    supports with Accept-Encoding and decompresses responses automatically.
+    """
+
+    def __init__(
+        self,
+        encoding: Literal["gzip", "deflate"] = "gzip",
+        threshold: int = 1024,
+        level: int = 6,
+    ) -> None:
+        """Initialize the request compression.
+
+        Parameters
+        ----------
+        encoding : Literal["gzip", "deflate"]
+            The content encoding to use.
+        threshold : int
+            The minimum size in bytes of a body before it is compressed.
+        level : int
+            The compression level from 1 (fastest) to 9 (smallest).
+        """
+        if encoding not in {"gzip", "deflate"}:
+            raise ValueError(f"Unsupported encoding {encoding}")
+
+        if not isinstance(threshold, int) or threshold < 0:
+            raise ValueError("threshold must be a non-negative integer")
+
+        if not isinstance(level, int) or not 1 <= level <= 9:  # noqa: PLR2004
+            raise ValueError("level must be an integer between 1 and 9")
+
+        self._encoding = encoding
+        self._threshold = threshold
+        self._level = level
+        self._enabled = True
+
+    @property
+    def encoding(self) -> str:
+        """The content encoding of compressed bodies."""
+        return self._encoding
+
+    @property
+    def threshold(self) -> int:
+        """The minimum size in bytes of a body before it is compressed."""
+        return self._threshold
+
+    @property
+    def enabled(self) -> bool:
+        """Whether bodies are compressed, False after the VTN rejected a compressed body."""
+        return self._enabled
+
+    def disable(self) -> None:
+        """Stop compressing bodies."""
+        self._enabled = False
+
+    def _compress(self, data: bytes) -> bytes:
+        if self._encoding == "gzip":
+            return gzip.compress(data, compresslevel=self._level)
+        return zlib.compress(data, self._level)
+
+    async def compress(self, body: str) -> bytes | None:
+        """Compress a request body.
+
+        Parameters
+        ----------
+        body : str
+            The JSON body of the request.
+
+        Returns
+        -------
+        bytes | None
+            The compressed body or None if the body should be sent uncompressed.
+        """
+        data = body.encode()
+        if not self._enabled or len(data) < self._threshold:
+            return None
+
+        if len(data) > _THREAD_THRESHOLD:
+            return await asyncio.to_thread(self._compress, data)
+        return self._compress(data)
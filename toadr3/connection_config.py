@@ -0,0 +1,100 @@
+import aiohttp
+
+
+class ConnectionConfig:
+    """Configuration of the connection pool of a session created by the client.
+
+    DNS lookups are made with aiodns and cached for `dns_cache_ttl` seconds. TCP_NODELAY is
+    enabled by aiohttp on every connection, so small requests are not delayed by Nagle's
+    algorithm.
+    """
+
+    def __init__(
+        self,
+        limit: int = 100,
+        limit_per_host: int = 0,
+        keepalive_timeout: float = 15.0,
+        dns_cache_ttl: int | None = 10,
+        warm_up_connections: int = 0,
+    ) -> None:
+        """Initialize the connection configuration.
+
+        Parameters
+        ----------
+        limit : int
+            The maximum number of simultaneous connections, 0 for no limit.
+        limit_per_host : int
+            The maximum number of simultaneous connections to the same host, 0 for no limit.
+        keepalive_timeout : float
+            The time in seconds an idle connection is kept open for reuse.
+        dns_cache_ttl : int | None
+            The time in seconds DNS lookups are cached, None to cache them forever.
+        warm_up_connections : int
+            The number of connections to open to the VTN when the client is entered as an
+            async context manager.
+        """
+        for name, value in (
+            ("limit", limit),
+            ("limit_per_host", limit_per_host),
+            ("warm_up_connections", warm_up_connections),
+        ):
+            if not isinstance(value, int) or value < 0:
+                raise ValueError(f"{name} must be a non-negative integer")
+
+        if keepalive_timeout <= 0:
+            raise ValueError("keepalive_timeout must be positive")
+
+        if dns_cache_ttl is not None and dns_cache_ttl <= 0:
+            raise ValueError("dns_cache_ttl must be positive or None")
+
+        self._limit = limit
+        self._limit_per_host = limit_per_host
+        self._keepalive_timeout = keepalive_timeout
+        self._dns_cache_ttl = dns_cache_ttl
+        self._warm_up_connections = warm_up_connections
+
+    @property
+    def limit(self) -> int:
+        """The maximum number of simultaneous connections."""
+        return self._limit
+
+    @property
+    def limit_per_host(self) -> int:
+        """The maximum number of simultaneous connections to the same host."""
+        return self._limit_per_host
+
+    @property
+    def keepalive_timeout(self) -> float:
+        """The time in seconds an idle connection is kept open."""
+        return self._keepalive_timeout
+
+    @property
+    def dns_cache_ttl(self) -> int | None:
+        """The time in seconds DNS lookups are cached."""
+        return self._dns_cache_ttl
+
+    @property
+    def warm_up_connections(self) -> int:
+        """The number of connections opened when the client is entered."""
+        return self._warm_up_connections
+
+    def create_session(
+        self, trace_configs: list[aiohttp.TraceConfig] | None = None
+    ) -> aiohttp.ClientSession:
+        """Create a session with a connection pool using this configuration.
+
+        Must be called with a running event loop.
+
+        Parameters
+        ----------
+        trace_configs : list[aiohttp.TraceConfig] | None
+            Trace configs of the session or None for no tracing.
+        """
+        connector = aiohttp.TCPConnector(
+            limit=self._limit,
+            limit_per_host=self._limit_per_host,
+            keepalive_timeout=self._keepalive_timeout,
+            ttl_dns_cache=self._dns_cache_ttl,
+            resolver=aiohttp.AsyncResolver(),
+        )
+        return aiohttp.ClientSession(connector=connector, trace_configs=trace_configs)
@@ -1,10 +1,35 @@
+import functools
+from collections.abc import AsyncGenerator
+from typing import Literal
+
 import aiohttp
 
-from ._internal import ParameterBuilder, ProgramID, SkipAndLimit, Targets, get_query
+from ._internal import (
+    DEFAULT_PAGE_SIZE,
+    ListAdapter,
+    ParameterBuilder,
+    ProgramID,
+    SkipAndLimit,
+    Targets,
+    get_query,
+    lazy_parser,
+    model_parser,
+    paginate,
+    stream_query,
+)
 from .access_token import AccessToken
-from .models import Event, TargetType
+from .circuit_breaker import CircuitBreaker
+from .hedge_policy import HedgePolicy
+from .json_codec import JsonCodec
+from .models import Event, LazyEvent, TargetType
+from .rate_limiter import RateLimiter
+from .request_metrics import RequestMetrics
+from .response_cache import ResponseCache
+from .retry_policy import RetryPolicy
 
 _GET_PARAMS_BUILDER = ParameterBuilder(ProgramID, Targets, SkipAndLimit)
+_EVENTS_ADAPTER = ListAdapter(Event)
+_LAZY_EVENTS_ADAPTER = ListAdapter(LazyEvent)
 
 
 async def get_events(
@@ -18,6 +43,16 @@ async def get_events(
     limit: int | None = None,
     extra_params: dict[str, str | int | list[str]] | None = None,
     custom_headers: dict[str, str] | None = None,
+    cache: ResponseCache | None = None,
+    retry_policy: RetryPolicy | None = None,
+    circuit_breaker: CircuitBreaker | None = None,
+    rate_limiter: RateLimiter | None = None,
+    json_codec: JsonCodec | None = None,
+    validation: Literal["full", "trusted"] = "full",
+    lazy: bool = False,
+    metrics: RequestMetrics | None = None,
+    hedge_policy: HedgePolicy | None = None,
+    deadline: float | None = None,
 ) -> list[Event]:
     """Get a list of events from the VTN.
 
@@ -46,6 +81,27 @@ async def get_events(
         Extra query parameters to include in the request.
     custom_headers : dict[str, str] | None
         Extra headers to include in the request.
+    cache : ResponseCache | None
+        Cache used to make the request conditional and reuse unchanged results.
+    retry_policy : RetryPolicy | None
+        Policy for retrying failed requests or None to not retry.
+    circuit_breaker : CircuitBreaker | None
+        Circuit breaker guarding the VTN or None to always send requests.
+    rate_limiter : RateLimiter | None
+        Rate limiter for the requests to the VTN or None to not limit requests.
+    json_codec : JsonCodec | None
+        Codec used to decode JSON responses or None to use the fastest available codec.
+    validation : Literal["full", "trusted"]
+        "full" to check all constraints of the returned objects, "trusted" to skip the checks.
+    lazy : bool
+        Validate the intervals, targets and report descriptors of the returned events on first
+        access, the events are `toadr3.models.LazyEvent` instances.
+    metrics : RequestMetrics | None
+        Metrics recording the latency breakdown of requests or None to not record them.
+    hedge_policy : HedgePolicy | None
+        Policy for hedging slow GET requests or None to not hedge them.
+    deadline : float | None
+        Absolute deadline in event loop time for the request and its retries, None for no deadline.
 
     Returns
     -------
@@ -60,6 +116,8 @@ async def get_events(
         If the request to the VTN fails. Specifically, if the response status is 400, 403, or 500,
     aiohttp.ClientError
         If there is an unexpected error with the HTTP request to the VTN.
+    TimeoutError
+        If the request did not complete before the deadline.
     """
     args = {
         "program_id": program_id,
@@ -71,12 +129,235 @@ async def get_events(
     _GET_PARAMS_BUILDER.check_query_parameters(args)
     params = _GET_PARAMS_BUILDER.build_query_parameters(args, extra_params)
 
-    data = await get_query(session, f"{vtn_url}/events", access_token, params, custom_headers)
+    result: list[Event] = await get_query(
+        session,
+        f"{vtn_url}/events",
+        access_token,
+        params,
+        custom_headers,
+        parser=functools.partial(
+            (_LAZY_EVENTS_ADAPTER if lazy else _EVENTS_ADAPTER).validate_json,
+            validation=validation,
+        ),
+        cache=cache,
+        retry_policy=retry_policy,
+        circuit_breaker=circuit_breaker,
+        rate_limiter=rate_limiter,
+        json_codec=json_codec,
+        metrics=metrics,
+        hedge_policy=hedge_policy,
+        deadline=deadline,
+    )
+    return result
 
-    if not isinstance(data, list):
-        raise ValueError(f"Expected result to be a list. Got {type(data)} instead.")
 
-    result = []
-    for event in data:
-        result.append(Event.model_validate(event))
-    return result
+async def iter_events(
+    session: aiohttp.ClientSession,
+    vtn_url: str,
+    access_token: AccessToken | None,
+    program_id: str | None = None,
+    target_type: TargetType | str | None = None,
+    target_values: list[str] | None = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    max_concurrency: int = 1,
+    extra_params: dict[str, str | int | list[str]] | None = None,
+    custom_headers: dict[str, str] | None = None,
+    retry_policy: RetryPolicy | None = None,
+    circuit_breaker: CircuitBreaker | None = None,
+    rate_limiter: RateLimiter | None = None,
+    json_codec: JsonCodec | None = None,
+    validation: Literal["full", "trusted"] = "full",
+    lazy: bool = False,
+    metrics: RequestMetrics | None = None,
+    deadline: float | None = None,
+) -> AsyncGenerator[Event, None]:
+    """Iterate over all events from the VTN.
+
+    The events are requested page by page using skip and limit. Up to `max_concurrency` pages are
+    requested ahead of the page being consumed, and no new pages are requested once a page with
+    fewer than `page_size` events has been returned. Events with an ID that has already been yielded
+    are skipped.
+
+    Parameters
+    ----------
+    session : aiohttp.ClientSession
+        The aiohttp session to use for the request.
+    vtn_url : str
+        The URL of the VTN.
+    access_token : AccessToken | None
+        The access token to use for the request, use None if no token is required.
+    program_id : str | None
+        The program ID to filter the events by.
+    target_type : TargetType | str | None
+        The target type to filter the events by.
+    target_values : list[str] | None
+        The target values to filter the events by (names of the target type).
+    page_size : int
+        The number of events to request per page.
+    max_concurrency : int
+        The maximum number of pages to request concurrently.
+    extra_params : dict[str, str | int | list[str]] | None
+        Extra query parameters to include in the request.
+    custom_headers : dict[str, str] | None
+        Extra headers to include in the request.
+    retry_policy : RetryPolicy | None
+        Policy for retrying failed requests or None to not retry.
+    circuit_breaker : CircuitBreaker | None
+        Circuit breaker guarding the VTN or None to always send requests.
+    rate_limiter : RateLimiter | None
+        Rate limiter for the requests to the VTN or None to not limit requests.
+    json_codec : JsonCodec | None
+        Codec used to decode JSON responses or None to use the fastest available codec.
+    validation : Literal["full", "trusted"]
+        "full" to check all constraints of the returned objects, "trusted" to skip the checks.
+    lazy : bool
+        Validate the intervals, targets and report descriptors of the returned events on first
+        access, the events are `toadr3.models.LazyEvent` instances.
+    metrics : RequestMetrics | None
+        Metrics recording the latency breakdown of requests or None to not record them.
+    deadline : float | None
+        Absolute deadline in event loop time for the requests of all pages and their retries, None
+        for no deadline.
+
+    Yields
+    ------
+    Event
+        The events in the order returned by the VTN.
+
+    Raises
+    ------
+    ValueError
+        If the query parameters are invalid.
+    toadr3.ToadrError
+        If the request to the VTN fails. Specifically, if the response status is 400, 403, or 500,
+    aiohttp.ClientError
+        If there is an unexpected error with the HTTP request to the VTN.
+    TimeoutError
+        If the iteration did not complete before the deadline.
+    """
+
+    async def fetch_page(skip: int, limit: int) -> list[Event]:
+        return await get_events(
+            session,
+            vtn_url,
+            access_token,
+            program_id=program_id,
+            target_type=target_type,
+            target_values=target_values,
+            skip=skip,
+            limit=limit,
+            extra_params=extra_params,
+            custom_headers=custom_headers,
+            retry_policy=retry_policy,
+            circuit_breaker=circuit_breaker,
+            rate_limiter=rate_limiter,
+            json_codec=json_codec,
+            validation=validation,
+            lazy=lazy,
+            metrics=metrics,
+            deadline=deadline,
+        )
+
+    async for event in paginate(fetch_page, page_size, max_concurrency):
+        yield event
+
+
+async def stream_events(
+    session: aiohttp.ClientSession,
+    vtn_url: str,
+    access_token: AccessToken | None,
+    program_id: str | None = None,
+    target_type: TargetType | str | None = None,
+    target_values: list[str] | None = None,
+    skip: int | None = None,
+    limit: int | None = None,
+    extra_params: dict[str, str | int | list[str]] | None = None,
+    custom_headers: dict[str, str] | None = None,
+    circuit_breaker: CircuitBreaker | None = None,
+    rate_limiter: RateLimiter | None = None,
+    json_codec: JsonCodec | None = None,
+    validation: Literal["full", "trusted"] = "full",
+    lazy: bool = False,
+    deadline: float | None = None,
+) -> AsyncGenerator[Event, None]:
+    """Stream the events from the VTN, validating each event as soon as its bytes arrive.
+
+    Unlike `get_events`, the response is not read into memory before it is validated, so the
+    memory used is about one event instead of the whole list. Streamed requests are not retried.
+
+    Parameters
+    ----------
+    session : aiohttp.ClientSession
+        The aiohttp session to use for the request.
+    vtn_url : str
+        The URL of the VTN.
+    access_token : AccessToken | None
+        The access token to use for the request, use None if no token is required.
+    program_id : str | None
+        The program ID to filter the events by.
+    target_type : TargetType | str | None
+        The target type to filter the events by.
+    target_values : list[str] | None
+        The target values to filter the events by (names of the target type).
+    skip : int | None
+        The number of events to skip (for pagination).
+    limit : int | None
+        The maximum number of events to return.
+    extra_params : dict[str, str | int | list[str]] | None
+        Extra query parameters to include in the request.
+    custom_headers : dict[str, str] | None
+        Extra headers to include in the request.
+    circuit_breaker : CircuitBreaker | None
+        Circuit breaker guarding the VTN or None to always send requests.
+    rate_limiter : RateLimiter | None
+        Rate limiter for the requests to the VTN or None to not limit requests.
+    json_codec : JsonCodec | None
+        Codec used to decode error responses or None to use the fastest available codec.
+    validation : Literal["full", "trusted"]
+        "full" to check all constraints of the returned objects, "trusted" to skip the checks.
+    lazy : bool
+        Validate the intervals, targets and report descriptors of the returned events on first
+        access, the events are `toadr3.models.LazyEvent` instances.
+    deadline : float | None
+        Absolute deadline in event loop time for the request and every read of the body, None
+        for no deadline.
+
+    Yields
+    ------
+    Event
+        The events in the order returned by the VTN.
+
+    Raises
+    ------
+    ValueError
+        If the query parameters are invalid, or the response is not a list of valid events.
+    toadr3.ToadrError
+        If the request to the VTN fails. Specifically, if the response status is 400, 403, or 500,
+    aiohttp.ClientError
+        If there is an unexpected error with the HTTP request to the VTN.
+    TimeoutError
+        If the request or a read of the body did not complete before the deadline.
+    """
+    args = {
+        "program_id": program_id,
+        "target_type": target_type,
+        "target_values": target_values,
+        "skip": skip,
+        "limit": limit,
+    }
+    _GET_PARAMS_BUILDER.check_query_parameters(args)
+    params = _GET_PARAMS_BUILDER.build_query_parameters(args, extra_params)
+
+    async for event in stream_query(
+        session,
+        f"{vtn_url}/events",
+        access_token,
+        params,
+        custom_headers,
+        parser=lazy_parser(LazyEvent, validation) if lazy else model_parser(Event, validation),
+        circuit_breaker=circuit_breaker,
+        rate_limiter=rate_limiter,
+        json_codec=json_codec,
+        deadline=deadline,
+    ):
+        yield event
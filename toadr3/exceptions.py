@@ -3,10 +3,13 @@ from typing import Any
 from .models import Problem
 
 OK = 200
+NOT_MODIFIED = 304
 BAD_REQUEST = 400
 UNAUTHORIZED = 401
 FORBIDDEN = 403
 NOT_FOUND = 404
+UNSUPPORTED_MEDIA_TYPE = 415
+TOO_MANY_REQUESTS = 429
 INTERNAL_SERVER_ERROR = 500
 
 
@@ -97,3 +100,12 @@ class ToadrError(Exception):
             status_code=status_code,
             json_response=problem.model_dump(),
         )
+
+
+class CircuitOpenError(ToadrError):
+    """Exception raised when a circuit breaker rejects a request without sending it to the VTN.
+
+    It has status 503 and a Retry-After header with the time until the circuit half-opens, but
+    it is never retried, so callers fail fast instead of all retrying when the circuit
+    half-opens.
+    """
@@ -0,0 +1,182 @@
+import asyncio
+import collections
+import time
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+
+from .request_metrics import endpoint_name
+
+T = TypeVar("T")
+
+
+class HedgePolicy:
+    """Policy for hedging idempotent GET requests to cut the tail latency.
+
+    If no response has arrived after the hedge delay, a second identical request is sent.
+    The first successful response is used and the other request is cancelled. The delay is
+    either fixed or the observed percentile of the latency of recent responses from the same
+    endpoint, so only the slowest requests are hedged.
+
+    The budget caps the extra load on the VTN: at most `budget` of the last `window_size`
+    requests are hedged, counting only the requests observed so far.
+    """
+
+    def __init__(
+        self,
+        delay: float | None = None,
+        percentile: float = 0.95,
+        min_samples: int = 20,
+        window_size: int = 100,
+        budget: float = 0.1,
+    ) -> None:
+        """Initialize the hedge policy.
+
+        Parameters
+        ----------
+        delay : float | None
+            The fixed delay in seconds before a request is hedged, or None to use the observed
+            percentile of the latency.
+        percentile : float
+            The percentile of the observed latency used as the delay, between 0 and 1.
+        min_samples : int
+            The number of responses from an endpoint needed before its requests are hedged with
+            the observed percentile.
+        window_size : int
+            The number of recent latencies and requests used for the percentile and the budget.
+        budget : float
+            The maximum fraction of requests that are hedged, between 0 and 1.
+        """
+        if delay is not None and delay < 0:
+            raise ValueError("delay must be a non-negative number or None")
+
+        if not 0 < percentile < 1:
+            raise ValueError("percentile must be between 0 and 1")
+
+        if not isinstance(window_size, int) or window_size < 1:
+            raise ValueError("window_size must be a positive integer")
+
+        if not isinstance(min_samples, int) or not 1 <= min_samples <= window_size:
+            raise ValueError("min_samples must be a positive integer not larger than window_size")
+
+        if not 0 <= budget <= 1:
+            raise ValueError("budget must be between 0 and 1")
+
+        self._delay = delay
+        self._percentile = percentile
+        self._min_samples = min_samples
+        self._window_size = window_size
+        self._budget = budget
+        self._latencies: dict[str, collections.deque[float]] = {}
+        self._hedged: collections.deque[bool] = collections.deque(maxlen=window_size)
+
+    @property
+    def budget(self) -> float:
+        """The maximum fraction of requests that are hedged."""
+        return self._budget
+
+    @property
+    def hedge_rate(self) -> float:
+        """The fraction of the recent requests that were hedged."""
+        return sum(self._hedged) / len(self._hedged) if self._hedged else 0.0
+
+    def hedge_delay(self, url: str) -> float | None:
+        """Get the delay before a request to the URL is hedged.
+
+        Parameters
+        ----------
+        url : str
+            The URL of the request.
+
+        Returns
+        -------
+        float | None
+            The delay in seconds or None if the request is not hedged because too few
+            latencies of the endpoint have been observed.
+        """
+        if self._delay is not None:
+            return self._delay
+
+        latencies = self._latencies.get(endpoint_name(url))
+        if latencies is None or len(latencies) < self._min_samples:
+            return None
+
+        ordered = sorted(latencies)
+        return ordered[min(int(self._percentile * len(ordered)), len(ordered) - 1)]
+
+    def reset(self) -> None:
+        """Forget the observed latencies and hedged requests."""
+        self._latencies.clear()
+        self._hedged.clear()
+
+    async def run(self, url: str, request: Callable[[], Awaitable[T]]) -> T:
+        """Perform a request, hedging it if it is slower than the hedge delay.
+
+        Parameters
+        ----------
+        url : str
+            The URL of the request, used to observe the latency per endpoint.
+        request : Callable[[], Awaitable[T]]
+            Function performing the request, called once more for the hedged request.
+
+        Returns
+        -------
+        T
+            The result of the first request that succeeds.
+        """
+        latencies = self._latencies.setdefault(
+            endpoint_name(url), collections.deque(maxlen=self._window_size)
+        )
+
+        async def timed(primary: bool) -> T:
+            started = time.monotonic()
+            try:
+                result = await request()
+            except asyncio.CancelledError:
+                if primary:
+                    # a slow primary that lost to its hedge took at least this long
+                    latencies.append(time.monotonic() - started)
+                raise
+            latencies.append(time.monotonic() - started)
+            return result
+
+        delay = self.hedge_delay(url)
+        if delay is None:
+            self._hedged.append(False)
+            return await timed(primary=True)
+
+        primary = asyncio.ensure_future(timed(primary=True))
+        tasks: list[asyncio.Future[T]] = [primary]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            hedge = not done and self._within_budget()
+            self._hedged.append(hedge)
+            if not hedge:
+                return await primary
+
+            tasks.append(asyncio.ensure_future(timed(primary=False)))
+            return await _first_result(tasks)
+        finally:
+            for task in tasks:
+                _ = task.cancel()
+            _ = await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _within_budget(self) -> bool:
+        """Check if another request can be hedged without exceeding the budget."""
+        requests = min(len(self._hedged) + 1, self._window_size)
+        return sum(self._hedged) + 1 <= self._budget * requests
+
+
+async def _first_result(tasks: list[asyncio.Future[T]]) -> T:
+    """Get the first successful result of the tasks, or raise the first error if all fail."""
+    errors: list[BaseException] = []
+    pending = set(tasks)
+    while pending:
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for task in tasks:
+            if task in done:
+                task_error = task.exception()
+                if task_error is None:
+                    return task.result()
+                errors.append(task_error)
+
+    raise errors[0]
@@ -0,0 +1,106 @@
+import functools
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover
+    msgspec = None  # type: ignore[assignment]
+
+
+class JsonCodec:
+    """JSON codec using the standard library `json` module.
+
+    Used to decode JSON responses that are not validated directly by a pydantic model, such
+    as error responses and access tokens. Subclasses use faster JSON libraries.
+    """
+
+    name = "json"
+
+    def loads(self, data: str | bytes) -> Any:  # noqa: ANN401
+        """Decode a JSON document."""
+        return json.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:  # noqa: ANN401
+        """Encode an object as a compact JSON document."""
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+
+class OrjsonCodec(JsonCodec):
+    """JSON codec using orjson."""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        """Initialize the codec.
+
+        Raises
+        ------
+        RuntimeError
+            If orjson is not installed.
+        """
+        if orjson is None:  # pragma: no cover
+            raise RuntimeError("orjson is not installed")
+
+    def loads(self, data: str | bytes) -> Any:  # noqa: ANN401
+        """Decode a JSON document."""
+        return orjson.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:  # noqa: ANN401
+        """Encode an object as a compact JSON document."""
+        return orjson.dumps(obj)
+
+
+class MsgspecCodec(JsonCodec):
+    """JSON codec using msgspec."""
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        """Initialize the codec.
+
+        Raises
+        ------
+        RuntimeError
+            If msgspec is not installed.
+        """
+        if msgspec is None:  # pragma: no cover
+            raise RuntimeError("msgspec is not installed")
+
+        self._decoder = msgspec.json.Decoder()
+        self._encoder = msgspec.json.Encoder()
+
+    def loads(self, data: str | bytes) -> Any:  # noqa: ANN401
+        """Decode a JSON document.
+
+        Raises
+        ------
+        ValueError
+            If the document is not valid JSON.
+        """
+        try:
+            return self._decoder.decode(data)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+
+    def dumps(self, obj: Any) -> bytes:  # noqa: ANN401
+        """Encode an object as a compact JSON document."""
+        return self._encoder.encode(obj)
+
+
+@functools.cache
+def default_json_codec() -> JsonCodec:
+    """Get the fastest available JSON codec.
+
+    orjson is preferred over msgspec, and the standard library is used if neither is installed.
+    """
+    if orjson is not None:
+        return OrjsonCodec()
+    if msgspec is not None:  # pragma: no cover
+        return MsgspecCodec()
+    return JsonCodec()  # pragma: no cover
@@ -1,8 +1,11 @@
+from .columns import Column, IntervalColumns, events_to_columns
 from .docstringbasemodel import DocstringBaseModel
 from .event import Event
 from .eventpayloaddescriptor import EventPayloadDescriptor
+from .eventview import EventView, IntervalsView, ModelView
 from .interval import Interval
 from .intervalperiod import IntervalPeriod
+from .lazyevent import LazyEvent
 from .objectoperation import ObjectOperation, ObjectType, OperationType
 from .problem import Problem
 from .program import Program
@@ -15,11 +18,17 @@ from .targettype import TargetType
 from .valuesmap import Point, ValuesMap
 
 __all__ = [
+    "Column",
     "DocstringBaseModel",
     "Event",
     "EventPayloadDescriptor",
+    "EventView",
     "Interval",
+    "IntervalColumns",
     "IntervalPeriod",
+    "IntervalsView",
+    "LazyEvent",
+    "ModelView",
     "ObjectOperation",
     "ObjectType",
     "OperationType",
@@ -33,4 +42,5 @@ __all__ = [
     "Subscription",
     "TargetType",
     "ValuesMap",
+    "events_to_columns",
 ]
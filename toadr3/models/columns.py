@@ -0,0 +1,178 @@
+import array
+import datetime
+import math
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore[assignment]
+
+from .interval import Interval
+from .intervalperiod import IntervalPeriod
+
+if TYPE_CHECKING:
+    from .event import Event
+
+Column = Any
+"""A contiguous column, a `numpy.ndarray` or an `array.array` when NumPy is not installed."""
+
+
+class IntervalColumns:
+    """Interval data of events or reports as contiguous columns with one row per interval.
+
+    The columns are NumPy arrays when NumPy is installed, and `array.array` otherwise. The start
+    and duration of every interval are resolved from its own interval period, or from the default
+    interval period of its event or report resource. Intervals using the default period follow
+    each other, so the interval at position `n` starts `n` durations after the default start.
+    Times that cannot be resolved, such as the unspecified start "0000-00-00", are NaN.
+
+    Attributes
+    ----------
+    ids : Column
+        The IDs of the intervals (int64).
+    starts : Column
+        The start times of the intervals as POSIX timestamps in seconds (float64). Start times
+        without a time zone are UTC.
+    durations : Column
+        The durations of the intervals in seconds (float64).
+    groups : Column
+        The position of the event or report resource of each interval in its list (int64).
+    values : dict[str, Column]
+        The first value of the payload of each payload type (float64). The value is NaN for
+        intervals without a payload of the type, or if the value is not a number.
+    """
+
+    __slots__ = ("durations", "groups", "ids", "starts", "values")
+
+    def __init__(
+        self,
+        ids: Column,
+        starts: Column,
+        durations: Column,
+        groups: Column,
+        values: dict[str, Column],
+    ) -> None:
+        self.ids = ids
+        self.starts = starts
+        self.durations = durations
+        self.groups = groups
+        self.values = values
+
+    def __len__(self) -> int:
+        """Return the number of intervals."""
+        return len(self.ids)
+
+    def __repr__(self) -> str:
+        """Return a string representation of the columns."""
+        return f"IntervalColumns({len(self)} intervals, payload types {list(self.values)})"
+
+
+def intervals_to_columns(
+    parts: Iterable[tuple[IntervalPeriod | None, list[Interval]]],
+) -> IntervalColumns:
+    """Convert lists of intervals to columns.
+
+    Parameters
+    ----------
+    parts : Iterable[tuple[IntervalPeriod | None, list[Interval]]]
+        The default interval period and the intervals of each event or report resource.
+
+    Returns
+    -------
+    IntervalColumns
+        The intervals of all parts, in order.
+    """
+    ids: list[int] = []
+    starts: list[float] = []
+    durations: list[float] = []
+    groups: list[int] = []
+    # the rows and values of each payload type, the other rows are filled with NaN at the end
+    payload_rows: dict[str, dict[int, float]] = {}
+
+    for group, (default, intervals) in enumerate(parts):
+        default_start, default_duration = _resolve(default)
+        for position, interval in enumerate(intervals):
+            if interval.interval_period is not None:
+                start, duration = _resolve(interval.interval_period)
+            else:
+                start = default_start + position * default_duration
+                duration = default_duration
+
+            row = len(ids)
+            ids.append(interval.id)
+            starts.append(start)
+            durations.append(duration)
+            groups.append(group)
+
+            for payload in interval.payloads:
+                rows = payload_rows.get(payload.type)
+                if rows is None:
+                    rows = payload_rows[payload.type] = {}
+                # a repeated payload type keeps its first value
+                if row not in rows:
+                    value = payload.values[0] if payload.values else None
+                    rows[row] = float(value) if isinstance(value, int | float) else math.nan
+
+    return IntervalColumns(
+        ids=_column(ids, "q"),
+        starts=_column(starts, "d"),
+        durations=_column(durations, "d"),
+        groups=_column(groups, "q"),
+        values={
+            payload_type: _sparse_column(rows, len(ids))
+            for payload_type, rows in payload_rows.items()
+        },
+    )
+
+
+def events_to_columns(events: Iterable["Event"]) -> IntervalColumns:
+    """Convert the intervals of a list of events to columns.
+
+    Parameters
+    ----------
+    events : Iterable[Event]
+        The events.
+
+    Returns
+    -------
+    IntervalColumns
+        The intervals of all events, with the position of the event of each interval in `groups`.
+    """
+    return intervals_to_columns((event.interval_period, event.intervals) for event in events)
+
+
+def _resolve(period: IntervalPeriod | None) -> tuple[float, float]:
+    """Get the start timestamp and duration in seconds of an interval period, NaN if unknown."""
+    if period is None:
+        return math.nan, math.nan
+
+    duration = period.duration.total_seconds()
+    if isinstance(period.start, str):
+        return math.nan, duration
+    if period.start.tzinfo is None:
+        return period.start.replace(tzinfo=datetime.UTC).timestamp(), duration
+    return period.start.timestamp(), duration
+
+
+def _column(values: list[int] | list[float], typecode: str) -> Column:
+    """Create a contiguous int64 ("q") or float64 ("d") column."""
+    if np is not None:
+        return np.array(values, dtype=np.int64 if typecode == "q" else np.float64)
+    return array.array(typecode, values)
+
+
+def _sparse_column(rows: dict[int, float], length: int) -> Column:
+    """Create a float64 column with the values of some rows and NaN in the other rows."""
+    if len(rows) == length:
+        return _column(list(rows.values()), "d")
+    if np is not None:
+        column = np.full(length, np.nan)
+        column[list(rows)] = list(rows.values())
+        return column
+
+    values = [math.nan] * length
+    for row, value in rows.items():
+        values[row] = value
+    return array.array("d", values)
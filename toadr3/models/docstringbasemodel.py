@@ -20,7 +20,8 @@ class DocstringBaseModel(BaseModel):
 
     def model_post_init(self, _context: Any, /) -> None:  # noqa: ANN401
         """Call after model class has been initialized."""
-        if hasattr(self, "object_type"):
+        # checked on the class, a failed attribute lookup on the instance is slow
+        if "object_type" in type(self).model_fields:
             # We want the discriminator 'objectType' to be part of the JSON during dumping.
             self.model_fields_set.add("object_type")
 
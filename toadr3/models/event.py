@@ -3,6 +3,7 @@ from typing import Literal
 
 from pydantic import Field
 
+from .columns import IntervalColumns, intervals_to_columns
 from .docstringbasemodel import DocstringBaseModel
 from .eventpayloaddescriptor import EventPayloadDescriptor
 from .interval import Interval
@@ -79,3 +80,16 @@ class Event(DocstringBaseModel):
     def modified(self, value: datetime.datetime | None) -> None:
         """Set the modification date of the event."""
         self.modification_date_time = value
+
+    def to_columns(self) -> IntervalColumns:
+        """Get the intervals of the event as contiguous columns.
+
+        The start and duration of each interval are resolved from its own interval period or
+        from the interval period of the event. See `IntervalColumns`.
+
+        Returns
+        -------
+        IntervalColumns
+            The columns of the intervals.
+        """
+        return intervals_to_columns([(self.interval_period, self.intervals)])
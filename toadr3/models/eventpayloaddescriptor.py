@@ -2,7 +2,7 @@ from typing import Literal
 
 from pydantic import Field
 
-from toadr3.models import DocstringBaseModel
+from .docstringbasemodel import DocstringBaseModel
 
 
 class EventPayloadDescriptor(DocstringBaseModel):
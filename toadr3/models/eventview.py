@@ -0,0 +1,454 @@
+import array
+import datetime
+import functools
+from collections.abc import Iterable, Sequence
+from typing import Any, Literal, NoReturn, TypeAlias, overload
+
+from pydantic import BaseModel
+
+from .event import Event
+from .interval import Interval
+from .valuesmap import ValuesMap
+
+ViewColumn: TypeAlias = "array.array[int] | array.array[float] | tuple[Any, ...]"
+"""The values of a column, a typed array or a tuple."""
+
+# model_fields_set of the views, shared by all views with the same fields set
+_FIELDS_SETS: dict[frozenset[str], frozenset[str]] = {}
+
+
+class _ReadOnly:
+    """Base of the views, which cannot be changed after they are created."""
+
+    __slots__ = ()
+
+    # the typed arrays of the views are not hashable
+    __hash__ = None  # type: ignore[assignment]
+
+    def __setattr__(self, name: str, value: object) -> NoReturn:
+        """Raise an error, views are read-only."""
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __delattr__(self, name: str) -> NoReturn:
+        """Raise an error, views are read-only."""
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def _init(self, **values: Any) -> None:  # noqa: ANN401
+        """Set the slots of a new view."""
+        for name, value in values.items():
+            object.__setattr__(self, name, value)
+
+    def _slots(self) -> dict[str, Any]:
+        """Get the values of the slots of the view."""
+        return {
+            name: getattr(self, name)
+            for cls in type(self).__mro__
+            for name in getattr(cls, "__slots__", ())
+        }
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Copy and pickle views without setting their attributes."""
+        return _restore, (type(self), self._slots())
+
+    def __eq__(self, other: object) -> bool:
+        """Compare the slots of two views of the same type."""
+        if type(self) is not type(other):
+            return NotImplemented
+        return self._slots() == other._slots()
+
+
+class ModelView(_ReadOnly):
+    """Read-only compact copy of a small pydantic model, such as a target or interval period.
+
+    The values of the fields are stored in a tuple, with lists stored as tuples and nested models
+    as views. Fields are read as attributes, e.g. `view.payload_type`.
+    """
+
+    __slots__ = ("_fields_set", "_model", "_values")
+
+    _model: type[BaseModel]
+    _values: tuple[Any, ...]
+    _fields_set: frozenset[str]
+
+    def __init__(self, model: BaseModel) -> None:
+        """Initialize the view of a model.
+
+        Parameters
+        ----------
+        model : BaseModel
+            The model to copy.
+        """
+        self._init(
+            _model=type(model),
+            _values=tuple(_view_value(getattr(model, name)) for name in type(model).model_fields),
+            _fields_set=_fields_set(model),
+        )
+
+    @property
+    def model_type(self) -> type[BaseModel]:
+        """The type of the model."""
+        return self._model
+
+    @property
+    def model_fields_set(self) -> frozenset[str]:
+        """The fields that were explicitly set on the model."""
+        return self._fields_set
+
+    def to_model(self) -> BaseModel:
+        """Create the pydantic model, without validating it again."""
+        values = {
+            name: _model_value(value)
+            for name, value in zip(self._model.model_fields, self._values, strict=True)
+        }
+        return self._model.model_construct(set(self._fields_set), **values)
+
+    def __getattr__(self, name: str) -> Any:  # noqa: ANN401
+        """Get the value of a field."""
+        if name.startswith("_"):
+            raise AttributeError(name)
+        index = _field_index(self._model).get(name)
+        if index is None:
+            raise AttributeError(f"{self._model.__name__} view has no attribute {name!r}")
+        return self._values[index]
+
+    def __repr__(self) -> str:
+        """Return a string representation of the view."""
+        fields = ", ".join(
+            f"{name}={value!r}"
+            for name, value in zip(self._model.model_fields, self._values, strict=True)
+        )
+        return f"ModelView[{self._model.__name__}]({fields})"
+
+
+class IntervalsView(_ReadOnly, Sequence[ModelView]):
+    """Read-only compact copy of the intervals of an event.
+
+    Intervals that all have the same payload types, with one value per payload, are stored as
+    columns: an array of interval IDs and one array of values per payload type. The arrays are
+    typed (int64 or float64) when all values of the payload type are integers or floats, and
+    tuples otherwise. Other intervals are stored as a tuple of `ModelView`. Indexing returns a
+    `ModelView` of the interval in both cases.
+    """
+
+    __slots__ = (
+        "_columns",
+        "_ids",
+        "_interval_fields_set",
+        "_intervals",
+        "_payload_fields_set",
+        "_payload_types",
+        "_periods",
+    )
+
+    _ids: ViewColumn
+    _payload_types: tuple[str, ...]
+    _columns: tuple[ViewColumn, ...]
+    _periods: tuple[ModelView | None, ...] | None
+    _interval_fields_set: frozenset[str]
+    _payload_fields_set: frozenset[str]
+    _intervals: tuple[ModelView, ...] | None
+
+    def __init__(self, intervals: Iterable[Interval]) -> None:
+        """Initialize the view of a list of intervals.
+
+        Parameters
+        ----------
+        intervals : Iterable[Interval]
+            The intervals to copy.
+        """
+        intervals = list(intervals)
+        first = intervals[0] if intervals else None
+        payload_types = tuple(p.type for p in first.payloads) if first is not None else ()
+        interval_fields_set = _fields_set(first) if first is not None else frozenset()
+        payload_fields_set = (
+            _fields_set(first.payloads[0])
+            if first is not None and first.payloads
+            else frozenset({"type", "values"})
+        )
+
+        if not all(
+            _fields_set(interval) is interval_fields_set
+            and len(interval.payloads) == len(payload_types)
+            and all(
+                payload.type == payload_type
+                and len(payload.values) == 1
+                and _fields_set(payload) is payload_fields_set
+                for payload, payload_type in zip(interval.payloads, payload_types, strict=True)
+            )
+            for interval in intervals
+        ):
+            self._init(
+                _ids=array.array("q"),
+                _payload_types=(),
+                _columns=(),
+                _periods=None,
+                _interval_fields_set=frozenset(),
+                _payload_fields_set=frozenset(),
+                _intervals=tuple(ModelView(interval) for interval in intervals),
+            )
+            return
+
+        periods = None
+        if "interval_period" in interval_fields_set:
+            periods = tuple(_view_value(interval.interval_period) for interval in intervals)
+
+        self._init(
+            _ids=_typed_column([interval.id for interval in intervals]),
+            _payload_types=payload_types,
+            _columns=tuple(
+                _typed_column([interval.payloads[i].values[0] for interval in intervals])
+                for i in range(len(payload_types))
+            ),
+            _periods=periods,
+            _interval_fields_set=interval_fields_set,
+            _payload_fields_set=payload_fields_set,
+            _intervals=None,
+        )
+
+    @property
+    def is_columnar(self) -> bool:
+        """Whether the intervals are stored as columns."""
+        return self._intervals is None
+
+    @property
+    def ids(self) -> ViewColumn:
+        """The IDs of the intervals."""
+        if self._intervals is not None:
+            return tuple(interval.id for interval in self._intervals)
+        return self._ids
+
+    @property
+    def payload_types(self) -> tuple[str, ...]:
+        """The payload types of every interval, empty if the intervals are not columnar."""
+        return self._payload_types
+
+    def column(self, payload_type: str) -> ViewColumn:
+        """Get the values of a payload type of all intervals.
+
+        Parameters
+        ----------
+        payload_type : str
+            The payload type.
+
+        Returns
+        -------
+        ViewColumn
+            The values, an `array.array` if they are all integers or all floats.
+
+        Raises
+        ------
+        ValueError
+            If the intervals are not columnar.
+        KeyError
+            If the intervals do not have a payload of the type.
+        """
+        if self._intervals is not None:
+            raise ValueError("the intervals are not stored as columns")
+        if payload_type not in self._payload_types:
+            raise KeyError(payload_type)
+        return self._columns[self._payload_types.index(payload_type)]
+
+    def to_intervals(self) -> list[Interval]:
+        """Create the pydantic intervals, without validating them again."""
+        if self._intervals is not None:
+            return [interval.to_model() for interval in self._intervals]  # type: ignore[misc]
+        return [self._interval(i) for i in range(len(self._ids))]
+
+    def _interval(self, index: int) -> Interval:
+        """Create the pydantic interval at a position of the columns."""
+        payloads = [
+            ValuesMap.model_construct(
+                set(self._payload_fields_set),
+                type=payload_type,
+                values=[_model_value(column[index])],
+            )
+            for payload_type, column in zip(self._payload_types, self._columns, strict=True)
+        ]
+        period = None if self._periods is None else _model_value(self._periods[index])
+        return Interval.model_construct(
+            set(self._interval_fields_set),
+            id=int(self._ids[index]),
+            interval_period=period,
+            payloads=payloads,
+        )
+
+    def __len__(self) -> int:
+        """Return the number of intervals."""
+        return len(self._intervals) if self._intervals is not None else len(self._ids)
+
+    @overload
+    def __getitem__(self, index: int) -> ModelView: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> tuple[ModelView, ...]: ...
+
+    def __getitem__(self, index: int | slice) -> ModelView | tuple[ModelView, ...]:
+        """Get a view of an interval, or of a slice of the intervals."""
+        if self._intervals is not None:
+            return self._intervals[index]
+        if isinstance(index, slice):
+            return tuple(self[i] for i in range(len(self))[index])
+        return ModelView(self._interval(range(len(self._ids))[index]))
+
+    def __repr__(self) -> str:
+        """Return a string representation of the view."""
+        layout = f"columns {list(self._payload_types)}" if self.is_columnar else "models"
+        return f"IntervalsView({len(self)} intervals as {layout})"
+
+
+class EventView(_ReadOnly):
+    """Read-only compact copy of an event, for keeping large numbers of events in memory.
+
+    The fields of the event are stored in slots, the nested models as `ModelView` and the
+    intervals as an `IntervalsView`. Converting an event to a view and back gives an equal event
+    with the same explicitly set fields.
+    """
+
+    __slots__ = (
+        "created_date_time",
+        "event_name",
+        "id",
+        "interval_period",
+        "intervals",
+        "model_fields_set",
+        "modification_date_time",
+        "payload_descriptors",
+        "priority",
+        "program_id",
+        "report_descriptors",
+        "targets",
+    )
+
+    id: str | None
+    """VTN provisioned on object creation."""
+
+    created_date_time: datetime.datetime | None
+    """VTN provisioned on object creation."""
+
+    modification_date_time: datetime.datetime | None
+    """VTN provisioned on object modification."""
+
+    program_id: str
+    """ID attribute of program object this event is associated with."""
+
+    event_name: str | None
+    """User defined string for use in debugging or User Interface."""
+
+    priority: int | None
+    """Relative priority of event."""
+
+    targets: tuple[ModelView, ...] | None
+    """Views of the valuesMap objects of the targets."""
+
+    report_descriptors: tuple[ModelView, ...] | None
+    """Views of the reportDescriptor objects."""
+
+    payload_descriptors: tuple[ModelView, ...] | None
+    """Views of the payloadDescriptor objects."""
+
+    interval_period: ModelView | None
+    """View of the default start and durations of intervals."""
+
+    intervals: IntervalsView
+    """View of the intervals."""
+
+    model_fields_set: frozenset[str]
+    """The fields that were explicitly set on the event."""
+
+    def __init__(self, event: Event) -> None:
+        """Initialize the view of an event.
+
+        Parameters
+        ----------
+        event : Event
+            The event to copy.
+        """
+        self._init(
+            id=event.id,
+            created_date_time=event.created_date_time,
+            modification_date_time=event.modification_date_time,
+            program_id=event.program_id,
+            event_name=event.event_name,
+            priority=event.priority,
+            targets=_view_value(event.targets),
+            report_descriptors=_view_value(event.report_descriptors),
+            payload_descriptors=_view_value(event.payload_descriptors),
+            interval_period=_view_value(event.interval_period),
+            intervals=IntervalsView(event.intervals),
+            model_fields_set=_fields_set(event),
+        )
+
+    @property
+    def object_type(self) -> Literal["EVENT"]:
+        """The object type of events."""
+        return "EVENT"
+
+    def to_event(self) -> Event:
+        """Create the pydantic event, without validating it again."""
+        return Event.model_construct(
+            set(self.model_fields_set),
+            id=self.id,
+            created_date_time=self.created_date_time,
+            modification_date_time=self.modification_date_time,
+            program_id=self.program_id,
+            event_name=self.event_name,
+            priority=self.priority,
+            targets=_model_value(self.targets),
+            report_descriptors=_model_value(self.report_descriptors),
+            payload_descriptors=_model_value(self.payload_descriptors),
+            interval_period=_model_value(self.interval_period),
+            intervals=self.intervals.to_intervals(),
+        )
+
+    def __repr__(self) -> str:
+        """Return a string representation of the view."""
+        return f"EventView(id={self.id!r}, program_id={self.program_id!r}, {self.intervals!r})"
+
+
+def _restore(view_type: type[_ReadOnly], slots: dict[str, Any]) -> _ReadOnly:
+    """Create a view from the values of its slots."""
+    view = object.__new__(view_type)
+    view._init(**slots)
+    return view
+
+
+@functools.cache
+def _field_index(model: type[BaseModel]) -> dict[str, int]:
+    """Get the position of each field of a model in the values of its views."""
+    return {name: index for index, name in enumerate(model.model_fields)}
+
+
+def _fields_set(model: BaseModel) -> frozenset[str]:
+    """Get the shared frozen copy of the set fields of a model."""
+    fields_set = frozenset(model.model_fields_set)
+    return _FIELDS_SETS.setdefault(fields_set, fields_set)
+
+
+def _view_value(value: Any) -> Any:  # noqa: ANN401
+    """Convert a field value to its read-only form."""
+    if isinstance(value, BaseModel):
+        return ModelView(value)
+    if isinstance(value, list):
+        return tuple(_view_value(item) for item in value)
+    return value
+
+
+def _model_value(value: Any) -> Any:  # noqa: ANN401
+    """Convert a read-only field value back to its model form."""
+    if isinstance(value, ModelView):
+        return value.to_model()
+    if isinstance(value, tuple):
+        return [_model_value(item) for item in value]
+    return value
+
+
+def _typed_column(values: list[Any]) -> ViewColumn:
+    """Store values in an int64 or float64 array if they are all integers or all floats."""
+    if all(type(value) is int for value in values):
+        try:
+            return array.array("q", values)
+        except OverflowError:
+            pass
+    elif all(type(value) is float for value in values):
+        return array.array("d", values)
+    return tuple(_view_value(value) for value in values)
@@ -1,7 +1,22 @@
 import datetime
+import functools
 import re
 
-
+_DEC_OR_INT = r"((\d+[.]\d+)|(\d+))"  # decimal or integer
+_DURATION_PATTERN = re.compile(
+    r"^(?:(?P<negative>[-]?))?"  # negative sign is optionally at the start of the string
+    r"P(?!$)"  # P is required to be at the start of the string
+    r"(?:(?P<weeks>[-]?\d+)W)?"  # weeks are optional
+    r"(?:(?P<days>[-]?\d+)D)?"  # days are optional
+    rf"(?:T(?=[-]?{_DEC_OR_INT}[HMS])"  # T is required if time part is present (+ look ahead)
+    r"(?:(?P<hours>[-]?\d+)H)?"  # hours are optional
+    r"(?:(?P<minutes>[-]?\d+)M)?"  # minutes are optional
+    rf"(?:(?P<seconds>[-]?{_DEC_OR_INT})S)?"  # seconds are optional (can be fractional)
+    r")?$"  # end of string
+)
+
+
+@functools.lru_cache(maxsize=1024)
 def parse_iso8601_duration(duration: str) -> datetime.timedelta:
     """Parse an ISO 8601 duration string into a timedelta object.
 
@@ -12,20 +27,10 @@ def parse_iso8601_duration(duration: str) -> datetime.timedelta:
 
     Months and years are not supported because they have variable lengths and are not suitable for
     conversion to a fixed number of days without a reference date.
+
+    Results are cached, since responses usually repeat the same few durations.
     """
-    dec_or_int = r"((\d+[.]\d+)|(\d+))"  # decimal or integer
-    pattern = (
-        r"^(?:(?P<negative>[-]?))?"  # negative sign is optionally at the start of the string
-        r"P(?!$)"  # P is required to be at the start of the string
-        r"(?:(?P<weeks>[-]?\d+)W)?"  # weeks are optional
-        r"(?:(?P<days>[-]?\d+)D)?"  # days are optional
-        rf"(?:T(?=[-]?{dec_or_int}[HMS])"  # T is required if time part is present (+ look ahead)
-        r"(?:(?P<hours>[-]?\d+)H)?"  # hours are optional
-        r"(?:(?P<minutes>[-]?\d+)M)?"  # minutes are optional
-        rf"(?:(?P<seconds>[-]?{dec_or_int})S)?"  # seconds are optional (can be fractional)
-        r")?$"  # end of string
-    )
-    match = re.match(pattern, duration)
+    match = _DURATION_PATTERN.match(duration)
     if not match:
         raise ValueError(f"Invalid ISO 8601 duration: {duration}")
 
@@ -0,0 +1,128 @@
+from collections.abc import Callable, Iterable
+from typing import TYPE_CHECKING, Any, ClassVar, Self
+
+from pydantic import PrivateAttr, SerializerFunctionWrapHandler, model_serializer
+from pydantic.main import TupleGenerator
+
+from .event import Event
+
+
+class LazyEvent(Event):
+    """Event whose intervals, targets and report descriptors are validated on first access.
+
+    Events returned by the lazy mode of the client keep these fields as decoded JSON, so events
+    that are filtered out by their top-level fields never pay for validating their intervals.
+    Each field is validated the first time it is read and then cached. A field that fails to
+    validate raises a `ValidationError` when it is read. Serializing, comparing or copying the
+    event validates all remaining fields first.
+    """
+
+    lazy_fields: ClassVar[tuple[str, ...]] = ("intervals", "targets", "report_descriptors")
+    """The fields that can be validated on first access."""
+
+    _deferred: dict[str, tuple[Any, Callable[[Any], Any]]] = PrivateAttr(default_factory=dict)
+
+    def defer(self, name: str, validate: Callable[[Any], Any]) -> None:
+        """Replace the value of a field with its validation on first access.
+
+        Parameters
+        ----------
+        name : str
+            The name of the field, one of `lazy_fields`. Its current value is the decoded JSON,
+            a field without a value is left as is.
+        validate : Callable[[Any], Any]
+            Function validating the decoded JSON of the field.
+
+        Raises
+        ------
+        ValueError
+            If the field is not a lazy field.
+        """
+        if name not in self.lazy_fields:
+            raise ValueError(f"{name} is not a lazy field")
+        if self.__dict__.get(name) is not None:
+            self._deferred[name] = (self.__dict__.pop(name), validate)
+
+    @property
+    def deferred_fields(self) -> frozenset[str]:
+        """The names of the fields that have not been validated yet."""
+        return frozenset(self._deferred)
+
+    def materialize(self) -> Self:
+        """Validate all fields that have not been validated yet and return the event."""
+        for name in list(self._deferred):
+            _ = self._materialize(name)
+        return self
+
+    def _materialize(self, name: str) -> Any:  # noqa: ANN401
+        """Validate a deferred field and store its value."""
+        raw, validate = self._deferred[name]
+        value = validate(raw)
+        del self._deferred[name]
+        self.__dict__[name] = value
+
+        if not self._deferred:
+            # restore the order of the fields, which is used by repr and iteration
+            values = self.__dict__.copy()
+            self.__dict__.clear()
+            self.__dict__.update(
+                (key, values[key]) for key in type(self).model_fields if key in values
+            )
+        return value
+
+    if not TYPE_CHECKING:
+
+        def __getattr__(self, name: str) -> Any:  # noqa: ANN401
+            """Validate a deferred field on first access."""
+            private = self.__pydantic_private__
+            if private is not None and name in private.get("_deferred", ()):
+                return self._materialize(name)
+            return super().__getattr__(name)
+
+    def __setattr__(self, name: str, value: Any) -> None:  # noqa: ANN401
+        """Set a field, discarding its deferred value."""
+        private = self.__pydantic_private__
+        if private is not None:
+            _ = private.get("_deferred", {}).pop(name, None)
+        super().__setattr__(name, value)
+
+    @model_serializer(mode="wrap")
+    def _serialize(self, handler: SerializerFunctionWrapHandler) -> dict[str, Any]:
+        """Validate the deferred fields before serializing the event."""
+        result: dict[str, Any] = handler(self.materialize())
+        return result
+
+    # events are mutable, like other models
+    __hash__ = None  # type: ignore[assignment]
+
+    def __eq__(self, other: object) -> bool:
+        """Compare the events with all fields validated."""
+        _ = self.materialize()
+        if isinstance(other, LazyEvent):
+            _ = other.materialize()
+        return super().__eq__(other)
+
+    def __iter__(self) -> TupleGenerator:
+        """Iterate over the fields with all fields validated."""
+        _ = self.materialize()
+        return super().__iter__()
+
+    def __repr_args__(self) -> Iterable[tuple[str | None, Any]]:
+        """Get the fields shown by repr with all fields validated."""
+        _ = self.materialize()
+        return super().__repr_args__()
+
+    def __copy__(self) -> Self:
+        """Copy the event with all fields validated."""
+        _ = self.materialize()
+        return super().__copy__()
+
+    def __deepcopy__(self, memo: dict[int, Any] | None = None) -> Self:
+        """Deep copy the event with all fields validated."""
+        _ = self.materialize()
+        return super().__deepcopy__(memo)
+
+    def __getstate__(self) -> dict[Any, Any]:
+        """Get the state for pickling with all fields validated."""
+        _ = self.materialize()
+        return super().__getstate__()
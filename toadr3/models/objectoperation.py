@@ -1,6 +1,6 @@
 from enum import StrEnum
 
-from toadr3.models import DocstringBaseModel
+from .docstringbasemodel import DocstringBaseModel
 
 
 class ObjectType(StrEnum):
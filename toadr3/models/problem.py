@@ -1,6 +1,6 @@
 from pydantic import HttpUrl
 
-from toadr3.models import DocstringBaseModel
+from .docstringbasemodel import DocstringBaseModel
 
 
 class Problem(DocstringBaseModel):
@@ -3,6 +3,7 @@ from typing import Any, Literal
 
 from pydantic import Field
 
+from .columns import IntervalColumns, intervals_to_columns
 from .docstringbasemodel import DocstringBaseModel
 from .event import Event
 from .interval import Interval
@@ -68,6 +69,22 @@ class Report(DocstringBaseModel):
         """Set the modification date of the report."""
         self.modification_date_time = value
 
+    def to_columns(self) -> IntervalColumns:
+        """Get the intervals of all resources of the report as contiguous columns.
+
+        The start and duration of each interval are resolved from its own interval period or
+        from the interval period of its resource. The position of the resource of each interval
+        is in `groups`. See `IntervalColumns`.
+
+        Returns
+        -------
+        IntervalColumns
+            The columns of the intervals.
+        """
+        return intervals_to_columns(
+            (resource.interval_period, resource.intervals) for resource in self.resources
+        )
+
     @staticmethod
     def create_report(
         event: Event,
@@ -1,6 +1,6 @@
 from pydantic import Field
 
-from toadr3.models import DocstringBaseModel
+from .docstringbasemodel import DocstringBaseModel
 
 
 class Point(DocstringBaseModel):
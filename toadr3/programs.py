@@ -1,19 +1,36 @@
+import functools
+from collections.abc import AsyncGenerator
+from typing import Literal
+
 import aiohttp
 
 from toadr3 import AccessToken
+from toadr3.circuit_breaker import CircuitBreaker
+from toadr3.compression import RequestCompression
+from toadr3.hedge_policy import HedgePolicy
+from toadr3.json_codec import JsonCodec
 from toadr3.models import Program, TargetType
+from toadr3.rate_limiter import RateLimiter
+from toadr3.request_metrics import RequestMetrics
+from toadr3.response_cache import ResponseCache
+from toadr3.retry_policy import RetryPolicy
 
 from ._internal import (
+    DEFAULT_PAGE_SIZE,
+    ListAdapter,
     ParameterBuilder,
     ProgramIDPathParameter,
     SkipAndLimit,
     Targets,
     delete_query,
     get_query,
+    model_parser,
+    paginate,
     put_query,
 )
 
 _GET_PARAMS_BUILDER = ParameterBuilder(Targets, SkipAndLimit)
+_PROGRAMS_ADAPTER = ListAdapter(Program)
 _GET_BY_ID_PARAMS_BUILDER = ParameterBuilder(ProgramIDPathParameter)
 
 
@@ -27,6 +44,14 @@ async def get_programs(
     limit: int | None = None,
     extra_params: dict[str, str | int | list[str]] | None = None,
     custom_headers: dict[str, str] | None = None,
+    cache: ResponseCache | None = None,
+    retry_policy: RetryPolicy | None = None,
+    circuit_breaker: CircuitBreaker | None = None,
+    rate_limiter: RateLimiter | None = None,
+    json_codec: JsonCodec | None = None,
+    validation: Literal["full", "trusted"] = "full",
+    metrics: RequestMetrics | None = None,
+    deadline: float | None = None,
 ) -> list[Program]:
     """Get a list of programs from the VTN.
 
@@ -53,6 +78,22 @@ async def get_programs(
         Extra query parameters to include in the request.
     custom_headers: dict[str, str] | None
         Extra headers to include in the request.
+    cache: ResponseCache | None
+        Cache used to make the request conditional and reuse unchanged results.
+    retry_policy: RetryPolicy | None
+        Policy for retrying failed requests or None to not retry.
+    circuit_breaker: CircuitBreaker | None
+        Circuit breaker guarding the VTN or None to always send requests.
+    rate_limiter: RateLimiter | None
+        Rate limiter for the requests to the VTN or None to not limit requests.
+    json_codec: JsonCodec | None
+        Codec used to decode JSON responses or None to use the fastest available codec.
+    validation: Literal["full", "trusted"]
+        "full" to check all constraints of the returned objects, "trusted" to skip the checks.
+    metrics: RequestMetrics | None
+        Metrics recording the latency breakdown of requests or None to not record them.
+    deadline : float | None
+        Absolute deadline in event loop time for the request and its retries, None for no deadline.
 
     Returns
     -------
@@ -67,6 +108,8 @@ async def get_programs(
         If the request to the VTN fails. Specifically, if the response status is 400, 403, or 500,
     aiohttp.ClientError
         If there is an unexpected error with the HTTP request to the VTN.
+    TimeoutError
+        If the request did not complete before the deadline.
     """
     args = {
         "target_type": target_type,
@@ -77,15 +120,124 @@ async def get_programs(
     _GET_PARAMS_BUILDER.check_query_parameters(args)
     params = _GET_PARAMS_BUILDER.build_query_parameters(args, extra_params)
 
-    data = await get_query(session, f"{vtn_url}/programs", access_token, params, custom_headers)
+    result: list[Program] = await get_query(
+        session,
+        f"{vtn_url}/programs",
+        access_token,
+        params,
+        custom_headers,
+        parser=functools.partial(_PROGRAMS_ADAPTER.validate_json, validation=validation),
+        cache=cache,
+        retry_policy=retry_policy,
+        circuit_breaker=circuit_breaker,
+        rate_limiter=rate_limiter,
+        json_codec=json_codec,
+        metrics=metrics,
+        deadline=deadline,
+    )
+    return result
 
-    if not isinstance(data, list):
-        raise ValueError(f"Expected result to be a list. Got {type(data)} instead.")
 
-    result = []
-    for program in data:
-        result.append(Program.model_validate(program))
-    return result
+async def iter_programs(
+    session: aiohttp.ClientSession,
+    vtn_url: str,
+    access_token: AccessToken | None,
+    target_type: TargetType | str | None = None,
+    target_values: list[str] | None = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    max_concurrency: int = 1,
+    extra_params: dict[str, str | int | list[str]] | None = None,
+    custom_headers: dict[str, str] | None = None,
+    retry_policy: RetryPolicy | None = None,
+    circuit_breaker: CircuitBreaker | None = None,
+    rate_limiter: RateLimiter | None = None,
+    json_codec: JsonCodec | None = None,
+    validation: Literal["full", "trusted"] = "full",
+    metrics: RequestMetrics | None = None,
+    deadline: float | None = None,
+) -> AsyncGenerator[Program, None]:
+    """Iterate over all programs from the VTN.
+
+    The programs are requested page by page using skip and limit. Up to `max_concurrency` pages are
+    requested ahead of the page being consumed, and no new pages are requested once a page with
+    fewer than `page_size` programs has been returned. Programs with an ID that has already been
+    yielded are skipped.
+
+    Parameters
+    ----------
+    session : aiohttp.ClientSession
+        The aiohttp session to use for the request.
+    vtn_url : str
+        The URL of the VTN.
+    access_token : AccessToken | None
+        The access token to use for the request, use None if no token is required.
+    target_type : TargetType | str | None
+        The target type to filter the programs by.
+    target_values : list[str] | None
+        The target values to filter the programs by (names of the target type).
+    page_size : int
+        The number of programs to request per page.
+    max_concurrency : int
+        The maximum number of pages to request concurrently.
+    extra_params : dict[str, str | int | list[str]] | None
+        Extra query parameters to include in the request.
+    custom_headers : dict[str, str] | None
+        Extra headers to include in the request.
+    retry_policy : RetryPolicy | None
+        Policy for retrying failed requests or None to not retry.
+    circuit_breaker : CircuitBreaker | None
+        Circuit breaker guarding the VTN or None to always send requests.
+    rate_limiter : RateLimiter | None
+        Rate limiter for the requests to the VTN or None to not limit requests.
+    json_codec : JsonCodec | None
+        Codec used to decode JSON responses or None to use the fastest available codec.
+    validation : Literal["full", "trusted"]
+        "full" to check all constraints of the returned objects, "trusted" to skip the checks.
+    metrics : RequestMetrics | None
+        Metrics recording the latency breakdown of requests or None to not record them.
+    deadline : float | None
+        Absolute deadline in event loop time for the requests of all pages and their retries, None
+        for no deadline.
+
+    Yields
+    ------
+    Program
+        The programs in the order returned by the VTN.
+
+    Raises
+    ------
+    ValueError
+        If the query parameters are invalid.
+    toadr3.ToadrError
+        If the request to the VTN fails. Specifically, if the response status is 400, 403, or 500,
+    aiohttp.ClientError
+        If there is an unexpected error with the HTTP request to the VTN.
+    TimeoutError
+        If the iteration did not complete before the deadline.
+    """
+
+    async def fetch_page(skip: int, limit: int) -> list[Program]:
+        return await get_programs(
+            session,
+            vtn_url,
+            access_token,
+            target_type=target_type,
+            target_values=target_values,
+            skip=skip,
+            limit=limit,
+            extra_params=extra_params,
+            custom_headers=custom_headers,
+            retry_policy=retry_policy,
+            circuit_breaker=circuit_breaker,
+            rate_limiter=rate_limiter,
+            json_codec=json_codec,
+            validation=validation,
+            metrics=metrics,
+            deadline=deadline,
+        )
+
+    async for program in paginate(fetch_page, page_size, max_concurrency):
+        yield program
 
 
 async def get_program_by_id(
@@ -94,6 +246,15 @@ async def get_program_by_id(
     access_token: AccessToken | None,
     program_id: str,
     custom_headers: dict[str, str] | None = None,
+    cache: ResponseCache | None = None,
+    retry_policy: RetryPolicy | None = None,
+    circuit_breaker: CircuitBreaker | None = None,
+    rate_limiter: RateLimiter | None = None,
+    json_codec: JsonCodec | None = None,
+    validation: Literal["full", "trusted"] = "full",
+    metrics: RequestMetrics | None = None,
+    hedge_policy: HedgePolicy | None = None,
+    deadline: float | None = None,
 ) -> Program:
     """Get a program by ID.
 
@@ -109,6 +270,24 @@ async def get_program_by_id(
         The program ID to search for.
     custom_headers : dict[str, str] | None
         Extra headers to include in the request.
+    cache : ResponseCache | None
+        Cache used to make the request conditional and reuse unchanged results.
+    retry_policy : RetryPolicy | None
+        Policy for retrying failed requests or None to not retry.
+    circuit_breaker : CircuitBreaker | None
+        Circuit breaker guarding the VTN or None to always send requests.
+    rate_limiter : RateLimiter | None
+        Rate limiter for the requests to the VTN or None to not limit requests.
+    json_codec : JsonCodec | None
+        Codec used to decode JSON responses or None to use the fastest available codec.
+    validation : Literal["full", "trusted"]
+        "full" to check all constraints of the returned objects, "trusted" to skip the checks.
+    metrics : RequestMetrics | None
+        Metrics recording the latency breakdown of requests or None to not record them.
+    hedge_policy : HedgePolicy | None
+        Policy for hedging slow GET requests or None to not hedge them.
+    deadline : float | None
+        Absolute deadline in event loop time for the request and its retries, None for no deadline.
 
     Returns
     -------
@@ -123,18 +302,28 @@ async def get_program_by_id(
         If the request to the VTN fails. Specifically, response status 400, 403, 404, or 500,
     aiohttp.ClientError
         If there is an unexpected error with the HTTP request to the VTN.
+    TimeoutError
+        If the request did not complete before the deadline.
     """
     _GET_BY_ID_PARAMS_BUILDER.check_query_parameters({"program_id": program_id})
 
-    data = await get_query(
+    result: Program = await get_query(
         session,
         f"{vtn_url}/programs/{program_id}",
         access_token,
         custom_headers=custom_headers,
         accept_404=True,
+        parser=model_parser(Program, validation),
+        cache=cache,
+        retry_policy=retry_policy,
+        circuit_breaker=circuit_breaker,
+        rate_limiter=rate_limiter,
+        json_codec=json_codec,
+        metrics=metrics,
+        hedge_policy=hedge_policy,
+        deadline=deadline,
     )
-
-    return Program.model_validate(data)
+    return result
 
 
 async def delete_program_by_id(
@@ -143,6 +332,12 @@ async def delete_program_by_id(
     access_token: AccessToken | None,
     program_id: str,
     custom_headers: dict[str, str] | None = None,
+    retry_policy: RetryPolicy | None = None,
+    circuit_breaker: CircuitBreaker | None = None,
+    rate_limiter: RateLimiter | None = None,
+    json_codec: JsonCodec | None = None,
+    metrics: RequestMetrics | None = None,
+    deadline: float | None = None,
 ) -> Program:
     """Delete a subscription by ID.
 
@@ -158,6 +353,18 @@ async def delete_program_by_id(
         The program ID to search for.
     custom_headers : dict[str, str] | None
         Extra headers to include in the request.
+    retry_policy : RetryPolicy | None
+        Policy for retrying failed requests or None to not retry.
+    circuit_breaker : CircuitBreaker | None
+        Circuit breaker guarding the VTN or None to always send requests.
+    rate_limiter : RateLimiter | None
+        Rate limiter for the requests to the VTN or None to not limit requests.
+    json_codec : JsonCodec | None
+        Codec used to decode JSON responses or None to use the fastest available codec.
+    metrics : RequestMetrics | None
+        Metrics recording the latency breakdown of requests or None to not record them.
+    deadline : float | None
+        Absolute deadline in event loop time for the request and its retries, None for no deadline.
 
     Returns
     -------
@@ -172,6 +379,8 @@ async def delete_program_by_id(
         If the request to the VTN fails. Specifically, response status 400, 403, 404, or 500,
     aiohttp.ClientError
         If there is an unexpected error with the HTTP request to the VTN.
+    TimeoutError
+        If the request did not complete before the deadline.
     """
     _GET_BY_ID_PARAMS_BUILDER.check_query_parameters({"program_id": program_id})
 
@@ -181,6 +390,12 @@ async def delete_program_by_id(
         access_token,
         custom_headers=custom_headers,
         accept_404=True,
+        retry_policy=retry_policy,
+        circuit_breaker=circuit_breaker,
+        rate_limiter=rate_limiter,
+        json_codec=json_codec,
+        metrics=metrics,
+        deadline=deadline,
     )
 
     return Program.model_validate(data)
@@ -193,6 +408,13 @@ async def put_program_by_id(
     program_id: str,
     program: Program,
     custom_headers: dict[str, str] | None = None,
+    retry_policy: RetryPolicy | None = None,
+    circuit_breaker: CircuitBreaker | None = None,
+    rate_limiter: RateLimiter | None = None,
+    compression: RequestCompression | None = None,
+    json_codec: JsonCodec | None = None,
+    metrics: RequestMetrics | None = None,
+    deadline: float | None = None,
 ) -> Program:
     """Update a program by ID.
 
@@ -210,6 +432,20 @@ async def put_program_by_id(
         The program object with updated values.
     custom_headers : dict[str, str] | None
         Extra headers to include in the request.
+    retry_policy : RetryPolicy | None
+        Policy for retrying failed requests or None to not retry.
+    circuit_breaker : CircuitBreaker | None
+        Circuit breaker guarding the VTN or None to always send requests.
+    rate_limiter : RateLimiter | None
+        Rate limiter for the requests to the VTN or None to not limit requests.
+    compression : RequestCompression | None
+        Compression of the request body or None to send it uncompressed.
+    json_codec : JsonCodec | None
+        Codec used to decode JSON responses or None to use the fastest available codec.
+    metrics : RequestMetrics | None
+        Metrics recording the latency breakdown of requests or None to not record them.
+    deadline : float | None
+        Absolute deadline in event loop time for the request and its retries, None for no deadline.
 
     Returns
     -------
@@ -224,6 +460,8 @@ async def put_program_by_id(
         If the request to the VTN fails. Specifically, response status 400, 403, 404, or 500,
     aiohttp.ClientError
         If there is an unexpected error with the HTTP request to the VTN.
+    TimeoutError
+        If the request did not complete before the deadline.
     """
     _GET_BY_ID_PARAMS_BUILDER.check_query_parameters({"program_id": program_id})
 
@@ -243,6 +481,13 @@ async def put_program_by_id(
         body=data,
         custom_headers=custom_headers,
         accept_404=True,
+        retry_policy=retry_policy,
+        circuit_breaker=circuit_breaker,
+        rate_limiter=rate_limiter,
+        compression=compression,
+        json_codec=json_codec,
+        metrics=metrics,
+        deadline=deadline,
     )
 
     return Program.model_validate(data)
@@ -0,0 +1,171 @@
+import asyncio
+import time
+from collections.abc import Mapping
+from urllib.parse import urlsplit
+
+ENDPOINTS = frozenset({"events", "programs", "reports", "subscriptions"})
+"""VTN endpoints that can have their own rate limit."""
+
+
+class TokenBucket:
+    """Async token bucket allowing `rate` requests per second with bursts of `burst` requests.
+
+    Waiting callers are served in the order they called `acquire`.
+    """
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        """Initialize the token bucket.
+
+        Parameters
+        ----------
+        rate : float
+            The number of tokens added per second.
+        burst : int
+            The maximum number of tokens in the bucket, the bucket starts full.
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+
+        if not isinstance(burst, int) or burst <= 0:
+            raise ValueError("burst must be a positive integer")
+
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    @property
+    def rate(self) -> float:
+        """The number of tokens added per second."""
+        return self._rate
+
+    @property
+    def burst(self) -> int:
+        """The maximum number of tokens in the bucket."""
+        return self._burst
+
+    @property
+    def tokens(self) -> float:
+        """The number of tokens currently available."""
+        self._refill(time.monotonic())
+        return self._tokens
+
+    def _refill(self, now: float) -> None:
+        # `_updated` is in the future while the bucket is paused
+        if now > self._updated:
+            self._tokens = min(self._burst, self._tokens + (now - self._updated) * self._rate)
+            self._updated = now
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        # asyncio.Lock wakes up waiters in FIFO order, which keeps the queue fair
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                wait = max(self._updated - now, 0.0)
+                if self._tokens < 1:
+                    wait += (1 - self._tokens) / self._rate
+                if wait <= 0:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep(wait)
+
+    def throttle(self, delay: float | None = None) -> None:
+        """Slow down after the VTN rejected a request with 429 Too Many Requests.
+
+        Parameters
+        ----------
+        delay : float | None
+            The delay from the Retry-After header. No tokens are handed out until it has passed.
+            If None, the burst is used up so that requests continue at the sustained rate.
+        """
+        if delay is None:
+            self._tokens = min(self._tokens, 0.0)
+            return
+
+        self._refill(time.monotonic())
+        self._tokens = min(self._tokens, 1.0)
+        self._updated = max(self._updated, time.monotonic() + delay)
+
+
+class RateLimiter:
+    """Client-side rate limiter for the requests to a VTN.
+
+    Requests can be limited globally and per endpoint. A request waits for a token from the
+    bucket of its endpoint, if configured, and then from the global bucket, if configured.
+    When the VTN responds with 429 Too Many Requests, the buckets used by the request are
+    paused for the duration of the Retry-After header.
+    """
+
+    def __init__(
+        self,
+        rate: float | None = None,
+        burst: int = 1,
+        endpoint_limits: Mapping[str, tuple[float, int]] | None = None,
+    ) -> None:
+        """Initialize the rate limiter.
+
+        Parameters
+        ----------
+        rate : float | None
+            The maximum number of requests per second to the VTN or None for no global limit.
+        burst : int
+            The number of requests that can be made at once before the global rate applies.
+        endpoint_limits : Mapping[str, tuple[float, int]] | None
+            Rate and burst per endpoint, e.g. `{"/events": (5, 10)}`. Supported endpoints are
+            /events, /programs, /reports and /subscriptions.
+        """
+        self._global = TokenBucket(rate, burst) if rate is not None else None
+        self._endpoints: dict[str, TokenBucket] = {}
+        for endpoint, (endpoint_rate, endpoint_burst) in (endpoint_limits or {}).items():
+            name = endpoint.strip("/")
+            if name not in ENDPOINTS:
+                raise ValueError(f"Unknown endpoint {endpoint}")
+            self._endpoints[name] = TokenBucket(endpoint_rate, endpoint_burst)
+
+    @property
+    def global_bucket(self) -> TokenBucket | None:
+        """The bucket limiting all requests, None if there is no global limit."""
+        return self._global
+
+    def endpoint_bucket(self, url: str) -> TokenBucket | None:
+        """Get the bucket of the endpoint the URL belongs to, if it has a limit."""
+        if not self._endpoints:
+            return None
+
+        for segment in reversed(urlsplit(url).path.split("/")):
+            bucket = self._endpoints.get(segment)
+            if bucket is not None:
+                return bucket
+        return None
+
+    def _buckets(self, url: str) -> list[TokenBucket]:
+        return [
+            bucket for bucket in (self.endpoint_bucket(url), self._global) if bucket is not None
+        ]
+
+    async def acquire(self, url: str) -> None:
+        """Wait until a request to the URL is allowed.
+
+        Parameters
+        ----------
+        url : str
+            The URL of the request.
+        """
+        for bucket in self._buckets(url):
+            await bucket.acquire()
+
+    def throttle(self, url: str, delay: float | None = None) -> None:
+        """Slow down requests after a request to the URL was rejected with 429.
+
+        Parameters
+        ----------
+        url : str
+            The URL of the rejected request.
+        delay : float | None
+            The delay from the Retry-After header or None if the response did not include one.
+        """
+        for bucket in self._buckets(url):
+            bucket.throttle(delay)
@@ -1,18 +1,35 @@
+import functools
+from collections.abc import AsyncGenerator
+from typing import Literal
+
 import aiohttp
 
 from ._internal import (
+    DEFAULT_PAGE_SIZE,
     ClientName,
     EventID,
+    ListAdapter,
     ParameterBuilder,
     ProgramID,
     SkipAndLimit,
-    default_error_handler,
     get_query,
+    model_parser,
+    paginate,
+    post_query,
+    stream_query,
 )
 from .access_token import AccessToken
+from .circuit_breaker import CircuitBreaker
+from .compression import RequestCompression
+from .json_codec import JsonCodec
 from .models import Report
+from .rate_limiter import RateLimiter
+from .request_metrics import RequestMetrics
+from .response_cache import ResponseCache
+from .retry_policy import RetryPolicy
 
 _GET_PARAMS_BUILDER = ParameterBuilder(ProgramID, EventID, ClientName, SkipAndLimit)
+_REPORTS_ADAPTER = ListAdapter(Report)
 
 
 async def post_report(
@@ -21,6 +38,13 @@ async def post_report(
     access_token: AccessToken | None,
     report: Report,
     custom_headers: dict[str, str] | None = None,
+    retry_policy: RetryPolicy | None = None,
+    circuit_breaker: CircuitBreaker | None = None,
+    rate_limiter: RateLimiter | None = None,
+    compression: RequestCompression | None = None,
+    json_codec: JsonCodec | None = None,
+    metrics: RequestMetrics | None = None,
+    deadline: float | None = None,
 ) -> Report:
     """Post a report to the VTN.
 
@@ -36,6 +60,20 @@ async def post_report(
         The report object to post.
     custom_headers : dict[str, str] | None
         Extra headers to include in the request.
+    retry_policy : RetryPolicy | None
+        Policy for retrying failed requests or None to not retry.
+    circuit_breaker : CircuitBreaker | None
+        Circuit breaker guarding the VTN or None to always send requests.
+    rate_limiter : RateLimiter | None
+        Rate limiter for the requests to the VTN or None to not limit requests.
+    compression : RequestCompression | None
+        Compression of the request body or None to send it uncompressed.
+    json_codec : JsonCodec | None
+        Codec used to decode JSON responses or None to use the fastest available codec.
+    metrics : RequestMetrics | None
+        Metrics recording the latency breakdown of requests or None to not record them.
+    deadline : float | None
+        Absolute deadline in event loop time for the request and its retries, None for no deadline.
 
     Returns
     -------
@@ -51,6 +89,8 @@ async def post_report(
         response status is 400, 403, 409, or 500,
     aiohttp.ClientError
         If there is an unexpected error with the HTTP request to the VTN.
+    TimeoutError
+        If the request did not complete before the deadline.
     """
     if report is None:
         raise ValueError("report is required")
@@ -58,25 +98,26 @@ async def post_report(
     headers: dict[str, str] = {}
     if custom_headers is not None:
         headers |= custom_headers
-
-    if access_token is not None:
-        headers["Authorization"] = f"Bearer {access_token.token}"
-
-    vtn_url = vtn_url.rstrip("/")
-
-    data = report.model_dump_json(exclude_none=True, exclude_unset=True)
     headers["Content-Type"] = "application/json"
 
-    async with session.post(f"{vtn_url}/reports", headers=headers, data=data) as response:
-        if not response.ok:
-            match response.status:
-                case 400 | 403 | 409 | 500:
-                    await default_error_handler(response)
-                case _:
-                    await default_error_handler(response, "Unexpected error status!")
+    data = report.model_dump_json(exclude_none=True, exclude_unset=True)
 
-        data = await response.json()
-        return Report.model_validate(data)
+    result = await post_query(
+        session,
+        f"{vtn_url.rstrip('/')}/reports",
+        access_token,
+        data,
+        custom_headers=headers,
+        accept_409=True,
+        retry_policy=retry_policy,
+        circuit_breaker=circuit_breaker,
+        rate_limiter=rate_limiter,
+        compression=compression,
+        json_codec=json_codec,
+        metrics=metrics,
+        deadline=deadline,
+    )
+    return Report.model_validate(result)
 
 
 async def get_reports(
@@ -90,6 +131,14 @@ async def get_reports(
     limit: int | None = None,
     extra_params: dict[str, str | int | list[str]] | None = None,
     custom_headers: dict[str, str] | None = None,
+    cache: ResponseCache | None = None,
+    retry_policy: RetryPolicy | None = None,
+    circuit_breaker: CircuitBreaker | None = None,
+    rate_limiter: RateLimiter | None = None,
+    json_codec: JsonCodec | None = None,
+    validation: Literal["full", "trusted"] = "full",
+    metrics: RequestMetrics | None = None,
+    deadline: float | None = None,
 ) -> list[Report]:
     """Get a list of reports from the VTN.
 
@@ -115,6 +164,22 @@ async def get_reports(
         Extra query parameters to include in the request.
     custom_headers : dict[str, str] | None
         Extra headers to include in the request.
+    cache : ResponseCache | None
+        Cache used to make the request conditional and reuse unchanged results.
+    retry_policy : RetryPolicy | None
+        Policy for retrying failed requests or None to not retry.
+    circuit_breaker : CircuitBreaker | None
+        Circuit breaker guarding the VTN or None to always send requests.
+    rate_limiter : RateLimiter | None
+        Rate limiter for the requests to the VTN or None to not limit requests.
+    json_codec : JsonCodec | None
+        Codec used to decode JSON responses or None to use the fastest available codec.
+    validation : Literal["full", "trusted"]
+        "full" to check all constraints of the returned objects, "trusted" to skip the checks.
+    metrics : RequestMetrics | None
+        Metrics recording the latency breakdown of requests or None to not record them.
+    deadline : float | None
+        Absolute deadline in event loop time for the request and its retries, None for no deadline.
 
     Returns
     -------
@@ -129,6 +194,8 @@ async def get_reports(
         If the request to the VTN fails. Specifically, if the response status is 400, 403, or 500,
     aiohttp.ClientError
         If there is an unexpected error with the HTTP request to the VTN.
+    TimeoutError
+        If the request did not complete before the deadline.
     """
     args = {
         "client_name": client_name,
@@ -139,12 +206,222 @@ async def get_reports(
     }
     _GET_PARAMS_BUILDER.check_query_parameters(args)
     params = _GET_PARAMS_BUILDER.build_query_parameters(args, extra_params)
-    data = await get_query(session, f"{vtn_url}/reports", access_token, params, custom_headers)
+    result: list[Report] = await get_query(
+        session,
+        f"{vtn_url}/reports",
+        access_token,
+        params,
+        custom_headers,
+        parser=functools.partial(_REPORTS_ADAPTER.validate_json, validation=validation),
+        cache=cache,
+        retry_policy=retry_policy,
+        circuit_breaker=circuit_breaker,
+        rate_limiter=rate_limiter,
+        json_codec=json_codec,
+        metrics=metrics,
+        deadline=deadline,
+    )
+    return result
 
-    if not isinstance(data, list):
-        raise ValueError(f"Expected result to be a list. Got {type(data)} instead.")
 
-    result = []
-    for report in data:
-        result.append(Report.model_validate(report))
-    return result
+async def iter_reports(
+    session: aiohttp.ClientSession,
+    vtn_url: str,
+    access_token: AccessToken | None,
+    program_id: str | None = None,
+    event_id: str | None = None,
+    client_name: str | None = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    max_concurrency: int = 1,
+    extra_params: dict[str, str | int | list[str]] | None = None,
+    custom_headers: dict[str, str] | None = None,
+    retry_policy: RetryPolicy | None = None,
+    circuit_breaker: CircuitBreaker | None = None,
+    rate_limiter: RateLimiter | None = None,
+    json_codec: JsonCodec | None = None,
+    validation: Literal["full", "trusted"] = "full",
+    metrics: RequestMetrics | None = None,
+    deadline: float | None = None,
+) -> AsyncGenerator[Report, None]:
+    """Iterate over all reports from the VTN.
+
+    The reports are requested page by page using skip and limit. Up to `max_concurrency` pages are
+    requested ahead of the page being consumed, and no new pages are requested once a page with
+    fewer than `page_size` reports has been returned. Reports with an ID that has already been
+    yielded are skipped.
+
+    Parameters
+    ----------
+    session : aiohttp.ClientSession
+        The aiohttp session to use for the request.
+    vtn_url : str
+        The URL of the VTN.
+    access_token : AccessToken | None
+        The access token to use for the request, use None if no token is required.
+    program_id : str | None
+        The program ID to filter the reports by.
+    event_id : str | None
+        The event ID to filter the reports by.
+    client_name : str | None
+        The client name to filter the reports by.
+    page_size : int
+        The number of reports to request per page.
+    max_concurrency : int
+        The maximum number of pages to request concurrently.
+    extra_params : dict[str, str | int | list[str]] | None
+        Extra query parameters to include in the request.
+    custom_headers : dict[str, str] | None
+        Extra headers to include in the request.
+    retry_policy : RetryPolicy | None
+        Policy for retrying failed requests or None to not retry.
+    circuit_breaker : CircuitBreaker | None
+        Circuit breaker guarding the VTN or None to always send requests.
+    rate_limiter : RateLimiter | None
+        Rate limiter for the requests to the VTN or None to not limit requests.
+    json_codec : JsonCodec | None
+        Codec used to decode JSON responses or None to use the fastest available codec.
+    validation : Literal["full", "trusted"]
+        "full" to check all constraints of the returned objects, "trusted" to skip the checks.
+    metrics : RequestMetrics | None
+        Metrics recording the latency breakdown of requests or None to not record them.
+    deadline : float | None
+        Absolute deadline in event loop time for the requests of all pages and their retries, None
+        for no deadline.
+
+    Yields
+    ------
+    Report
+        The reports in the order returned by the VTN.
+
+    Raises
+    ------
+    ValueError
+        If the query parameters are invalid.
+    toadr3.ToadrError
+        If the request to the VTN fails. Specifically, if the response status is 400, 403, or 500,
+    aiohttp.ClientError
+        If there is an unexpected error with the HTTP request to the VTN.
+    TimeoutError
+        If the iteration did not complete before the deadline.
+    """
+
+    async def fetch_page(skip: int, limit: int) -> list[Report]:
+        return await get_reports(
+            session,
+            vtn_url,
+            access_token,
+            program_id=program_id,
+            event_id=event_id,
+            client_name=client_name,
+            skip=skip,
+            limit=limit,
+            extra_params=extra_params,
+            custom_headers=custom_headers,
+            retry_policy=retry_policy,
+            circuit_breaker=circuit_breaker,
+            rate_limiter=rate_limiter,
+            json_codec=json_codec,
+            validation=validation,
+            metrics=metrics,
+            deadline=deadline,
+        )
+
+    async for report in paginate(fetch_page, page_size, max_concurrency):
+        yield report
+
+
+async def stream_reports(
+    session: aiohttp.ClientSession,
+    vtn_url: str,
+    access_token: AccessToken | None,
+    program_id: str | None = None,
+    event_id: str | None = None,
+    client_name: str | None = None,
+    skip: int | None = None,
+    limit: int | None = None,
+    extra_params: dict[str, str | int | list[str]] | None = None,
+    custom_headers: dict[str, str] | None = None,
+    circuit_breaker: CircuitBreaker | None = None,
+    rate_limiter: RateLimiter | None = None,
+    json_codec: JsonCodec | None = None,
+    validation: Literal["full", "trusted"] = "full",
+    deadline: float | None = None,
+) -> AsyncGenerator[Report, None]:
+    """Stream the reports from the VTN, validating each report as soon as its bytes arrive.
+
+    Unlike `get_reports`, the response is not read into memory before it is validated, so the
+    memory used is about one report instead of the whole list. Streamed requests are not retried.
+
+    Parameters
+    ----------
+    session : aiohttp.ClientSession
+        The aiohttp session to use for the request.
+    vtn_url : str
+        The URL of the VTN.
+    access_token : AccessToken | None
+        The access token to use for the request, use None if no token is required.
+    program_id : str | None
+        The program ID to filter the reports by.
+    event_id : str | None
+        The event ID to filter the reports by.
+    client_name : str | None
+        The client name to filter the reports by.
+    skip : int | None
+        The number of reports to skip (for pagination).
+    limit : int | None
+        The maximum number of reports to return.
+    extra_params : dict[str, str | int | list[str]] | None
+        Extra query parameters to include in the request.
+    custom_headers : dict[str, str] | None
+        Extra headers to include in the request.
+    circuit_breaker : CircuitBreaker | None
+        Circuit breaker guarding the VTN or None to always send requests.
+    rate_limiter : RateLimiter | None
+        Rate limiter for the requests to the VTN or None to not limit requests.
+    json_codec : JsonCodec | None
+        Codec used to decode error responses or None to use the fastest available codec.
+    validation : Literal["full", "trusted"]
+        "full" to check all constraints of the returned objects, "trusted" to skip the checks.
+    deadline : float | None
+        Absolute deadline in event loop time for the request and every read of the body, None
+        for no deadline.
+
+    Yields
+    ------
+    Report
+        The reports in the order returned by the VTN.
+
+    Raises
+    ------
+    ValueError
+        If the query parameters are invalid, or the response is not a list of valid reports.
+    toadr3.ToadrError
+        If the request to the VTN fails. Specifically, if the response status is 400, 403, or 500,
+    aiohttp.ClientError
+        If there is an unexpected error with the HTTP request to the VTN.
+    TimeoutError
+        If the request or a read of the body did not complete before the deadline.
+    """
+    args = {
+        "client_name": client_name,
+        "event_id": event_id,
+        "program_id": program_id,
+        "skip": skip,
+        "limit": limit,
+    }
+    _GET_PARAMS_BUILDER.check_query_parameters(args)
+    params = _GET_PARAMS_BUILDER.build_query_parameters(args, extra_params)
+
+    async for report in stream_query(
+        session,
+        f"{vtn_url}/reports",
+        access_token,
+        params,
+        custom_headers,
+        parser=model_parser(Report, validation),
+        circuit_breaker=circuit_breaker,
+        rate_limiter=rate_limiter,
+        json_codec=json_codec,
+        deadline=deadline,
+    ):
+        yield report
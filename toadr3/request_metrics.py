@@ -0,0 +1,235 @@
+import time
+from collections.abc import Awaitable, Callable
+from types import SimpleNamespace
+from urllib.parse import urlsplit
+
+import aiohttp
+
+from .rate_limiter import ENDPOINTS
+
+PHASES = ("queued", "dns", "connect", "waiting", "transfer", "validation", "total")
+"""Phases of a request, in the order they happen, with the total duration last."""
+
+
+class RequestTimings:
+    """Durations in seconds of the phases of a single request to the VTN.
+
+    Phases that did not happen, such as DNS resolution for a reused connection, are None.
+    The queued, dns and connect phases are only recorded if the session of the request uses
+    the trace config of the metrics.
+
+    Attributes
+    ----------
+    method : str
+        The HTTP method of the request.
+    endpoint : str
+        The endpoint of the request, e.g. "/events" or "/programs/{id}".
+    status : int | None
+        The status of the response or None if no response was received.
+    queued : float | None
+        Time spent waiting for a free connection in the connection pool.
+    dns : float | None
+        Time spent resolving the host name of the VTN.
+    connect : float | None
+        Time spent opening a new connection, including DNS resolution and the TLS handshake.
+    waiting : float | None
+        Time from sending the request until the response headers were received.
+    transfer : float | None
+        Time spent receiving the response body.
+    validation : float | None
+        Time spent parsing and validating the response body.
+    total : float | None
+        Time from starting the request until the result was ready.
+    """
+
+    __slots__ = (
+        "_marks",
+        "connect",
+        "dns",
+        "endpoint",
+        "method",
+        "queued",
+        "status",
+        "total",
+        "transfer",
+        "validation",
+        "waiting",
+    )
+
+    def __init__(self, method: str, endpoint: str) -> None:
+        self.method = method
+        self.endpoint = endpoint
+        self.status: int | None = None
+        self.queued: float | None = None
+        self.dns: float | None = None
+        self.connect: float | None = None
+        self.waiting: float | None = None
+        self.transfer: float | None = None
+        self.validation: float | None = None
+        self.total: float | None = None
+        self._marks: dict[str, float] = {"start": time.perf_counter()}
+
+    def mark(self, name: str) -> None:
+        """Record the current time under `name`."""
+        self._marks[name] = time.perf_counter()
+
+    def since(self, name: str) -> float | None:
+        """Return the time since the mark `name` or None if there is no such mark."""
+        mark = self._marks.get(name)
+        return None if mark is None else time.perf_counter() - mark
+
+    def response_received(self, status: int) -> None:
+        """Record that the response headers were received."""
+        self.status = status
+        self.waiting = self.since("sent") if "sent" in self._marks else self.since("start")
+        self.mark("headers")
+
+    def body_received(self) -> None:
+        """Record that the response body was received."""
+        self.transfer = self.since("headers")
+        self.mark("body")
+
+    def validated(self) -> None:
+        """Record that the response body was parsed and validated."""
+        self.validation = self.since("body")
+
+    def __repr__(self) -> str:
+        """Return a string representation of the timings."""
+        phases = ", ".join(
+            f"{phase}={value * 1000:.1f}ms"
+            for phase in PHASES
+            if (value := getattr(self, phase)) is not None
+        )
+        return f"RequestTimings({self.method} {self.endpoint} {self.status}: {phases})"
+
+
+class PhaseStats:
+    """Aggregated durations of one phase of the requests to an endpoint."""
+
+    __slots__ = ("count", "max", "sum")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def add(self, duration: float) -> None:
+        """Add the duration of one request."""
+        self.count += 1
+        self.sum += duration
+        self.max = max(self.max, duration)
+
+    @property
+    def mean(self) -> float:
+        """The mean duration in seconds, 0 if there are no durations."""
+        return self.sum / self.count if self.count else 0.0
+
+
+class RequestMetrics:
+    """Per-endpoint latency breakdown of the requests to a VTN.
+
+    Every request records a `RequestTimings`, which is passed to `on_request` and aggregated
+    per endpoint. To record the queued, dns and connect phases, the session must be created
+    with the trace config from `trace_config()`. `ToadrClient` does this when it creates its
+    own session.
+    """
+
+    def __init__(self, on_request: Callable[[RequestTimings], None] | None = None) -> None:
+        """Initialize the metrics.
+
+        Parameters
+        ----------
+        on_request : Callable[[RequestTimings], None] | None
+            Function called with the timings of every completed request.
+        """
+        self._on_request = on_request
+        self._stats: dict[str, dict[str, PhaseStats]] = {}
+
+    @property
+    def endpoints(self) -> list[str]:
+        """The endpoints with recorded requests, as "METHOD /endpoint"."""
+        return list(self._stats)
+
+    def stats(self, endpoint: str) -> dict[str, PhaseStats]:
+        """Get the aggregated phase durations of an endpoint.
+
+        Parameters
+        ----------
+        endpoint : str
+            The endpoint as "METHOD /endpoint", e.g. "GET /events".
+
+        Returns
+        -------
+        dict[str, PhaseStats]
+            The statistics of every phase that was recorded at least once.
+        """
+        return self._stats.get(endpoint, {})
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """Get the mean duration in seconds of every phase per endpoint."""
+        return {
+            endpoint: {phase: stats.mean for phase, stats in phases.items()}
+            for endpoint, phases in self._stats.items()
+        }
+
+    def clear(self) -> None:
+        """Forget all recorded requests."""
+        self._stats.clear()
+
+    def start(self, method: str, url: str) -> RequestTimings:
+        """Start recording the timings of a request."""
+        return RequestTimings(method, endpoint_name(url))
+
+    def record(self, timings: RequestTimings) -> None:
+        """Aggregate the timings of a completed request and pass them to the callback."""
+        timings.total = timings.since("start")
+        phases = self._stats.setdefault(f"{timings.method} {timings.endpoint}", {})
+        for phase in PHASES:
+            duration = getattr(timings, phase)
+            if duration is not None:
+                phases.setdefault(phase, PhaseStats()).add(duration)
+
+        if self._on_request is not None:
+            self._on_request(timings)
+
+    def trace_config(self) -> aiohttp.TraceConfig:
+        """Create a trace config that records the connection phases of requests."""
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_connection_queued_start.append(_mark("queued"))
+        trace_config.on_connection_queued_end.append(_measure("queued"))
+        trace_config.on_dns_resolvehost_start.append(_mark("dns"))
+        trace_config.on_dns_resolvehost_end.append(_measure("dns"))
+        trace_config.on_connection_create_start.append(_mark("connect"))
+        trace_config.on_connection_create_end.append(_measure("connect"))
+        trace_config.on_request_headers_sent.append(_mark("sent"))
+        return trace_config
+
+
+def endpoint_name(url: str) -> str:
+    """Get the endpoint of a VTN URL, with object IDs replaced by {id}."""
+    segments = [segment for segment in urlsplit(url).path.split("/") if segment]
+    for i in range(len(segments) - 1, -1, -1):
+        if segments[i] in ENDPOINTS:
+            return "/" + segments[i] + ("/{id}" if i < len(segments) - 1 else "")
+    return "/" + "/".join(segments)
+
+
+_TraceCallback = Callable[[aiohttp.ClientSession, SimpleNamespace, object], Awaitable[None]]
+
+
+def _mark(name: str) -> _TraceCallback:
+    async def callback(_session: aiohttp.ClientSession, ctx: SimpleNamespace, _: object) -> None:
+        timings = ctx.trace_request_ctx
+        if isinstance(timings, RequestTimings):
+            timings.mark(name)
+
+    return callback
+
+
+def _measure(phase: str) -> _TraceCallback:
+    async def callback(_session: aiohttp.ClientSession, ctx: SimpleNamespace, _: object) -> None:
+        timings = ctx.trace_request_ctx
+        if isinstance(timings, RequestTimings):
+            setattr(timings, phase, timings.since(phase))
+
+    return callback
@@ -0,0 +1,185 @@
+import functools
+import hashlib
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Mapping
+from typing import Any, TypeAlias
+
+CacheKey: TypeAlias = tuple[str, tuple[tuple[str, str], ...], tuple[tuple[str, str], ...], Hashable]
+
+
+class CacheEntry:
+    """Validated result of a GET request together with its cache validators."""
+
+    __slots__ = ("digest", "etag", "last_modified", "result")
+
+    def __init__(
+        self,
+        result: Any,  # noqa: ANN401
+        digest: bytes,
+        etag: str | None,
+        last_modified: str | None,
+    ) -> None:
+        self.result = result
+        self.digest = digest
+        self.etag = etag
+        self.last_modified = last_modified
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Headers that make the request conditional on the cached validators."""
+        headers: dict[str, str] = {}
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """Cache of validated GET responses based on HTTP conditional requests.
+
+    The cache stores the ETag and Last-Modified headers of every response and sends them as
+    If-None-Match and If-Modified-Since on the next identical request. If the VTN answers with
+    304 Not Modified, the previously validated result is returned without parsing anything.
+    If the VTN does not support validators, a hash of the response body is compared instead,
+    so an unchanged body is still not validated again.
+
+    Cached results are shared between calls and should not be modified. A cache should only
+    be used with a single set of credentials since the access token is not part of the key.
+    The parser is part of the key, so results of different validation modes are kept apart.
+    """
+
+    def __init__(self, max_entries: int = 128) -> None:
+        """Initialize the response cache.
+
+        Parameters
+        ----------
+        max_entries : int
+            The maximum number of responses to keep, the least recently used is evicted first.
+        """
+        if not isinstance(max_entries, int) or max_entries <= 0:
+            raise ValueError("max_entries must be a positive integer")
+
+        self._max_entries = max_entries
+        self._entries: OrderedDict[CacheKey, CacheEntry] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def max_entries(self) -> int:
+        """The maximum number of cached responses."""
+        return self._max_entries
+
+    @property
+    def hits(self) -> int:
+        """Number of responses served from the cache (304 or identical body)."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Number of responses that had to be parsed and validated."""
+        return self._misses
+
+    def __len__(self) -> int:
+        """Return the number of cached responses."""
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        self._entries.clear()
+
+    @staticmethod
+    def create_key(
+        url: str,
+        params: Mapping[str, str | int | list[str]] | None,
+        headers: Mapping[str, str] | None,
+        parser: Callable[[bytes], Any] | None = None,
+    ) -> CacheKey:
+        """Create a cache key from the request URL, query parameters, headers and parser.
+
+        The Authorization header is not part of the key. Partial functions are compared by
+        their function and arguments, so a parser created for every request still matches.
+        """
+        normalized_params: list[tuple[str, str]] = []
+        for name, value in (params or {}).items():
+            if isinstance(value, list):
+                normalized_params.extend((name, str(item)) for item in value)
+            else:
+                normalized_params.append((name, str(value)))
+
+        normalized_headers = [
+            (name.lower(), value)
+            for name, value in (headers or {}).items()
+            if name.lower() != "authorization"
+        ]
+        return (
+            url,
+            tuple(sorted(normalized_params)),
+            tuple(sorted(normalized_headers)),
+            _parser_key(parser),
+        )
+
+    def get(self, key: CacheKey) -> CacheEntry | None:
+        """Get the cached entry for a request, if any."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def not_modified(self, entry: CacheEntry) -> Any:  # noqa: ANN401
+        """Return the cached result for a 304 Not Modified response."""
+        self._hits += 1
+        return entry.result
+
+    def update(
+        self,
+        key: CacheKey,
+        entry: CacheEntry | None,
+        headers: Mapping[str, str],
+        body: bytes,
+        parser: Callable[[bytes], Any],
+    ) -> Any:  # noqa: ANN401
+        """Return the result for a response body and store it in the cache.
+
+        The body is only parsed if it differs from the body of the cached entry.
+
+        Parameters
+        ----------
+        key : CacheKey
+            The cache key of the request.
+        entry : CacheEntry | None
+            The entry that was cached when the request was made.
+        headers : Mapping[str, str]
+            The response headers.
+        body : bytes
+            The raw response body.
+        parser : Callable[[bytes], Any]
+            Function that converts the response body into the result.
+
+        Returns
+        -------
+        Any
+            The parsed result.
+        """
+        digest = hashlib.blake2b(body, digest_size=16).digest()
+        if entry is not None and entry.digest == digest:
+            self._hits += 1
+            result = entry.result
+        else:
+            self._misses += 1
+            result = parser(body)
+
+        self._entries[key] = CacheEntry(
+            result, digest, headers.get("ETag"), headers.get("Last-Modified")
+        )
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+        return result
+
+
+def _parser_key(parser: Callable[[bytes], Any] | None) -> Hashable:
+    """Get a hashable identity of a parser that is equal for equivalent partial functions."""
+    if isinstance(parser, functools.partial):
+        return _parser_key(parser.func), parser.args, tuple(sorted(parser.keywords.items()))
+    return parser
@@ -0,0 +1,177 @@
+import datetime
+import email.utils
+import random
+from collections.abc import Collection, Mapping
+
+import aiohttp
+
+from .exceptions import CircuitOpenError, ToadrError
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+"""HTTP methods that are retried by default."""
+
+RETRY_AFTER_STATUSES = frozenset({429, 503})
+"""Statuses where the Retry-After header of the response is honored."""
+
+
+class RetryPolicy:
+    """Policy deciding if and when a failed request to the VTN is retried.
+
+    Requests that fail with a retryable status code or a connection error are retried with
+    exponential backoff and decorrelated jitter, so that clients that failed at the same time
+    do not retry at the same time. If the VTN responds with 429 or 503 and a Retry-After
+    header, the delay from the header is used instead.
+
+    Only idempotent methods are retried. POST requests are retried only if they include the
+    idempotency key header, which lets the VTN detect duplicates.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 0.1,
+        max_delay: float = 10.0,
+        deadline: float | None = 30.0,
+        retry_statuses: Collection[int] = (429, 500, 502, 503, 504),
+        idempotency_key_header: str = "Idempotency-Key",
+    ) -> None:
+        """Initialize the retry policy.
+
+        Parameters
+        ----------
+        max_attempts : int
+            The maximum number of attempts, including the first one.
+        base_delay : float
+            The minimum delay in seconds before a retry.
+        max_delay : float
+            The maximum delay in seconds before a retry.
+        deadline : float | None
+            The maximum time in seconds from the first attempt until the last retry is started,
+            or None for no limit.
+        retry_statuses : Collection[int]
+            HTTP status codes that are retried.
+        idempotency_key_header : str
+            Header that makes a POST request retryable when present.
+        """
+        if not isinstance(max_attempts, int) or max_attempts < 1:
+            raise ValueError("max_attempts must be a positive integer")
+
+        if base_delay < 0 or max_delay < base_delay:
+            raise ValueError("base_delay must be positive and not larger than max_delay")
+
+        if deadline is not None and deadline <= 0:
+            raise ValueError("deadline must be a positive number or None")
+
+        self._max_attempts = max_attempts
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._deadline = deadline
+        self._retry_statuses = frozenset(retry_statuses)
+        self._idempotency_key_header = idempotency_key_header.lower()
+
+    @property
+    def max_attempts(self) -> int:
+        """The maximum number of attempts, including the first one."""
+        return self._max_attempts
+
+    @property
+    def deadline(self) -> float | None:
+        """The maximum time in seconds spent on retrying a request."""
+        return self._deadline
+
+    def is_retryable_request(self, method: str, headers: Mapping[str, str]) -> bool:
+        """Check if a request with the given method and headers can be retried."""
+        if method.upper() in IDEMPOTENT_METHODS:
+            return True
+
+        return method.upper() == "POST" and any(
+            name.lower() == self._idempotency_key_header for name in headers
+        )
+
+    def is_retryable_error(self, error: BaseException) -> bool:
+        """Check if the error of a failed attempt can be retried.
+
+        Requests rejected by an open circuit breaker are not retried, so they fail fast.
+        """
+        if isinstance(error, CircuitOpenError):
+            return False
+        if isinstance(error, ToadrError):
+            return error.status_code in self._retry_statuses
+        return isinstance(error, (aiohttp.ClientConnectionError, TimeoutError))
+
+    def backoff(self, previous_delay: float | None) -> float:
+        """Return the delay before the next attempt using decorrelated jitter.
+
+        Parameters
+        ----------
+        previous_delay : float | None
+            The delay before the previous attempt or None if this is the first retry.
+        """
+        if previous_delay is None:
+            previous_delay = self._base_delay
+        upper = max(self._base_delay, previous_delay * 3)
+        return min(self._max_delay, random.uniform(self._base_delay, upper))  # noqa: S311
+
+    def retry_delay(
+        self,
+        error: BaseException,
+        attempt: int,
+        elapsed: float,
+        previous_delay: float | None,
+    ) -> float | None:
+        """Return the delay before the next attempt or None if the request should not be retried.
+
+        Parameters
+        ----------
+        error : BaseException
+            The error raised by the failed attempt.
+        attempt : int
+            The number of attempts made so far.
+        elapsed : float
+            The time in seconds since the first attempt was started.
+        previous_delay : float | None
+            The delay before the previous attempt or None if this is the first retry.
+        """
+        if attempt >= self._max_attempts or not self.is_retryable_error(error):
+            return None
+
+        delay = self.backoff(previous_delay)
+        if isinstance(error, ToadrError) and error.status_code in RETRY_AFTER_STATUSES:
+            retry_after = parse_retry_after(error.headers.get("Retry-After"))
+            if retry_after is not None:
+                delay = retry_after
+
+        if self._deadline is not None and elapsed + delay > self._deadline:
+            return None
+        return delay
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse the value of a Retry-After header into a delay in seconds.
+
+    Parameters
+    ----------
+    value : str | None
+        Either a number of seconds or an HTTP date.
+
+    Returns
+    -------
+    float | None
+        The delay in seconds or None if the value is missing or invalid.
+    """
+    if value is None:
+        return None
+
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=datetime.UTC)
+    delay = (retry_at - datetime.datetime.now(tz=datetime.UTC)).total_seconds()
+    return max(delay, 0.0)
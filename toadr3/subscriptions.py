@@ -1,23 +1,37 @@
+from collections.abc import AsyncGenerator
+
 import aiohttp
 
 from toadr3 import AccessToken
+from toadr3.circuit_breaker import CircuitBreaker
+from toadr3.compression import RequestCompression
+from toadr3.hedge_policy import HedgePolicy
+from toadr3.json_codec import JsonCodec
 from toadr3.models import ObjectType, Subscription, TargetType
+from toadr3.rate_limiter import RateLimiter
+from toadr3.request_metrics import RequestMetrics
+from toadr3.response_cache import ResponseCache
+from toadr3.retry_policy import RetryPolicy
 
 from ._internal import (
+    DEFAULT_PAGE_SIZE,
     ClientName,
+    ListAdapter,
     Objects,
     ParameterBuilder,
     ProgramID,
     SkipAndLimit,
     SubscriptionID,
     Targets,
-    default_error_handler,
     delete_query,
     get_query,
+    paginate,
+    post_query,
     put_query,
 )
 
 _GET_PARAMS_BUILDER = ParameterBuilder(ProgramID, ClientName, Targets, Objects, SkipAndLimit)
+_SUBSCRIPTIONS_ADAPTER = ListAdapter(Subscription)
 _GET_BY_ID_PARAMS_BUILDER = ParameterBuilder(SubscriptionID)
 
 
@@ -34,6 +48,13 @@ async def get_subscriptions(
     limit: int | None = None,
     extra_params: dict[str, str | int | list[str]] | None = None,
     custom_headers: dict[str, str] | None = None,
+    cache: ResponseCache | None = None,
+    retry_policy: RetryPolicy | None = None,
+    circuit_breaker: CircuitBreaker | None = None,
+    rate_limiter: RateLimiter | None = None,
+    json_codec: JsonCodec | None = None,
+    metrics: RequestMetrics | None = None,
+    deadline: float | None = None,
 ) -> list[Subscription]:
     """List all subscriptions.
 
@@ -67,6 +88,20 @@ async def get_subscriptions(
         Extra query parameters to include in the request.
     custom_headers: dict[str, str] | None
         Extra headers to include in the request.
+    cache: ResponseCache | None
+        Cache used to make the request conditional and reuse unchanged results.
+    retry_policy : RetryPolicy | None
+        Policy for retrying failed requests or None to not retry.
+    circuit_breaker : CircuitBreaker | None
+        Circuit breaker guarding the VTN or None to always send requests.
+    rate_limiter : RateLimiter | None
+        Rate limiter for the requests to the VTN or None to not limit requests.
+    json_codec : JsonCodec | None
+        Codec used to decode JSON responses or None to use the fastest available codec.
+    metrics : RequestMetrics | None
+        Metrics recording the latency breakdown of requests or None to not record them.
+    deadline : float | None
+        Absolute deadline in event loop time for the request and its retries, None for no deadline.
 
     Returns
     -------
@@ -82,6 +117,8 @@ async def get_subscriptions(
     aiohttp.ClientError
         If there is an unexpected error with the HTTP request to the VTN.
 
+    TimeoutError
+        If the request did not complete before the deadline.
     """
     args = {
         "client_name": client_name,
@@ -95,17 +132,132 @@ async def get_subscriptions(
     _GET_PARAMS_BUILDER.check_query_parameters(args)
     params = _GET_PARAMS_BUILDER.build_query_parameters(args, extra_params)
 
-    data = await get_query(
-        session, f"{vtn_url}/subscriptions", access_token, params, custom_headers
+    result: list[Subscription] = await get_query(
+        session,
+        f"{vtn_url}/subscriptions",
+        access_token,
+        params,
+        custom_headers,
+        parser=_SUBSCRIPTIONS_ADAPTER.validate_json,
+        cache=cache,
+        retry_policy=retry_policy,
+        circuit_breaker=circuit_breaker,
+        rate_limiter=rate_limiter,
+        json_codec=json_codec,
+        metrics=metrics,
+        deadline=deadline,
     )
+    return result
 
-    if not isinstance(data, list):
-        raise ValueError(f"Expected result to be a list. Got {type(data)} instead.")
 
-    result = []
-    for subscription in data:
-        result.append(Subscription.model_validate(subscription))
-    return result
+async def iter_subscriptions(
+    session: aiohttp.ClientSession,
+    vtn_url: str,
+    access_token: AccessToken | None,
+    program_id: str | None = None,
+    client_name: str | None = None,
+    target_type: TargetType | str | None = None,
+    target_values: list[str] | None = None,
+    objects: list[str] | list[ObjectType] | None = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    max_concurrency: int = 1,
+    extra_params: dict[str, str | int | list[str]] | None = None,
+    custom_headers: dict[str, str] | None = None,
+    retry_policy: RetryPolicy | None = None,
+    circuit_breaker: CircuitBreaker | None = None,
+    rate_limiter: RateLimiter | None = None,
+    json_codec: JsonCodec | None = None,
+    metrics: RequestMetrics | None = None,
+    deadline: float | None = None,
+) -> AsyncGenerator[Subscription, None]:
+    """Iterate over all subscriptions from the VTN.
+
+    The subscriptions are requested page by page using skip and limit. Up to `max_concurrency` pages
+    are requested ahead of the page being consumed, and no new pages are requested once a page with
+    fewer than `page_size` subscriptions has been returned. Subscriptions with an ID that has
+    already been yielded are skipped.
+
+    Parameters
+    ----------
+    session : aiohttp.ClientSession
+        The aiohttp session to use for the request.
+    vtn_url : str
+        The URL of the VTN.
+    access_token : AccessToken | None
+        The access token to use for the request, use None if no token is required.
+    program_id : str | None
+        The program ID to filter the subscriptions by.
+    client_name : str | None
+        The client name to filter the subscriptions by.
+    target_type : TargetType | str | None
+        The target type to filter the subscriptions by.
+    target_values : list[str] | None
+        The target values to filter the subscriptions by (names of the target type).
+    objects : list[str] | list[ObjectType] | None
+        The object types to filter the subscriptions by.
+    page_size : int
+        The number of subscriptions to request per page.
+    max_concurrency : int
+        The maximum number of pages to request concurrently.
+    extra_params : dict[str, str | int | list[str]] | None
+        Extra query parameters to include in the request.
+    custom_headers : dict[str, str] | None
+        Extra headers to include in the request.
+    retry_policy : RetryPolicy | None
+        Policy for retrying failed requests or None to not retry.
+    circuit_breaker : CircuitBreaker | None
+        Circuit breaker guarding the VTN or None to always send requests.
+    rate_limiter : RateLimiter | None
+        Rate limiter for the requests to the VTN or None to not limit requests.
+    json_codec : JsonCodec | None
+        Codec used to decode JSON responses or None to use the fastest available codec.
+    metrics : RequestMetrics | None
+        Metrics recording the latency breakdown of requests or None to not record them.
+    deadline : float | None
+        Absolute deadline in event loop time for the requests of all pages and their retries, None
+        for no deadline.
+
+    Yields
+    ------
+    Subscription
+        The subscriptions in the order returned by the VTN.
+
+    Raises
+    ------
+    ValueError
+        If the query parameters are invalid.
+    toadr3.ToadrError
+        If the request to the VTN fails. Specifically, if the response status is 400, 403, or 500,
+    aiohttp.ClientError
+        If there is an unexpected error with the HTTP request to the VTN.
+    TimeoutError
+        If the iteration did not complete before the deadline.
+    """
+
+    async def fetch_page(skip: int, limit: int) -> list[Subscription]:
+        return await get_subscriptions(
+            session,
+            vtn_url,
+            access_token,
+            program_id=program_id,
+            client_name=client_name,
+            target_type=target_type,
+            target_values=target_values,
+            objects=objects,
+            skip=skip,
+            limit=limit,
+            extra_params=extra_params,
+            custom_headers=custom_headers,
+            retry_policy=retry_policy,
+            circuit_breaker=circuit_breaker,
+            rate_limiter=rate_limiter,
+            json_codec=json_codec,
+            metrics=metrics,
+            deadline=deadline,
+        )
+
+    async for subscription in paginate(fetch_page, page_size, max_concurrency):
+        yield subscription
 
 
 async def post_subscription(
@@ -114,6 +266,13 @@ async def post_subscription(
     access_token: AccessToken | None,
     subscription: Subscription,
     custom_headers: dict[str, str] | None = None,
+    retry_policy: RetryPolicy | None = None,
+    circuit_breaker: CircuitBreaker | None = None,
+    rate_limiter: RateLimiter | None = None,
+    compression: RequestCompression | None = None,
+    json_codec: JsonCodec | None = None,
+    metrics: RequestMetrics | None = None,
+    deadline: float | None = None,
 ) -> Subscription:
     """Create a new subscription.
 
@@ -129,6 +288,20 @@ async def post_subscription(
         The subscription to create.
     custom_headers: dict[str, str] | None
         Extra headers to include in the request.
+    retry_policy: RetryPolicy | None
+        Policy for retrying failed requests or None to not retry.
+    circuit_breaker: CircuitBreaker | None
+        Circuit breaker guarding the VTN or None to always send requests.
+    rate_limiter: RateLimiter | None
+        Rate limiter for the requests to the VTN or None to not limit requests.
+    compression: RequestCompression | None
+        Compression of the request body or None to send it uncompressed.
+    json_codec: JsonCodec | None
+        Codec used to decode JSON responses or None to use the fastest available codec.
+    metrics: RequestMetrics | None
+        Metrics recording the latency breakdown of requests or None to not record them.
+    deadline : float | None
+        Absolute deadline in event loop time for the request and its retries, None for no deadline.
 
     Returns
     -------
@@ -144,6 +317,8 @@ async def post_subscription(
     aiohttp.ClientError
         If there is an unexpected error with the HTTP request to the VTN.
 
+    TimeoutError
+        If the request did not complete before the deadline.
     """
     if subscription is None:
         raise ValueError("subscription is required")
@@ -151,25 +326,26 @@ async def post_subscription(
     headers: dict[str, str] = {}
     if custom_headers is not None:
         headers |= custom_headers
-
-    if access_token is not None:
-        headers["Authorization"] = f"Bearer {access_token.token}"
-
-    vtn_url = vtn_url.rstrip("/")
-
-    data = subscription.model_dump_json(exclude_none=True, exclude_unset=True)
     headers["Content-Type"] = "application/json"
 
-    async with session.post(f"{vtn_url}/subscriptions", headers=headers, data=data) as response:
-        if not response.ok:
-            match response.status:
-                case 400 | 403 | 409 | 500:
-                    await default_error_handler(response)
-                case _:
-                    await default_error_handler(response, "Unexpected error status!")
+    data = subscription.model_dump_json(exclude_none=True, exclude_unset=True)
 
-        data = await response.json()
-        return Subscription.model_validate(data)
+    result = await post_query(
+        session,
+        f"{vtn_url.rstrip('/')}/subscriptions",
+        access_token,
+        data,
+        custom_headers=headers,
+        accept_409=True,
+        retry_policy=retry_policy,
+        circuit_breaker=circuit_breaker,
+        rate_limiter=rate_limiter,
+        compression=compression,
+        json_codec=json_codec,
+        metrics=metrics,
+        deadline=deadline,
+    )
+    return Subscription.model_validate(result)
 
 
 async def get_subscription_by_id(
@@ -178,6 +354,14 @@ async def get_subscription_by_id(
     access_token: AccessToken | None,
     subscription_id: str,
     custom_headers: dict[str, str] | None = None,
+    cache: ResponseCache | None = None,
+    retry_policy: RetryPolicy | None = None,
+    circuit_breaker: CircuitBreaker | None = None,
+    rate_limiter: RateLimiter | None = None,
+    json_codec: JsonCodec | None = None,
+    metrics: RequestMetrics | None = None,
+    hedge_policy: HedgePolicy | None = None,
+    deadline: float | None = None,
 ) -> Subscription:
     """Get a subscription by ID.
 
@@ -193,6 +377,22 @@ async def get_subscription_by_id(
         The subscription ID to search for.
     custom_headers : dict[str, str] | None
         Extra headers to include in the request.
+    cache : ResponseCache | None
+        Cache used to make the request conditional and reuse unchanged results.
+    retry_policy : RetryPolicy | None
+        Policy for retrying failed requests or None to not retry.
+    circuit_breaker : CircuitBreaker | None
+        Circuit breaker guarding the VTN or None to always send requests.
+    rate_limiter : RateLimiter | None
+        Rate limiter for the requests to the VTN or None to not limit requests.
+    json_codec : JsonCodec | None
+        Codec used to decode JSON responses or None to use the fastest available codec.
+    metrics : RequestMetrics | None
+        Metrics recording the latency breakdown of requests or None to not record them.
+    hedge_policy : HedgePolicy | None
+        Policy for hedging slow GET requests or None to not hedge them.
+    deadline : float | None
+        Absolute deadline in event loop time for the request and its retries, None for no deadline.
 
     Returns
     -------
@@ -207,18 +407,28 @@ async def get_subscription_by_id(
         If the request to the VTN fails. Specifically, response status 400, 403, 404, or 500,
     aiohttp.ClientError
         If there is an unexpected error with the HTTP request to the VTN.
+    TimeoutError
+        If the request did not complete before the deadline.
     """
     _GET_BY_ID_PARAMS_BUILDER.check_query_parameters({"subscription_id": subscription_id})
 
-    data = await get_query(
+    result: Subscription = await get_query(
         session,
         f"{vtn_url}/subscriptions/{subscription_id}",
         access_token,
         custom_headers=custom_headers,
         accept_404=True,
+        parser=Subscription.model_validate_json,
+        cache=cache,
+        retry_policy=retry_policy,
+        circuit_breaker=circuit_breaker,
+        rate_limiter=rate_limiter,
+        json_codec=json_codec,
+        metrics=metrics,
+        hedge_policy=hedge_policy,
+        deadline=deadline,
     )
-
-    return Subscription.model_validate(data)
+    return result
 
 
 async def delete_subscription_by_id(
@@ -227,6 +437,12 @@ async def delete_subscription_by_id(
     access_token: AccessToken | None,
     subscription_id: str,
     custom_headers: dict[str, str] | None = None,
+    retry_policy: RetryPolicy | None = None,
+    circuit_breaker: CircuitBreaker | None = None,
+    rate_limiter: RateLimiter | None = None,
+    json_codec: JsonCodec | None = None,
+    metrics: RequestMetrics | None = None,
+    deadline: float | None = None,
 ) -> Subscription:
     """Delete a subscription by ID.
 
@@ -242,6 +458,18 @@ async def delete_subscription_by_id(
         The subscription ID to search for.
     custom_headers : dict[str, str] | None
         Extra headers to include in the request.
+    retry_policy : RetryPolicy | None
+        Policy for retrying failed requests or None to not retry.
+    circuit_breaker : CircuitBreaker | None
+        Circuit breaker guarding the VTN or None to always send requests.
+    rate_limiter : RateLimiter | None
+        Rate limiter for the requests to the VTN or None to not limit requests.
+    json_codec : JsonCodec | None
+        Codec used to decode JSON responses or None to use the fastest available codec.
+    metrics : RequestMetrics | None
+        Metrics recording the latency breakdown of requests or None to not record them.
+    deadline : float | None
+        Absolute deadline in event loop time for the request and its retries, None for no deadline.
 
     Returns
     -------
@@ -256,6 +484,8 @@ async def delete_subscription_by_id(
         If the request to the VTN fails. Specifically, response status 400, 403, 404, or 500,
     aiohttp.ClientError
         If there is an unexpected error with the HTTP request to the VTN.
+    TimeoutError
+        If the request did not complete before the deadline.
     """
     _GET_BY_ID_PARAMS_BUILDER.check_query_parameters({"subscription_id": subscription_id})
 
@@ -265,6 +495,12 @@ async def delete_subscription_by_id(
         access_token,
         custom_headers=custom_headers,
         accept_404=True,
+        retry_policy=retry_policy,
+        circuit_breaker=circuit_breaker,
+        rate_limiter=rate_limiter,
+        json_codec=json_codec,
+        metrics=metrics,
+        deadline=deadline,
     )
 
     return Subscription.model_validate(data)
@@ -277,6 +513,13 @@ async def put_subscription_by_id(
     subscription_id: str,
     subscription: Subscription,
     custom_headers: dict[str, str] | None = None,
+    retry_policy: RetryPolicy | None = None,
+    circuit_breaker: CircuitBreaker | None = None,
+    rate_limiter: RateLimiter | None = None,
+    compression: RequestCompression | None = None,
+    json_codec: JsonCodec | None = None,
+    metrics: RequestMetrics | None = None,
+    deadline: float | None = None,
 ) -> Subscription:
     """Update a subscription by ID.
 
@@ -294,6 +537,20 @@ async def put_subscription_by_id(
         The subscription object with updated values.
     custom_headers : dict[str, str] | None
         Extra headers to include in the request.
+    retry_policy : RetryPolicy | None
+        Policy for retrying failed requests or None to not retry.
+    circuit_breaker : CircuitBreaker | None
+        Circuit breaker guarding the VTN or None to always send requests.
+    rate_limiter : RateLimiter | None
+        Rate limiter for the requests to the VTN or None to not limit requests.
+    compression : RequestCompression | None
+        Compression of the request body or None to send it uncompressed.
+    json_codec : JsonCodec | None
+        Codec used to decode JSON responses or None to use the fastest available codec.
+    metrics : RequestMetrics | None
+        Metrics recording the latency breakdown of requests or None to not record them.
+    deadline : float | None
+        Absolute deadline in event loop time for the request and its retries, None for no deadline.
 
     Returns
     -------
@@ -308,6 +565,8 @@ async def put_subscription_by_id(
         If the request to the VTN fails. Specifically, response status 400, 403, 404, or 500,
     aiohttp.ClientError
         If there is an unexpected error with the HTTP request to the VTN.
+    TimeoutError
+        If the request did not complete before the deadline.
     """
     _GET_BY_ID_PARAMS_BUILDER.check_query_parameters({"subscription_id": subscription_id})
 
@@ -327,6 +586,13 @@ async def put_subscription_by_id(
         body=data,
         custom_headers=custom_headers,
         accept_404=True,
+        retry_policy=retry_policy,
+        circuit_breaker=circuit_breaker,
+        rate_limiter=rate_limiter,
+        compression=compression,
+        json_codec=json_codec,
+        metrics=metrics,
+        deadline=deadline,
     )
 
     return Subscription.model_validate(data)
@@ -0,0 +1,245 @@
+import asyncio
+import functools
+import hashlib
+import json
+import os
+import pathlib
+import tempfile
+import time
+from collections.abc import Awaitable, Callable, Hashable
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None  # type: ignore[assignment]
+
+from ._internal import SingleFlight, freeze
+from .access_token import AccessToken, OAuthConfig
+
+_LOCK_POLL_INTERVAL = 0.01
+
+
+class TokenCache:
+    """Cache of access tokens shared by clients with the same OAuth configuration.
+
+    Tokens are keyed by the token URL, client ID, grant type and claims of the configuration,
+    so clients with identical configurations use the same token, and concurrent fetches of a
+    token for the same configuration share one request. Expired tokens are evicted whenever
+    a new token is stored.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty token cache."""
+        self._tokens: dict[Hashable, AccessToken] = {}
+        self._flight = SingleFlight()
+
+    def __len__(self) -> int:
+        """Return the number of cached tokens."""
+        return len(self._tokens)
+
+    @staticmethod
+    def key(config: OAuthConfig) -> Hashable:
+        """Get the key of the token of an OAuth configuration."""
+        return (config.url, config.client_id, config.grant_type, freeze(config.claims))
+
+    def get_cached(self, config: OAuthConfig) -> AccessToken | None:
+        """Get the cached token of a configuration, or None if there is no valid token."""
+        token = self._tokens.get(self.key(config))
+        if token is None or token.is_expired():
+            return None
+        return token
+
+    async def get(
+        self,
+        config: OAuthConfig,
+        fetch: Callable[[], Awaitable[AccessToken]],
+        stale: AccessToken | None = None,
+    ) -> AccessToken:
+        """Get the token of a configuration, fetching a new token if needed.
+
+        Parameters
+        ----------
+        config : OAuthConfig
+            The OAuth configuration of the token.
+        fetch : Callable[[], Awaitable[AccessToken]]
+            Function fetching a new token from the token provider.
+        stale : AccessToken | None
+            Token that should be replaced even if it is still valid, for example because it is
+            about to be refreshed or was rejected. A different cached token is still used.
+
+        Returns
+        -------
+        AccessToken
+            The cached or newly fetched token.
+        """
+        key = self.key(config)
+        token = self._tokens.get(key)
+        if token is not None and token is not stale and not token.is_expired():
+            return token
+
+        async def fetch_and_store() -> AccessToken:
+            token = await self._fetch(config, fetch, stale)
+            self._evict_expired()
+            self._tokens[key] = token
+            return token
+
+        return await self._flight.do(key, fetch_and_store)
+
+    async def _fetch(
+        self,
+        config: OAuthConfig,  # noqa: ARG002
+        fetch: Callable[[], Awaitable[AccessToken]],
+        stale: AccessToken | None,  # noqa: ARG002
+    ) -> AccessToken:
+        """Get a new token for a configuration that is not in the cache, or is stale."""
+        return await fetch()
+
+    async def invalidate(self, config: OAuthConfig, token: AccessToken | None = None) -> None:
+        """Remove the token of a configuration from the cache.
+
+        Parameters
+        ----------
+        config : OAuthConfig
+            The OAuth configuration of the token.
+        token : AccessToken | None
+            Only remove the cached token if it is this token, None to remove any token.
+        """
+        key = self.key(config)
+        if token is None or self._tokens.get(key) is token:
+            _ = self._tokens.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all tokens from the cache."""
+        self._tokens.clear()
+
+    def _evict_expired(self) -> None:
+        """Remove the expired tokens from the cache."""
+        for key, token in list(self._tokens.items()):
+            if token.is_expired():
+                del self._tokens[key]
+
+
+class FileTokenCache(TokenCache):
+    """Token cache that also shares tokens between processes through files in a directory.
+
+    Each configuration has its own file, with the token and the absolute time when it expires.
+    When a process needs a new token it takes an advisory lock on the file, so only one process
+    fetches a token while the others wait and then read it. Files are replaced atomically and are
+    only readable by the owner. Requires `fcntl`, which is available on POSIX systems.
+    """
+
+    def __init__(self, directory: str | os.PathLike[str]) -> None:
+        """Initialize the token cache.
+
+        Parameters
+        ----------
+        directory : str | os.PathLike[str]
+            The directory of the token files, created if it does not exist.
+
+        Raises
+        ------
+        RuntimeError
+            If file locking is not supported on this platform.
+        """
+        if fcntl is None:  # pragma: no cover
+            raise RuntimeError("FileTokenCache requires fcntl, which is not available")
+
+        super().__init__()
+        self._directory = pathlib.Path(directory)
+        self._directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+
+    @property
+    def directory(self) -> pathlib.Path:
+        """The directory of the token files."""
+        return self._directory
+
+    def path(self, config: OAuthConfig) -> pathlib.Path:
+        """Get the path of the token file of a configuration."""
+        digest = hashlib.sha256(repr(self.key(config)).encode()).hexdigest()
+        return self._directory / f"{digest}.json"
+
+    async def invalidate(self, config: OAuthConfig, token: AccessToken | None = None) -> None:
+        """Remove the token of a configuration from the cache and its file.
+
+        The file is read and removed in a thread, so the event loop is not blocked.
+
+        Parameters
+        ----------
+        config : OAuthConfig
+            The OAuth configuration of the token.
+        token : AccessToken | None
+            Only remove the token if it is this token, None to remove any token.
+        """
+        await super().invalidate(config, token)
+        await asyncio.to_thread(_remove_token, self.path(config), config.expiry_skew, token)
+
+    async def _fetch(
+        self,
+        config: OAuthConfig,
+        fetch: Callable[[], Awaitable[AccessToken]],
+        stale: AccessToken | None,
+    ) -> AccessToken:
+        """Get the token from the file, or fetch and store a new token while holding the lock."""
+        path = self.path(config)
+        fd = os.open(path.with_suffix(".lock"), os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            # poll instead of blocking a thread, so waiting processes do not exhaust the executor
+            while True:
+                try:
+                    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    break
+                except BlockingIOError:
+                    await asyncio.sleep(_LOCK_POLL_INTERVAL)
+
+            token = await asyncio.to_thread(_read_token, path, config.expiry_skew)
+            if (
+                token is not None
+                and not token.is_expired()
+                and (stale is None or token.token != stale.token)
+            ):
+                return token
+
+            token = await fetch()
+            await asyncio.to_thread(_write_token, path, token)
+            return token
+        finally:
+            # closing the file releases the lock
+            os.close(fd)
+
+
+def _read_token(path: pathlib.Path, skew: float) -> AccessToken | None:
+    """Read a token file, None if it does not exist or is invalid."""
+    try:
+        data = json.loads(path.read_bytes())
+        expires_in = int(data["expires_at"] - time.time())
+        return AccessToken(data["access_token"], expires_in, skew)
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _remove_token(path: pathlib.Path, skew: float, token: AccessToken | None) -> None:
+    """Remove a token file if it holds the token, or any token if it is None."""
+    stored = _read_token(path, skew)
+    if stored is not None and (token is None or stored.token == token.token):
+        path.unlink(missing_ok=True)
+
+
+def _write_token(path: pathlib.Path, token: AccessToken) -> None:
+    """Write a token file atomically."""
+    data = {"access_token": token.token, "expires_at": token.expires_at.timestamp()}
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.stem, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f)
+            f.flush()
+            os.fsync(f.fileno())
+        _ = pathlib.Path(tmp).replace(path)
+    except BaseException:
+        pathlib.Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+@functools.cache
+def shared_token_cache() -> TokenCache:
+    """Get the token cache shared by all clients in the process that opt in to it."""
+    return TokenCache()
@@ -0,0 +1,84 @@
+import random
+from collections.abc import Callable
+
+
+class TokenRefreshPolicy:
+    """Policy for refreshing the access token in the background before it expires.
+
+    The token is refreshed after a fraction of its lifetime, with random jitter so that clients
+    started at the same time do not refresh at the same time. Requests keep using the current
+    token until the new one has arrived. Failed refreshes are retried with exponential backoff
+    and full jitter.
+    """
+
+    def __init__(
+        self,
+        refresh_ratio: float = 0.75,
+        jitter: float = 0.1,
+        base_delay: float = 1.0,
+        max_delay: float = 60.0,
+        on_error: Callable[[BaseException], None] | None = None,
+    ) -> None:
+        """Initialize the token refresh policy.
+
+        Parameters
+        ----------
+        refresh_ratio : float
+            The fraction of the lifetime of the token after which it is refreshed.
+        jitter : float
+            The maximum random deviation from `refresh_ratio`, as a fraction of the lifetime.
+        base_delay : float
+            The delay in seconds before the first retry of a failed refresh.
+        max_delay : float
+            The maximum delay in seconds between retries of a failed refresh.
+        on_error : Callable[[BaseException], None] | None
+            Function called with the error of every failed refresh.
+        """
+        if not 0 < refresh_ratio < 1:
+            raise ValueError("refresh_ratio must be between 0 and 1")
+
+        if not 0 <= jitter < min(refresh_ratio, 1 - refresh_ratio):
+            raise ValueError("jitter must be non-negative and keep the refresh within the lifetime")
+
+        if base_delay <= 0 or max_delay < base_delay:
+            raise ValueError("base_delay must be positive and not larger than max_delay")
+
+        self._refresh_ratio = refresh_ratio
+        self._jitter = jitter
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._on_error = on_error
+
+    @property
+    def refresh_ratio(self) -> float:
+        """The fraction of the lifetime of the token after which it is refreshed."""
+        return self._refresh_ratio
+
+    def refresh_delay(self, lifetime: float) -> float:
+        """Return the delay in seconds before a token is refreshed.
+
+        Parameters
+        ----------
+        lifetime : float
+            The time in seconds from now until the token is considered expired.
+        """
+        ratio = random.uniform(  # noqa: S311
+            self._refresh_ratio - self._jitter, self._refresh_ratio + self._jitter
+        )
+        return max(lifetime * ratio, 0.0)
+
+    def retry_delay(self, attempt: int) -> float:
+        """Return the delay in seconds before retrying a failed refresh.
+
+        Parameters
+        ----------
+        attempt : int
+            The number of failed refreshes in a row.
+        """
+        delay = min(self._base_delay * 2 ** (attempt - 1), self._max_delay)
+        return random.uniform(self._base_delay, delay)  # noqa: S311
+
+    def failed(self, error: BaseException) -> None:
+        """Report a failed refresh to the error callback."""
+        if self._on_error is not None:
+            self._on_error(error)